@@ -3,6 +3,7 @@ import pygame
 import sys
 import copy
 from HexBoard import Grid
+from topology import EmptyCells
 from Buttons import Button
 
 class Game:
@@ -16,6 +17,8 @@ class Game:
         self.NUM_ROWS = 11
         self.NUM_COLS = 11
         self.grid = Grid(self.NUM_ROWS, self.NUM_COLS, self.tileSize)
+        # gemeinsame, pro Brettgröße nur einmal berechnete Nachbarschafts- und Randtabellen
+        self.topology = self.grid.topology
         self.num_emptyTiles = self.NUM_ROWS * self.NUM_COLS
         self.emptyColour = (70, 70, 70)
         self.playerColours = {
@@ -27,6 +30,13 @@ class Game:
         for tile in self.hexTiles():
             tile.colour = self.emptyColour
         self.matrix = matrix or [[self.__class__.EMPTY for _ in range(self.NUM_COLS)] for _ in range(self.NUM_ROWS)]
+        # Indexierbare Menge der freien Felder, wird von placeStone mitgeführt
+        occupied = 0
+        for y in range(self.NUM_ROWS):
+            for x in range(self.NUM_COLS):
+                if self.matrix[y][x] != self.__class__.EMPTY:
+                    occupied |= 1 << self.topology.index[(x, y)]
+        self.emptyCells = EmptyCells(self.topology, occupied)
         self.text = "Red's turn"
         self.solution = None
         self.quitButton = None
@@ -57,18 +67,35 @@ class Game:
                 nearestTile = tile
         return nearestTile
 
+    def placeStone(self, x, y):
+        """
+        Setzt einen Stein des aktuellen Spielers auf (x, y) und aktualisiert Matrix,
+        Tile-Farbe, Anzahl und Menge der freien Felder.
+        """
+        self.matrix[y][x] = self.current_player.upper()[0]
+        self.num_emptyTiles -= 1
+        self.emptyCells.remove(self.topology.index[(x, y)])
+        tile = self.grid.tiles[(x, y)]
+        tile.colour = self.playerColours[self.current_player]
+        return tile
+
     def changePlayer(self):
         self.current_player = 'blue' if self.current_player == 'red' else 'red'
 
+    def edgeTileSet(self, edge):
+        return {self.grid.tiles[self.topology.coords[index]] for index in getattr(self.topology, edge)}
+
     def findSolutionPath(self):
+        bottom = self.edgeTileSet('bottom')
         for tile in self.grid.topRow():
             if tile.colour == self.playerColours['red']:
-                path = self.grid.findPath(tile, self.grid.bottomRow(), self.playerColours['red'])
+                path = self.grid.findPath(tile, bottom, self.playerColours['red'])
                 if path is not None:
                     return path
+        right = self.edgeTileSet('right')
         for tile in self.grid.leftColumn():
             if tile.colour == self.playerColours['blue']:
-                path = self.grid.findPath(tile, self.grid.rightColumn(), self.playerColours['blue'])
+                path = self.grid.findPath(tile, right, self.playerColours['blue'])
                 if path is not None:
                     return path
         return None
@@ -1,4 +1,5 @@
 import math
+from topology import get_topology
 
 class Tile:
     """
@@ -113,12 +114,15 @@ class Grid:
         boolean value is 1 if the tiles is visited else 0
     matrix: list (two-dimensional)
         matrix for string representation of the grid
+    topology: Topology
+        shared, precomputed neighbour and edge tables for this board size
     """
     EMPTY = '.'
     
     def __init__(self, height: int, width: int, tileSize: float) -> None:
         self.height = height
         self.width = width
+        self.topology = get_topology(height, width)
         self.tiles = {(x, y): Tile(x, y, tileSize) for x in range(width) for y in range(height)}
         self.visitedTiles = {(x, y): 0 for x in range(width) for y in range(height)}
 
@@ -145,32 +149,30 @@ class Grid:
         :param tile:    the tile to find neighbours for
         :return:        None
         """
-        x, y = tile.gridPosition
-
-        if x > 0 and y < self.height - 1:
-            tile.neighbours.append(self.tiles[(x - 1, y + 1)])
-        if y < self.height - 1:
-            tile.neighbours.append(self.tiles[(x, y + 1)])
-        if x > 0:
-            tile.neighbours.append(self.tiles[(x - 1, y)])
-        if x < self.width - 1:
-            tile.neighbours.append(self.tiles[(x + 1, y)])
-        if y > 0:
-            tile.neighbours.append(self.tiles[(x, y - 1)])
-        if x < self.width - 1 and y > 0:
-            tile.neighbours.append(self.tiles[(x + 1, y - 1)])
+        for position in self.topology.neighbour_coords[self.topology.index[tile.gridPosition]]:
+            tile.neighbours.append(self.tiles[position])
+
+    def edgeTiles(self, edge):
+        """
+        Returns the tiles of one board edge ('top', 'bottom', 'left' or 'right') ordered by index
+
+        :param edge:    name of the edge set in the topology
+        :return:        list of tiles
+        """
+        coords = self.topology.coords
+        return [self.tiles[coords[index]] for index in sorted(getattr(self.topology, edge))]
 
     def topRow(self):
-        return [self.tiles[(x, 0)] for x in range(self.width)]
+        return self.edgeTiles('top')
 
     def bottomRow(self):
-        return [self.tiles[(x, self.height - 1)] for x in range(self.width)]
+        return self.edgeTiles('bottom')
 
     def leftColumn(self):
-        return [self.tiles[(0, y)] for y in range(self.height)]
+        return self.edgeTiles('left')
 
     def rightColumn(self):
-        return [self.tiles[(self.width - 1, y)] for y in range(self.height)]
+        return self.edgeTiles('right')
 
     def findPath(self, fromTile, toTileList, playerColour, visited=None):
         if visited is None:
@@ -0,0 +1,91 @@
+import numpy as np
+from agents.hex_state import INF
+
+# Nachbarschaft als (dx, dy), gleiche Reihenfolge wie Topology.neighbours
+OFFSETS = ((-1, 1), (0, 1), (-1, 0), (1, 0), (0, -1), (1, -1))
+
+
+def stone_array(bits, topology):
+    """
+    Wandelt eine Bitmaske in ein bool-Array der Form (NUM_ROWS, NUM_COLS) um.
+    """
+    raw = np.frombuffer(bits.to_bytes((topology.cells + 7) // 8, 'little'), dtype=np.uint8)
+    return np.unpackbits(raw, bitorder='little')[:topology.cells].astype(bool).reshape(topology.rows, topology.cols)
+
+
+def batched_distances(cost, axis):
+    """
+    Kürzeste Randabstände für einen ganzen Stapel von Brettern gleichzeitig.
+
+    cost: int-Array (n, NUM_ROWS, NUM_COLS) mit 0 (eigener Stein), 1 (leer) oder INF (blockiert).
+    axis: 1 für red (Zeilen oben -> unten), 2 für blue (Spalten links -> rechts).
+    Die Relaxation dist = min(dist, cost + min(Nachbarn)) läuft über alle Bretter
+    gleichzeitig, bis sich nichts mehr ändert (höchstens so viele Runden wie der längste Pfad).
+    """
+    n, rows, cols = cost.shape
+    padded = np.full((n, rows + 2, cols + 2), INF, dtype=np.int32)
+    dist = padded[:, 1:rows + 1, 1:cols + 1]
+    if axis == 1:
+        dist[:, 0, :] = cost[:, 0, :]
+    else:
+        dist[:, :, 0] = cost[:, :, 0]
+    shifted = [padded[:, 1 + dy:rows + 1 + dy, 1 + dx:cols + 1 + dx] for dx, dy in OFFSETS]
+    best = np.empty_like(dist)
+    while True:
+        np.minimum(shifted[0], shifted[1], out=best)
+        for view in shifted[2:]:
+            np.minimum(best, view, out=best)
+        best += cost
+        np.minimum(best, INF, out=best)
+        if not (best < dist).any():
+            break
+        np.minimum(dist, best, out=dist)
+    if axis == 1:
+        return dist[:, rows - 1, :].min(axis=1)
+    return dist[:, :, cols - 1].min(axis=1)
+
+
+def evaluate_children(state, player):
+    """
+    Bewertet alle Nachfolger von 'state' (ein Zug des Spielers am Zug) in einem
+    vektorisierten Durchlauf aus Sicht von 'player'.
+
+    Liefert (moves, scores): moves in derselben Reihenfolge wie state.get_possible_moves(),
+    scores als float-Array mit denselben Werten wie evaluate_move(state, move, player)
+    im Modus SHORTEST_PATH (±inf für gewonnene/verlorene Nachfolger).
+    """
+    topology = state.topology
+    moves = list(state.get_possible_moves())
+    n = len(moves)
+    if n == 0:
+        return moves, np.empty(0)
+    if state.winner is not None:
+        # Bereits entschieden: jeder Nachfolger erbt das Ergebnis
+        value = float('inf') if state.check_win(player) else -float('inf')
+        return moves, np.full(n, value)
+    xs = np.fromiter((x for x, _ in moves), dtype=np.intp, count=n)
+    ys = np.fromiter((y for _, y in moves), dtype=np.intp, count=n)
+    children = np.arange(n)
+    red = stone_array(state.red, topology)
+    blue = stone_array(state.blue, topology)
+
+    # cost[0]: Kosten für die Abstände von red, cost[1]: für blue; je ein Brett pro Nachfolger
+    cost = np.empty((2, n, topology.rows, topology.cols), dtype=np.int32)
+    cost[0] = np.where(red, 0, np.where(blue, INF, 1))
+    cost[1] = np.where(blue, 0, np.where(red, INF, 1))
+    mover = state.to_move
+    cost[mover, children, ys, xs] = 0
+    cost[1 - mover, children, ys, xs] = INF
+
+    red_dist = batched_distances(cost[0], axis=1)
+    blue_dist = batched_distances(cost[1], axis=2)
+    if player == 'red':
+        my_dist, opp_dist = red_dist, blue_dist
+    else:
+        my_dist, opp_dist = blue_dist, red_dist
+    scores = (opp_dist - my_dist).astype(float)
+    # Abstand 0 heißt: der Zug verbindet beide Ränder, der Nachfolger ist terminal.
+    mover_dist = red_dist if mover == 0 else blue_dist
+    won = mover_dist == 0
+    scores[won] = float('inf') if state.current_player == player else -float('inf')
+    return moves, scores
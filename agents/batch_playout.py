@@ -0,0 +1,60 @@
+from functools import lru_cache
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def neighbour_table(topology):
+    """
+    Nachbartabelle (cells, 6) als int-Array; fehlende Nachbarn am Rand zeigen auf den
+    Platzhalterindex 'cells' (eine immer leere Zusatzzeile).
+    """
+    table = np.full((topology.cells, 6), topology.cells, dtype=np.intp)
+    for index, neighbours in enumerate(topology.neighbours):
+        table[index, :len(neighbours)] = neighbours
+    return table
+
+
+def batched_random_fill(state, count, rng=None):
+    """
+    'count' zufällige Playouts ab 'state' im Gleichschritt: jede Zeile eines (count, cells)-Arrays
+    erhält eine eigene Permutation der freien Felder, die abwechselnd beginnend mit dem Spieler
+    am Zug belegt werden. Die Sieger aller Playouts werden in einem vektorisierten Durchlauf
+    bestimmt: die Markierung "mit dem oberen Rand verbunden" wird über die Nachbartabelle
+    durch die roten Steine propagiert, bis sie sich in keinem Playout mehr ändert.
+
+    Liefert (red_wins, red): bool-Arrays der Form (count,) und (count, cells).
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    topology = state.topology
+    cells = topology.cells
+    # Intern feldweise (cells + 1, count): die Nachbar-Gathers lesen dann ganze Zeilen;
+    # die letzte Zeile ist der immer leere Platzhalter für fehlende Nachbarn.
+    red = np.zeros((cells + 1, count), dtype=bool)
+    stones = np.frombuffer(state.red.to_bytes((cells + 7) // 8, 'little'), dtype=np.uint8)
+    red[:cells] = np.unpackbits(stones, bitorder='little')[:cells, None].astype(bool)
+    if state.winner is not None:
+        return np.full(count, state.winner == 0), red[:cells].T
+
+    empty = np.fromiter(state.empty.cells, dtype=np.intp, count=len(state.empty))
+    order = rng.permuted(np.broadcast_to(empty, (count, empty.size)), axis=1)
+    # Der Spieler am Zug belegt die Positionen 0, 2, 4, ... seiner Permutation
+    red_slots = order[:, 0::2] if state.to_move == 0 else order[:, 1::2]
+    red[red_slots, np.arange(count)[:, None]] = True
+
+    table = neighbour_table(topology)
+    columns = [table[:, j] for j in range(table.shape[1])]
+    reach = np.zeros_like(red)
+    top = list(topology.top)
+    reach[top] = red[top]
+    own = red[:cells]
+    while True:
+        grown = reach[columns[0]]
+        for column in columns[1:]:
+            grown |= reach[column]
+        grown &= own
+        grown |= reach[:cells]
+        if np.array_equal(grown, reach[:cells]):
+            break
+        reach[:cells] = grown
+    red_wins = reach[list(topology.bottom)].any(axis=0)
+    return red_wins, own.T
@@ -0,0 +1,125 @@
+from agents.hex_state import winning_cells, PLAYERS
+
+PN_INF = 10 ** 9   # Beweis- bzw. Widerlegungszahl einer entschiedenen Stellung
+EPSILON = 0.25     # 1+ε-Trick: Schwelle für das beste Kind etwas über der des zweitbesten
+
+
+class ProofLimit(Exception):
+    """Wird intern ausgelöst, wenn das Knotenbudget eines solve-Aufrufs erschöpft ist."""
+
+
+class DFPNSolver:
+    """
+    Depth-First Proof-Number Search (DFPN) für Hex-Endspiele über HexState.
+
+    Jede Stellung trägt (phi, delta) aus Sicht des Spielers am Zug: phi ist die Beweiszahl für
+    „der Spieler am Zug gewinnt“, delta die Widerlegungszahl. Negamax-Form: phi = min(delta der
+    Kinder), delta = Summe(phi der Kinder). Beides liegt in einer eigenen Transpositionstabelle
+    (Zobrist-Hash -> (phi, delta)), die über mehrere solve-Aufrufe erhalten bleibt; entschiedene
+    Stellungen bleiben darin dauerhaft bewiesen. Hex kennt keine Zyklen und kein Remis, die
+    Suche ist damit exakt.
+
+    Zuggenerierung mit zwei sicheren Abkürzungen: hat der Spieler am Zug ein Gewinnfeld, ist
+    die Stellung bewiesen; hat der Gegner eines, muss genau dort gezogen werden (bei zwei oder
+    mehr Gewinnfeldern des Gegners ist die Stellung verloren).
+    """
+    def __init__(self, max_nodes=200000, max_entries=1 << 20):
+        self.max_nodes = max_nodes      # Knotenbudget pro solve-Aufruf
+        self.max_entries = max_entries  # danach werden die offenen (unentschiedenen) Einträge verworfen
+        self.table = {}
+        self.nodes = 0
+
+    def solve(self, state):
+        """
+        Liefert (Sieger 'red'/'blue', Gewinnzug (x, y) oder None) bei bewiesener Stellung, oder
+        None, wenn das Knotenbudget nicht reicht. Der Gewinnzug ist gesetzt, wenn der Spieler am
+        Zug gewinnt. 'state' wird in place durchsucht und ist danach unverändert.
+        """
+        self.nodes = 0
+        if state.winner is not None:
+            return PLAYERS[state.winner], None
+        depth = len(state.history)
+        try:
+            self.mid(state, PN_INF, PN_INF)
+        except ProofLimit:
+            while len(state.history) > depth:
+                state.unmake_move()
+            return None
+        finally:
+            if len(self.table) > self.max_entries:
+                self.table = {key: value for key, value in self.table.items() if 0 in value}
+        phi, delta = self.table[state.hash]
+        if phi == 0:
+            return state.current_player, self.winning_move(state)
+        return PLAYERS[1 - state.to_move], None
+
+    def winning_move(self, state):
+        coords = state.topology.coords
+        phi, _, moves = self.candidates(state)
+        if phi == 0:
+            return coords[moves[0]]
+        for index in moves:
+            if self.child_numbers(state, index)[1] == 0:
+                return coords[index]
+        return None
+
+    def candidates(self, state):
+        """
+        Liefert (phi, delta, Kandidatenfelder): (0, PN_INF) bzw. (PN_INF, 0), wenn die Stellung
+        ohne Suche entschieden ist, sonst (None, None, Feldindizes der zu prüfenden Züge).
+        """
+        mover = state.current_player
+        wins = winning_cells(state, mover)
+        if wins:
+            return 0, PN_INF, [wins.bit_length() - 1]
+        threats = winning_cells(state, PLAYERS[1 - state.to_move])
+        if threats:
+            if threats & (threats - 1):
+                return PN_INF, 0, []
+            return None, None, [threats.bit_length() - 1]
+        return None, None, list(state.empty.cells)
+
+    def child_numbers(self, state, index):
+        topology = state.topology
+        key = state.hash ^ topology.zobrist[state.to_move][index] ^ topology.zobrist_side
+        return self.table.get(key, (1, 1))
+
+    def mid(self, state, phi_t, delta_t):
+        """
+        Durchsucht 'state', bis phi >= phi_t oder delta >= delta_t gilt, und speichert (phi, delta).
+        """
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise ProofLimit()
+        phi, delta, moves = self.candidates(state)
+        if phi is not None:
+            self.table[state.hash] = (phi, delta)
+            return
+        coords = state.topology.coords
+        while True:
+            # phi = min(delta der Kinder), delta = Summe(phi der Kinder); bestes und zweitbestes Kind merken
+            phi = PN_INF
+            delta = 0
+            delta_2 = PN_INF
+            best = None
+            best_phi = 0
+            for index in moves:
+                child_phi, child_delta = self.child_numbers(state, index)
+                delta = min(PN_INF, delta + child_phi)
+                if child_delta < phi:
+                    delta_2 = phi
+                    phi = child_delta
+                    best = index
+                    best_phi = child_phi
+                elif child_delta < delta_2:
+                    delta_2 = child_delta
+            if phi >= phi_t or delta >= delta_t:
+                self.table[state.hash] = (phi, delta)
+                return
+            # Schwellen des besten Kinds: seine delta-Schwelle aus phi_t und dem zweitbesten Kind,
+            # seine phi-Schwelle aus delta_t abzüglich der Summe der übrigen Kinder
+            child_phi_t = PN_INF if delta_t >= PN_INF else delta_t - delta + best_phi
+            child_delta_t = min(phi_t, delta_2 + 1 if delta_2 >= PN_INF else int(delta_2 * (1 + EPSILON)) + 1)
+            state.make_move(coords[best])
+            self.mid(state, child_phi_t, child_delta_t)
+            state.unmake_move()
@@ -0,0 +1,58 @@
+from collections import OrderedDict
+
+
+class EvalCache:
+    """
+    Größenbegrenzter Bewertungs-Cache mit LRU-Verdrängung, Schlüssel (Zobrist-Hash, Spieler,
+    Bewertungsmodus).
+
+    Eine Instanz kann von mehreren Agenten und über mehrere Züge hinweg geteilt werden,
+    da die Bewertung nur von der Stellung und dem Modus abhängt; Agenten mit verschiedenen
+    Bewertungsmodi erhalten getrennte Einträge.
+
+    Attributes
+    ----------
+    max_size: int
+        maximale Anzahl gespeicherter Bewertungen
+    hits, misses, evictions: int
+        Zähler für Treffer, Fehlzugriffe und verdrängte Einträge
+    """
+    def __init__(self, max_size=200000):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        entries = self.entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'size': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
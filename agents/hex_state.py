@@ -1,143 +1,533 @@
 import math
+import random
 from collections import deque
-import heapq
+from topology import get_topology, EmptyCells
+from agents.vc_engine import vc_evaluation
+
+# Spieler werden intern als Index geführt: 0 = red (oben -> unten), 1 = blue (links -> rechts)
+PLAYERS = ('red', 'blue')
+
+def neighbour_mask(bits, topology):
+    """
+    Berechnet per Shifts die Menge aller Nachbarfelder der Felder in 'bits'
+    (gleiche Nachbarschaft wie Topology.neighbours).
+    """
+    NUM_COLS = topology.cols
+    from_left = bits & topology.not_left     # Felder mit x > 0
+    from_right = bits & topology.not_right   # Felder mit x < NUM_COLS - 1
+    return (
+        (from_left << (NUM_COLS - 1))     # (x - 1, y + 1)
+        | (bits << NUM_COLS)              # (x, y + 1)
+        | (from_left >> 1)                # (x - 1, y)
+        | (from_right << 1)               # (x + 1, y)
+        | (bits >> NUM_COLS)              # (x, y - 1)
+        | (from_right >> (NUM_COLS - 1))  # (x + 1, y - 1)
+    ) & topology.full
+
 
 class HexState:
+    """
+    Bitboard-Darstellung eines Hex-Zustands: pro Farbe eine Bitmaske als Python-int
+    und der Spieler am Zug als Index (0 = red, 1 = blue).
+
+    Zusätzlich wird ein Union-Find-Wald über alle Steine plus vier virtuelle Randknoten
+    (oben, unten, links, rechts) mitgeführt. apply_move vereinigt den neuen Stein nur mit
+    gleichfarbigen Nachbarn, der Gewinner steht danach in 'winner' (None, 0 = red, 1 = blue).
+
+    Für die Suche gibt es neben apply_move (liefert eine Kopie) das Paar make_move/unmake_move,
+    das den Zustand selbst verändert und die Änderungen auf einem Undo-Stack ('history') ablegt.
+
+    Die freien Felder werden in 'empty' (topology.EmptyCells) mitgeführt, sodass
+    get_possible_moves ohne Brettscan und ohne neue Liste auskommt.
+
+    'hash' ist der inkrementell gepflegte Zobrist-Hash (Steine beider Farben und Spieler am Zug).
+    """
+    __slots__ = ('NUM_ROWS', 'NUM_COLS', 'red', 'blue', 'to_move', 'num_empty', 'topology',
+                 'parent', 'size', 'winner', 'history', 'empty', 'hash')
+
     def __init__(self, matrix, current_player, num_empty, NUM_ROWS, NUM_COLS):
-        # Erstelle eine Kopie des Spielbretts, um Seiteneffekte zu vermeiden
-        self.matrix = [row[:] for row in matrix]
-        self.current_player = current_player
-        self.num_empty = num_empty
         self.NUM_ROWS = NUM_ROWS
         self.NUM_COLS = NUM_COLS
+        self.topology = get_topology(NUM_ROWS, NUM_COLS)
+        cells = self.topology.cells
+        # Knoten 0..cells-1 sind die Felder, danach TOP, BOTTOM, LEFT, RIGHT
+        self.parent = list(range(cells + 4))
+        self.size = [1] * (cells + 4)
+        self.winner = None
+        self.history = []
+        self.hash = 0
+        self.red = 0
+        self.blue = 0
+        for y in range(NUM_ROWS):
+            row = matrix[y]
+            for x in range(NUM_COLS):
+                if row[x] == 'R':
+                    self._place(y * NUM_COLS + x, 0)
+                elif row[x] == 'B':
+                    self._place(y * NUM_COLS + x, 1)
+        self.empty = EmptyCells(self.topology, self.red | self.blue)
+        self.to_move = PLAYERS.index(current_player)
+        if self.to_move == 1:
+            self.hash ^= self.topology.zobrist_side
+        self.num_empty = num_empty
 
-    def clone(self):
-        return HexState(self.matrix, self.current_player, self.num_empty, self.NUM_ROWS, self.NUM_COLS)
+    @property
+    def current_player(self):
+        return PLAYERS[self.to_move]
 
-    def get_possible_moves(self):
-        moves = []
+    @property
+    def matrix(self):
+        # Nur für Anzeige/Kompatibilität; die Suche arbeitet ausschließlich auf den Bitmasken.
+        rows = []
         for y in range(self.NUM_ROWS):
+            row = []
             for x in range(self.NUM_COLS):
-                if self.matrix[y][x] == '.':
-                    moves.append((x, y))
-        return moves
+                bit = 1 << (y * self.NUM_COLS + x)
+                row.append('R' if self.red & bit else 'B' if self.blue & bit else '.')
+            rows.append(row)
+        return rows
+
+    def clone(self):
+        new_state = HexState.__new__(HexState)
+        new_state.NUM_ROWS = self.NUM_ROWS
+        new_state.NUM_COLS = self.NUM_COLS
+        new_state.topology = self.topology
+        new_state.parent = self.parent[:]
+        new_state.size = self.size[:]
+        new_state.winner = self.winner
+        new_state.history = []
+        new_state.empty = self.empty.copy()
+        new_state.hash = self.hash
+        new_state.red = self.red
+        new_state.blue = self.blue
+        new_state.to_move = self.to_move
+        new_state.num_empty = self.num_empty
+        return new_state
+
+    def stones(self, player):
+        return self.red if player == 'red' else self.blue
+
+    def get_possible_moves(self):
+        # Live-Sicht auf die freien Felder (Sequenz von (x, y)); wer sie über Züge
+        # hinweg aufbewahren will, muss sie mit list(...) kopieren.
+        return self.empty
+
+    def random_move(self, rng=random):
+        return self.empty.random_move(rng)
 
     def apply_move(self, move):
         x, y = move
+        index = y * self.NUM_COLS + x
         new_state = self.clone()
-        # Setze den Stein des aktuellen Spielers: 'R' oder 'B'
-        new_state.matrix[y][x] = new_state.current_player.upper()[0]
+        # Setze den Stein des aktuellen Spielers
+        new_state._place(index, self.to_move)
+        new_state.empty.remove(index)
         new_state.num_empty -= 1
-        new_state.current_player = 'blue' if new_state.current_player == 'red' else 'red'
+        new_state.to_move = 1 - self.to_move
+        new_state.hash ^= self.topology.zobrist_side
         return new_state
 
+    def make_move(self, move):
+        """
+        Setzt den Stein des aktuellen Spielers direkt in diesem Zustand (ohne Kopie).
+        Mit unmake_move wird der Zug wieder exakt zurückgenommen.
+        """
+        x, y = move
+        index = y * self.NUM_COLS + x
+        winner = self.winner
+        unions = self._place(index, self.to_move)
+        slot = self.empty.remove(index)
+        self.history.append((index, slot, winner, unions))
+        self.num_empty -= 1
+        self.to_move = 1 - self.to_move
+        self.hash ^= self.topology.zobrist_side
+
+    def unmake_move(self):
+        """
+        Nimmt den zuletzt mit make_move gesetzten Stein zurück und liefert den Zug (x, y).
+        """
+        index, slot, winner, unions = self.history.pop()
+        self.empty.restore(index, slot)
+        parent = self.parent
+        size = self.size
+        # Vereinigungen in umgekehrter Reihenfolge auflösen
+        for root, child in reversed(unions):
+            parent[child] = child
+            size[root] -= size[child]
+        self.to_move = 1 - self.to_move
+        self.num_empty += 1
+        self.winner = winner
+        bit = 1 << index
+        if self.to_move == 0:
+            self.red &= ~bit
+        else:
+            self.blue &= ~bit
+        self.hash ^= self.topology.zobrist[self.to_move][index] ^ self.topology.zobrist_side
+        return self.topology.coords[index]
+
+    def _find(self, node):
+        # Ohne Pfadkompression, damit unmake_move nur die Vereinigungen zurücksetzen muss;
+        # Union by Size hält die Bäume trotzdem logarithmisch flach.
+        parent = self.parent
+        while parent[node] != node:
+            node = parent[node]
+        return node
+
+    def _union(self, a, b, unions):
+        a = self._find(a)
+        b = self._find(b)
+        if a == b:
+            return
+        size = self.size
+        if size[a] < size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        size[a] += size[b]
+        unions.append((a, b))
+
+    def _place(self, index, colour):
+        """
+        Setzt einen Stein, vereinigt ihn mit gleichfarbigen Nachbarn/Rändern und
+        liefert die durchgeführten Vereinigungen als Liste von (Wurzel, Kind).
+        """
+        unions = []
+        bit = 1 << index
+        topology = self.topology
+        cells = topology.cells
+        self.hash ^= topology.zobrist[colour][index]
+        if colour == 0:
+            self.red |= bit
+            own = self.red
+            if bit & topology.top_mask:
+                self._union(index, cells, unions)
+            if bit & topology.bottom_mask:
+                self._union(index, cells + 1, unions)
+        else:
+            self.blue |= bit
+            own = self.blue
+            if bit & topology.left_mask:
+                self._union(index, cells + 2, unions)
+            if bit & topology.right_mask:
+                self._union(index, cells + 3, unions)
+        for neighbour in topology.neighbours[index]:
+            if own >> neighbour & 1:
+                self._union(index, neighbour, unions)
+        if self.winner is None:
+            first = cells + 2 * colour
+            if self._find(first) == self._find(first + 1):
+                self.winner = colour
+        return unions
+
     def is_terminal(self):
         # Terminal, wenn ein Spieler gewonnen hat oder das Brett voll ist.
-        return self.check_win("red") or self.check_win("blue") or self.num_empty == 0
+        return self.winner is not None or self.num_empty == 0
 
     def check_win(self, player):
-        mark = player.upper()[0]
-        visited = [[False for _ in range(self.NUM_COLS)] for _ in range(self.NUM_ROWS)]
-        q = deque()
-        if player == "red":
-            # Red muss von oben (Zeile 0) nach unten (Zeile NUM_ROWS-1) verbinden.
-            for x in range(self.NUM_COLS):
-                if self.matrix[0][x] == mark:
-                    q.append((x, 0))
-                    visited[0][x] = True
-            while q:
-                cx, cy = q.popleft()
-                if cy == self.NUM_ROWS - 1:
-                    return True
-                for nx, ny in self.get_neighbors(cx, cy):
-                    if not visited[ny][nx] and self.matrix[ny][nx] == mark:
-                        visited[ny][nx] = True
-                        q.append((nx, ny))
-        else:
-            # Blue muss von links (Spalte 0) nach rechts (Spalte NUM_COLS-1) verbinden.
-            for y in range(self.NUM_ROWS):
-                if self.matrix[y][0] == mark:
-                    q.append((0, y))
-                    visited[y][0] = True
-            while q:
-                cx, cy = q.popleft()
-                if cx == self.NUM_COLS - 1:
-                    return True
-                for nx, ny in self.get_neighbors(cx, cy):
-                    if not visited[ny][nx] and self.matrix[ny][nx] == mark:
-                        visited[ny][nx] = True
-                        q.append((nx, ny))
-        return False
+        return self.winner is not None and PLAYERS[self.winner] == player
 
     def get_neighbors(self, x, y):
-        moves = []
-        # Angelehnt an deine ursprüngliche Hex-Board Logik:
-        if x > 0 and y < self.NUM_ROWS - 1:
-            moves.append((x - 1, y + 1))
-        if y < self.NUM_ROWS - 1:
-            moves.append((x, y + 1))
-        if x > 0:
-            moves.append((x - 1, y))
-        if x < self.NUM_COLS - 1:
-            moves.append((x + 1, y))
-        if y > 0:
-            moves.append((x, y - 1))
-        if x < self.NUM_COLS - 1 and y > 0:
-            moves.append((x + 1, y - 1))
-        return moves
+        # Vorberechnetes Tupel aus der Topologie, keine Allokation pro Aufruf
+        return self.topology.neighbour_coords[y * self.NUM_COLS + x]
+
+def connects(bits, start, goal, topology):
+    """
+    Flutfüllung per Shifts: verbindet die Steinmenge 'bits' die Ränder 'start' und 'goal'?
+    """
+    reach = bits & start
+    while reach:
+        if reach & goal:
+            return True
+        grown = reach | (neighbour_mask(reach, topology) & bits)
+        if grown == reach:
+            return False
+        reach = grown
+    return False
+
+def random_fill(state, rng=random):
+    """
+    Zufälliger Playout bis zum vollen Brett: die freien Felder werden gemischt und abwechselnd
+    beginnend mit dem Spieler am Zug belegt. Da Hex kein Remis kennt, entscheidet eine einzige
+    Verbindungsprüfung am Ende. Liefert (Sieger, Bitmaske aller roten Steine des vollen Bretts).
+    """
+    topology = state.topology
+    cells = list(state.empty.cells)
+    rng.shuffle(cells)
+    mover = 0
+    for index in cells[0::2]:
+        mover |= 1 << index
+    red = state.red | (mover if state.to_move == 0 else topology.full & ~(state.red | state.blue | mover))
+    if state.winner is not None:
+        return PLAYERS[state.winner], red
+    winner = "red" if connects(red, topology.top_mask, topology.bottom_mask, topology) else "blue"
+    return winner, red
+
+# Bewertungsmodi für evaluate_state
+SHORTEST_PATH = 'shortest_path'
+TWO_DISTANCE = 'two_distance'
+VIRTUAL_CONNECTION = 'virtual_connection'
+
+INF = 10**6
+
+def edge_masks(topology, player):
+    """
+    Liefert (Startrand, Zielrand) des Spielers als Bitmasken.
+    """
+    if player == "red":
+        return topology.top_mask, topology.bottom_mask
+    return topology.left_mask, topology.right_mask
+
+def edge_group(bits, edge, topology):
+    """
+    Alle Steine aus 'bits', die über eigene Steine mit dem Rand 'edge' verbunden sind.
+    """
+    reach = bits & edge
+    while True:
+        grown = reach | (neighbour_mask(reach, topology) & bits)
+        if grown == reach:
+            return reach
+        reach = grown
+
+def winning_cells(state, player):
+    """
+    Bitmaske der freien Felder, mit denen 'player' sofort gewinnt: Felder, die an beide Ränder
+    des Spielers bzw. an mit ihnen verbundene eigene Steine grenzen.
+    """
+    topology = state.topology
+    own = state.stones(player)
+    start, goal = edge_masks(topology, player)
+    touch_start = neighbour_mask(edge_group(own, start, topology), topology) | start
+    touch_goal = neighbour_mask(edge_group(own, goal, topology), topology) | goal
+    return touch_start & touch_goal & topology.full & ~(state.red | state.blue)
 
 def shortest_path_distance(state, player):
     """
-    Berechnet mittels Dijkstra (Priority Queue) eine Schätzung des minimalen „Abstands“ vom Start- zum Zielrand.
+    Berechnet mittels 0-1-BFS (Deque) eine Schätzung des minimalen „Abstands“ vom Start- zum Zielrand.
     Zellen, die vom Spieler belegt sind, kosten 0, leere Zellen 1; gegnerische Zellen werden blockiert.
+    Da die Felder in nicht fallender Entfernung entnommen werden, kann abgebrochen werden,
+    sobald das erste Feld des Zielrands aus der Deque kommt.
     """
-    mark = player.upper()[0]
-    INF = 10**6
-    dist = [[INF for _ in range(state.NUM_COLS)] for _ in range(state.NUM_ROWS)]
-    pq = []  # Priority Queue: (Kosten, (x,y))
-    if player == "red":
-        for x in range(state.NUM_COLS):
-            if state.matrix[0][x] in [mark, '.']:
-                cost = 0 if state.matrix[0][x] == mark else 1
-                dist[0][x] = cost
-                heapq.heappush(pq, (cost, (x, 0)))
-        while pq:
-            current_cost, (cx, cy) = heapq.heappop(pq)
-            if current_cost > dist[cy][cx]:
+    topology = state.topology
+    own = state.stones(player)
+    opp = state.stones("blue" if player == "red" else "red")
+    neighbours = topology.neighbours
+    _, goal = edge_masks(topology, player)
+    dist = [INF] * topology.cells
+    queue = deque()
+    for index in (topology.top if player == "red" else topology.left):
+        if not opp >> index & 1:
+            if own >> index & 1:
+                dist[index] = 0
+                queue.appendleft(index)
+            else:
+                dist[index] = 1
+                queue.append(index)
+    while queue:
+        index = queue.popleft()
+        current_cost = dist[index]
+        if goal >> index & 1:
+            return current_cost
+        for neighbour in neighbours[index]:
+            if opp >> neighbour & 1:
                 continue
-            for nx, ny in state.get_neighbors(cx, cy):
-                if state.matrix[ny][nx] not in [mark, '.']:
-                    continue
-                cost = 0 if state.matrix[ny][nx] == mark else 1
-                if dist[ny][nx] > current_cost + cost:
-                    dist[ny][nx] = current_cost + cost
-                    heapq.heappush(pq, (dist[ny][nx], (nx, ny)))
-        return min(dist[state.NUM_ROWS - 1][x] for x in range(state.NUM_COLS))
-    else:
-        for y in range(state.NUM_ROWS):
-            if state.matrix[y][0] in [mark, '.']:
-                cost = 0 if state.matrix[y][0] == mark else 1
-                dist[y][0] = cost
-                heapq.heappush(pq, (cost, (0, y)))
-        while pq:
-            current_cost, (cx, cy) = heapq.heappop(pq)
-            if current_cost > dist[cy][cx]:
+            if own >> neighbour & 1:
+                if dist[neighbour] > current_cost:
+                    dist[neighbour] = current_cost
+                    queue.appendleft(neighbour)
+            elif dist[neighbour] > current_cost + 1:
+                dist[neighbour] = current_cost + 1
+                queue.append(neighbour)
+    return INF
+
+def distance_map(state, player, source):
+    """
+    Vollständige 0-1-BFS-Abstandskarte von einem Rand ('source' als Bitmaske) für alle Felder:
+    dist[i] enthält die Kosten des Feldes i selbst (eigener Stein 0, leer 1), gegnerische
+    Felder bleiben INF. Anders als shortest_path_distance ohne vorzeitigen Abbruch.
+    """
+    topology = state.topology
+    own = state.stones(player)
+    opp = state.stones("blue" if player == "red" else "red")
+    neighbours = topology.neighbours
+    dist = [INF] * topology.cells
+    queue = deque()
+    cells = source & ~opp
+    while cells:
+        low = cells & -cells
+        index = low.bit_length() - 1
+        cells ^= low
+        if own & low:
+            dist[index] = 0
+            queue.appendleft(index)
+        else:
+            dist[index] = 1
+            queue.append(index)
+    while queue:
+        index = queue.popleft()
+        current_cost = dist[index]
+        for neighbour in neighbours[index]:
+            if opp >> neighbour & 1:
                 continue
-            for nx, ny in state.get_neighbors(cx, cy):
-                if state.matrix[ny][nx] not in [mark, '.']:
+            if own >> neighbour & 1:
+                if dist[neighbour] > current_cost:
+                    dist[neighbour] = current_cost
+                    queue.appendleft(neighbour)
+            elif dist[neighbour] > current_cost + 1:
+                dist[neighbour] = current_cost + 1
+                queue.append(neighbour)
+    return dist
+
+def shortest_path_cells(state, player):
+    """
+    Bitmaske aller leeren Felder, die auf mindestens einem kürzesten Verbindungsweg von 'player' liegen.
+    """
+    return near_path_cells(state, player)[1]
+
+def near_path_cells(state, player, slack=0):
+    """
+    Liefert (Abstand, Bitmaske): den kürzesten Verbindungsabstand von 'player' und alle leeren
+    Felder, über die ein Verbindungsweg mit höchstens Abstand + slack führt.
+    slack=0 entspricht shortest_path_cells.
+    """
+    start, goal = edge_masks(state.topology, player)
+    forward = distance_map(state, player, start)
+    backward = distance_map(state, player, goal)
+    goal_cells = state.topology.bottom if player == "red" else state.topology.right
+    best = min(forward[index] for index in goal_cells)
+    if best >= INF:
+        return best, 0
+    cells = 0
+    limit = best + 1 + slack
+    for index in state.empty.cells:
+        if forward[index] + backward[index] <= limit:
+            cells |= 1 << index
+    return best, cells
+
+def relevant_moves(state, slack=1):
+    """
+    Reduzierte Kandidatenmenge für die Suche (Relevanzzone):
+    - kann der Spieler am Zug sofort gewinnen, nur seine Gewinnzüge;
+    - droht der Gegner im nächsten Zug zu gewinnen, nur die Felder, die das verhindern
+      können (Must-Play-Region: alle Felder auf seinen Ein-Zug-Verbindungen);
+    - sonst alle Felder, die auf einem höchstens um 'slack' längeren Verbindungsweg
+      eines der beiden Spieler liegen.
+    Die Reihenfolge entspricht get_possible_moves(); ist die Zone leer, werden alle Züge geliefert.
+    """
+    mover = state.current_player
+    opponent = "blue" if mover == "red" else "red"
+    own_best, own_cells = near_path_cells(state, mover, slack)
+    opp_best, opp_cells = near_path_cells(state, opponent, slack)
+    if own_best == 1:
+        _, zone = near_path_cells(state, mover)
+    elif opp_best == 1:
+        _, zone = near_path_cells(state, opponent)
+    else:
+        zone = own_cells | opp_cells
+    moves = state.get_possible_moves()
+    if not zone:
+        return list(moves)
+    index = state.topology.index
+    return [move for move in moves if zone >> index[move] & 1]
+
+def two_distance_map(state, player, source):
+    """
+    Queenbee-Zwei-Distanz aller leeren Felder zu einem Rand ('source' als Bitmaske):
+    Ein leeres Feld hat die Zwei-Distanz 1, wenn es (direkt oder über eigene Steine) an den
+    Rand grenzt, sonst 1 + den zweitkleinsten Wert seiner Nachbarn. Eigene Steinketten werden
+    dabei zusammengezogen, d.h. alle Freiheiten einer Kette gelten als Nachbarn untereinander.
+    Der Gegner kann so immer den besten Nachbarn blockieren.
+    """
+    topology = state.topology
+    own = state.stones(player)
+    opp = state.stones("blue" if player == "red" else "red")
+    empty = topology.full & ~(own | opp)
+    neighbour_masks = topology.neighbour_masks
+
+    # Eigene Ketten bestimmen: Freiheiten je Kette, Zuordnung Stein -> Kette
+    group_of = {}
+    liberties = []
+    touching = 0  # leere Felder, die über eine Kette den Rand berühren
+    rest = own
+    while rest:
+        group = rest & -rest
+        while True:
+            grown = group | (neighbour_mask(group, topology) & own)
+            if grown == group:
+                break
+            group = grown
+        rest &= ~group
+        group_liberties = neighbour_mask(group, topology) & empty
+        if group & source:
+            touching |= group_liberties
+        stones_left = group
+        while stones_left:
+            low = stones_left & -stones_left
+            group_of[low.bit_length() - 1] = len(liberties)
+            stones_left ^= low
+        liberties.append(group_liberties)
+
+    td = [INF] * topology.cells
+    count = [0] * topology.cells
+    level = []
+    frontier = (source | touching) & empty
+    while frontier:
+        low = frontier & -frontier
+        index = low.bit_length() - 1
+        td[index] = 1
+        level.append(index)
+        frontier ^= low
+
+    value = 1
+    while level:
+        next_level = []
+        for index in level:
+            reach = neighbour_masks[index] & empty
+            for neighbour in topology.neighbours[index]:
+                group = group_of.get(neighbour)
+                if group is not None:
+                    reach |= liberties[group]
+            reach &= ~(1 << index)
+            while reach:
+                low = reach & -reach
+                neighbour = low.bit_length() - 1
+                reach ^= low
+                if td[neighbour] != INF:
                     continue
-                cost = 0 if state.matrix[ny][nx] == mark else 1
-                if dist[ny][nx] > current_cost + cost:
-                    dist[ny][nx] = current_cost + cost
-                    heapq.heappush(pq, (dist[ny][nx], (nx, ny)))
-        return min(dist[y][state.NUM_COLS - 1] for y in range(state.NUM_ROWS))
+                count[neighbour] += 1
+                if count[neighbour] == 2:
+                    td[neighbour] = value + 1
+                    next_level.append(neighbour)
+        level = next_level
+        value += 1
+    return td
+
+def two_distance_potential(state, player):
+    """
+    Potential eines Spielers: kleinste Summe der Zwei-Distanzen zu beiden Rändern über alle leeren Felder.
+    """
+    start, goal = edge_masks(state.topology, player)
+    forward = two_distance_map(state, player, start)
+    backward = two_distance_map(state, player, goal)
+    return min(map(int.__add__, forward, backward), default=INF)
+
+def evaluate_move(state, move, player, mode=SHORTEST_PATH, cache=None):
+    """
+    Bewertet den Zustand nach 'move' aus Sicht von 'player', ohne eine Kopie anzulegen
+    (make_move -> evaluate_state -> unmake_move).
+    """
+    state.make_move(move)
+    value = evaluate_state(state, player, mode, cache)
+    state.unmake_move()
+    return value
 
-def evaluate_state(state, player):
+def evaluate_state(state, player, mode=SHORTEST_PATH, cache=None):
     """
     Bewertungsfunktion für einen nicht-terminalen Zustand:
       - Falls terminal: +∞, wenn 'player' gewonnen hat, -∞ wenn verloren.
       - Andernfalls: Differenz zwischen dem (geschätzten) Abstand des Gegners und dem eigenen.
         Ein niedrigerer Abstand (bessere Verbindung) resultiert in einem höheren Score.
+        Mit mode=TWO_DISTANCE wird statt des kürzesten Wegs das Zwei-Distanz-Potential verwendet,
+        mit mode=VIRTUAL_CONNECTION der Abstand über virtuelle Verbindungen (VCEngine.distance).
+    Optional wird über 'cache' (EvalCache) mit dem Schlüssel (state.hash, player, mode) zwischengespeichert.
     """
     if state.is_terminal():
         if state.check_win(player):
@@ -146,7 +536,17 @@ def evaluate_state(state, player):
             return -float('inf')
         else:
             return 0
-    my_dist = shortest_path_distance(state, player)
+    if cache is not None:
+        key = (state.hash, player, mode)
+        value = cache.get(key)
+        if value is None:
+            value = evaluate_state(state, player, mode)
+            cache.put(key, value)
+        return value
+    if mode == VIRTUAL_CONNECTION:
+        return vc_evaluation(state, player)
+    distance = two_distance_potential if mode == TWO_DISTANCE else shortest_path_distance
+    my_dist = distance(state, player)
     opp = "blue" if player == "red" else "red"
-    opp_dist = shortest_path_distance(state, opp)
+    opp_dist = distance(state, opp)
     return opp_dist - my_dist
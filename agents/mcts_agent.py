@@ -1,44 +1,117 @@
 import math
 import random
 import time
-from agents.hex_state import HexState, evaluate_state
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+import numpy as np
+from agents.hex_state import HexState, evaluate_state, evaluate_move, relevant_moves, random_fill, SHORTEST_PATH
+from agents.batch_eval import evaluate_children, stone_array
+from agents.batch_playout import batched_random_fill
+from agents.mcts_tree import ArrayTree
+from agents.dfpn import DFPNSolver
+from agents.vc_engine import VCFilter
+
+# Playout-Modi
+HEURISTIC_PLAYOUT = 'heuristic'  # epsilon-greedy über die Bewertung, höchstens 20 Züge
+RANDOM_FILL = 'random_fill'      # Brett zufällig auffüllen, eine Verbindungsprüfung am Ende
+BATCHED_FILL = 'batched_fill'    # batch_size Auffüll-Playouts pro Blatt im Gleichschritt (NumPy)
+
+# Zeitmanagement (adaptive=True)
+CHECK_INTERVAL = 16   # Iterationen zwischen zwei Prüfungen, ob der beste Zug noch eingeholt werden kann
+CLOSE_RATIO = 0.9     # knapp: der zweitbeste Zug hat mindestens diesen Anteil der Besuche des besten
+EXTENSION = 0.5       # einmalige Verlängerung bei knappem Ausgang, als Anteil des ursprünglichen Budgets
+
+
+def rave_beta(visits, k):
+    """
+    Anteil der AMAF-Statistik am Knotenwert (Schema von Gelly & Silver): 1 ohne eigene Besuche,
+    0.5 bei visits = k, danach gegen 0. Gibt die Zahl der Besuche an, ab der beide gleich zählen.
+    """
+    return math.sqrt(k / (3 * visits + k))
+
+def moves_between(old, new):
+    """
+    Züge, die von Stellung 'old' zu 'new' geführt haben: [] bei gleicher Stellung, [Zug] nach
+    einem einzelnen Zug des in 'old' ziehenden Spielers, [Zug, Antwort] nach einem Zugpaar,
+    sonst None (andere Partie oder Brettgröße).
+    """
+    if old is None or old.topology is not new.topology:
+        return None
+    if old.red & ~new.red or old.blue & ~new.blue:
+        return None
+    added_red = new.red & ~old.red
+    added_blue = new.blue & ~old.blue
+    own, reply = (added_red, added_blue) if old.to_move == 0 else (added_blue, added_red)
+    coords = new.topology.coords
+    if old.to_move != new.to_move:
+        if own.bit_count() != 1 or reply:
+            return None
+        return [coords[own.bit_length() - 1]]
+    if not own and not reply:
+        return []
+    if own.bit_count() != 1 or reply.bit_count() != 1:
+        return None
+    return [coords[own.bit_length() - 1], coords[reply.bit_length() - 1]]
+
 
 class Node:
-    def __init__(self, state, move=None, parent=None):
+    def __init__(self, state, move=None, parent=None, relevance_slack=None, prior=0.0):
         self.state = state        # Instanz von HexState
         self.move = move          # Der Zug, der zu diesem Zustand geführt hat
         self.parent = parent
         self.children = []
         self.visits = 0
         self.wins = 0
+        self.prior = prior        # statische Bewertung aus Sicht des ziehenden Spielers (bei der Expansion)
+        # RAVE/AMAF: Simulationen durch den Elternknoten, in denen der ziehende Spieler dieses Feld
+        # irgendwann später belegt hat, und deren Siege aus seiner Sicht
+        self.amaf_visits = 0
+        self.amaf_wins = 0
+        # Noch nicht expandierte Kandidatenzüge (alle freien Felder oder nur die Relevanzzone, siehe
+        # relevant_moves), einmalig gemischt: expand nimmt jeweils den letzten Eintrag.
+        self.relevance_slack = relevance_slack
+        if relevance_slack is None:
+            self.untried_moves = list(state.get_possible_moves())
+        else:
+            self.untried_moves = relevant_moves(state, relevance_slack)
+        random.shuffle(self.untried_moves)
 
     def is_fully_expanded(self):
-        return len(self.children) == len(self.state.get_possible_moves())
+        return not self.untried_moves
 
-    def best_child(self, c_param=1.0, player=None):
+    def best_child(self, c_param=1.0, bias_weight=0.0, rave_k=None):
         """
-        Wählt das Kind mit dem höchsten UCB1-Wert plus einem progressive bias,
-        der aus der statischen Bewertung abgeleitet wird.
+        Wählt das Kind mit dem höchsten UCB1-Wert plus einem progressive bias
+        bias_weight * prior / (visits + 1), der mit den Besuchen des Kindes abklingt.
+        Mit rave_k wird die Gewinnrate mit der AMAF-Gewinnrate gemischt (Gewicht rave_beta).
         """
         choices = []
+        log_visits = math.log(self.visits) if self.visits else 0.0
         for child in self.children:
             if child.visits == 0:
                 ucb = float('inf')
             else:
-                ucb = (child.wins / child.visits) + c_param * math.sqrt(math.log(self.visits) / child.visits)
-            bias = 0.0005 * evaluate_state(child.state, player)
-            choices.append((ucb + bias, child))
+                value = child.wins / child.visits
+                if rave_k is not None and child.amaf_visits:
+                    beta = rave_beta(child.visits, rave_k)
+                    value = (1 - beta) * value + beta * child.amaf_wins / child.amaf_visits
+                ucb = value + c_param * math.sqrt(log_visits / child.visits)
+                if bias_weight:
+                    ucb += bias_weight * child.prior / (child.visits + 1)
+            choices.append((ucb, child))
         return max(choices, key=lambda x: x[0])[1]
 
-    def expand(self):
-        possible_moves = self.state.get_possible_moves()
-        tried_moves = [child.move for child in self.children]
-        untried_moves = [move for move in possible_moves if move not in tried_moves]
-        if not untried_moves:
+    def expand(self, evaluation=SHORTEST_PATH, eval_cache=None, with_prior=False):
+        """
+        Legt ein Kind für den nächsten unversuchten Zug an; mit with_prior wird dessen statische
+        Bewertung einmalig hier berechnet und im Kind gespeichert.
+        """
+        if not self.untried_moves:
             return None
-        move = random.choice(untried_moves)
+        move = self.untried_moves.pop()
         new_state = self.state.apply_move(move)
-        child_node = Node(new_state, move, self)
+        prior = evaluate_state(new_state, self.state.current_player, evaluation, eval_cache) if with_prior else 0.0
+        child_node = Node(new_state, move, self, self.relevance_slack, prior)
         self.children.append(child_node)
         return child_node
 
@@ -46,52 +119,458 @@ class Node:
         self.visits += 1
         self.wins += result
 
+# Agenten der Worker-Prozesse (root-parallele Suche), je Konfiguration einmal pro Prozess angelegt
+_WORKER_AGENTS = {}
+
+
+def root_search(config, budget, matrix, player, num_empty, rows, cols, seed):
+    """
+    Läuft in einem Worker-Prozess: sucht die übergebene Wurzel mit eigenem Seed und dem vom
+    Hauptprozess berechneten Zeitbudget (None: config['simulations']) und liefert die
+    Wurzelstatistik (siehe MCTSAgent.root_statistics).
+    """
+    random.seed(seed)
+    key = tuple(sorted(config.items()))
+    agent = _WORKER_AGENTS.get(key)
+    if agent is None:
+        agent = _WORKER_AGENTS[key] = MCTSAgent(**config)
+    game = SimpleNamespace(matrix=matrix, current_player=player, num_emptyTiles=num_empty, NUM_ROWS=rows, NUM_COLS=cols)
+    agent.rng = np.random.default_rng(seed)
+    agent.run(agent.prepare_search(game, player), budget)
+    return agent.root_statistics()
+
+
 class MCTSAgent:
-    def __init__(self, simulations=1000, time_limit=None):
+    def __init__(self, simulations=1000, time_limit=None, evaluation=SHORTEST_PATH, batched=False, eval_cache=None,
+                 relevance_slack=None, array_tree=False, max_nodes=1 << 20, bias_weight=0.05,
+                 playout=HEURISTIC_PLAYOUT, rave_k=None, reuse_tree=True, workers=1, batch_size=64,
+                 count_reused=False, use_clock=False, adaptive=False, opening_book=None,
+                 solver_threshold=None, solver_nodes=100000, vc_filter=False):
         self.simulations = simulations
         self.time_limit = time_limit  # in Sekunden; falls None, wird simulations verwendet
+        # use_clock: Zeitbudget aus der Restzeit in game.timers, verteilt auf die voraussichtlich noch
+        # eigenen Züge (game.num_emptyTiles // 2), höchstens time_limit (wie bei MinimaxAgent)
+        self.use_clock = use_clock
+        # adaptive: Abbruch, sobald der meistbesuchte Wurzelzug im restlichen Budget nicht mehr
+        # eingeholt werden kann, und einmalige Verlängerung um EXTENSION, wenn die besten zwei knapp liegen
+        self.adaptive = adaptive
+        self.iterations = 0  # Anzahl Iterationen der letzten Suche
+        self.opening_book = opening_book  # optionales OpeningBook; ein Treffer ersetzt die Suche
+        # Endspiel: bei höchstens solver_threshold freien Feldern zuerst exakt per DFPN lösen (Budget
+        # solver_nodes Knoten, Tabelle bleibt über die Partie erhalten); None = kein Solver
+        self.solver_threshold = solver_threshold
+        self.solver = DFPNSolver(max_nodes=solver_nodes) if solver_threshold is not None else None
+        # VC-Zugfilter für die Kandidaten einer neuen Wurzel (siehe vc_engine.vc_filter)
+        self.vc_filter = vc_filter
+        self.root_filter = VCFilter()   # VCEngine des Gegners, von Zug zu Zug fortgeschrieben
+        self.evaluation = evaluation  # SHORTEST_PATH, TWO_DISTANCE oder VIRTUAL_CONNECTION (siehe evaluate_state)
+        self.eval_cache = eval_cache  # optionaler, über Züge/Agenten teilbarer EvalCache
+        # Greedy-Schritt im Rollout über evaluate_children (NumPy); nur für SHORTEST_PATH
+        self.batched = batched and evaluation == SHORTEST_PATH
+        # Relevanzzone für die Expansion im Baum (None = alle freien Felder); Rollouts bleiben ungefiltert
+        self.relevance_slack = relevance_slack
+        # Baum in vorab allozierten NumPy-Puffern (ArrayTree) statt Node-Objekten; max_nodes begrenzt
+        # den Speicher (ArrayTree.BYTES_PER_NODE Bytes pro Knoten), die Puffer werden über Züge wiederverwendet.
+        self.tree = ArrayTree(max_nodes) if array_tree and workers == 1 else None
+        # Gewicht des progressive bias: bias_weight * Bewertung / (Besuche + 1); die Bewertung wird nur
+        # einmal bei der Expansion berechnet. 0 schaltet den Bias (und die Bewertung) ab.
+        self.bias_weight = bias_weight
+        self.playout = playout  # HEURISTIC_PLAYOUT, RANDOM_FILL oder BATCHED_FILL
+        # Mit BATCHED_FILL zählt jede Iteration batch_size Playouts (Besuche und Siege um bis zu batch_size)
+        self.playouts_per_leaf = batch_size if playout == BATCHED_FILL else 1
+        self.rng = np.random.default_rng()
+        # RAVE: None = aus, sonst Parameter k des Mischgewichts rave_beta (Besuche bis zum Gleichgewicht)
+        if rave_k is not None and playout == BATCHED_FILL:
+            raise ValueError("RAVE needs individual playouts and is not available with BATCHED_FILL")
+        self.rave_k = rave_k
+        # Baumwiederverwendung: der zur neuen Stellung passende Teilbaum der letzten Suche wird
+        # zur Wurzel (setzt voraus, dass eine Instanz eine ganze Partie für eine Farbe spielt)
+        self.reuse_tree = reuse_tree
+        self.root = None          # Wurzelknoten der letzten Suche (Node-Baum)
+        self.root_state = None    # Wurzelzustand der letzten Suche
+        self.reused_visits = 0    # aus der letzten Suche übernommene Besuche der aktuellen Wurzel
+        # count_reused: übernommene Besuche (etwa aus dem Pondern) zählen auf 'simulations' an, sodass
+        # make_move nur noch die fehlenden Iterationen rechnet; sonst kommen sie zusätzlich hinzu
+        self.count_reused = count_reused
+        # Root-Parallelisierung: mit workers > 1 durchsuchen ebenso viele Prozesse dieselbe Wurzel mit
+        # verschiedenen Seeds und gleichem Budget; ihre Wurzelstatistiken werden summiert. Das Budget
+        # (auch aus use_clock) berechnet der Hauptprozess, die Worker sehen game.timers nicht.
+        self.workers = workers
+        self.pool = None          # ProcessPoolExecutor, beim ersten parallelen Zug angelegt
+        self.root_stats = None    # summierte Wurzelstatistik (2, cells) des letzten parallelen Zugs
+        self.worker_config = dict(
+            simulations=simulations, adaptive=adaptive, evaluation=evaluation, batched=batched,
+            relevance_slack=relevance_slack, array_tree=array_tree, max_nodes=max_nodes,
+            bias_weight=bias_weight, playout=playout, rave_k=rave_k, reuse_tree=False, batch_size=batch_size,
+            vc_filter=vc_filter,
+        )
 
     def make_move(self, game):
         """
         Wandelt den aktuellen Spielzustand in eine HexState um, baut den MCTS-Baum auf
-        und gibt nach den Simulationen den besten Zug zurück.
+        und gibt nach den Simulationen den besten Zug zurück. Steht die Stellung im
+        Eröffnungsbuch, wird dessen Zug ohne Suche gespielt; im Endspiel wird ein vom Solver
+        bewiesener Gewinnzug gespielt.
+        """
+        if self.opening_book is not None or self.solver is not None:
+            state = HexState(game.matrix, game.current_player, game.num_emptyTiles, game.NUM_ROWS, game.NUM_COLS)
+            entry = self.opening_book.lookup(state) if self.opening_book is not None else None
+            if entry is not None:
+                return entry[0]
+            move = self.solved_move(state)
+            if move is not None:
+                return move
+        if self.workers > 1:
+            return self.parallel_move(game)
+        iteration = self.prepare_search(game, game.current_player)
+        self.run(iteration, self.move_budget(game))
+        return self.best_move()
+
+    def solved_move(self, state):
+        """
+        Gewinnzug aus dem Endspiel-Solver oder None (wie MinimaxAgent.solved_move).
+        """
+        if self.solver is None or state.num_empty > self.solver_threshold:
+            return None
+        result = self.solver.solve(state)
+        if result is None or result[0] != state.current_player:
+            return None
+        return result[1]
+
+    def move_budget(self, game):
+        """
+        Zeitbudget in Sekunden für diesen Zug oder None für eine feste Anzahl Simulationen.
+        """
+        budget = self.time_limit
+        if self.use_clock:
+            remaining = game.timers[game.current_player]
+            if remaining != float('inf'):
+                own_moves_left = max(1, game.num_emptyTiles // 2)
+                clock_budget = remaining / own_moves_left
+                budget = clock_budget if budget is None else min(budget, clock_budget)
+        return budget
+
+    def ponder(self, game, stop):
+        """
+        Sucht während der Bedenkzeit des Gegners (game.current_player ist der Gegner) weiter, bis
+        'stop' (threading.Event) gesetzt wird. Der Baum bleibt erhalten; das nächste make_move
+        übernimmt über die Baumwiederverwendung den Teilbaum unter dem tatsächlich gespielten Zug.
+        """
+        if self.workers > 1 or not self.reuse_tree:
+            return
+        player = 'blue' if game.current_player == 'red' else 'red'
+        iteration = self.prepare_search(game, player)
+        while not stop.is_set():
+            iteration()
+
+    def prepare_search(self, game, player):
+        """
+        Setzt die Wurzel auf die Stellung in 'game' (bei passender Vorgängerstellung mit dem
+        wiederverwendeten Teilbaum) und liefert die Funktion für eine Iteration aus Sicht von 'player'.
         """
         root_state = HexState(game.matrix, game.current_player, game.num_emptyTiles, game.NUM_ROWS, game.NUM_COLS)
-        root_node = Node(root_state)
-        player = game.current_player  # Spieler, für den der Zug berechnet wird
+        moves = moves_between(self.root_state, root_state) if self.reuse_tree else None
+        self.root_state = root_state
+        if self.tree is not None:
+            if not self.reuse_array_tree(root_state, moves):
+                self.tree.clear()
+            elif self.vc_filter:
+                self.filter_array_root(root_state)
+            self.reused_visits = int(self.tree.visits[0])
+            return lambda: self.array_iteration(root_state, player)
 
-        if self.time_limit is not None:
-            end_time = time.time() + self.time_limit
-            while time.time() < end_time:
-                self.mcts_iteration(root_node, player)
-        else:
-            for _ in range(self.simulations):
-                self.mcts_iteration(root_node, player)
-        
-        if root_node.children:
-            best_child = max(root_node.children, key=lambda child: child.visits)
+        root_node = self.reusable_root(root_state, moves)
+        if root_node is None:
+            root_node = Node(root_state, relevance_slack=self.relevance_slack)
+        if self.vc_filter:
+            # Auch eine wiederverwendete Wurzel wurde als innerer Knoten ungefiltert angelegt
+            root_node.untried_moves = self.root_filter(root_state, root_node.untried_moves)
+        self.root = root_node
+        self.reused_visits = root_node.visits
+        return lambda: self.mcts_iteration(root_node, player)
+
+    def best_move(self):
+        """
+        Meistbesuchter Zug an der aktuellen Wurzel.
+        """
+        if self.tree is not None:
+            return self.array_best_move(self.root_state)
+        if self.root.children:
+            best_child = max(self.root.children, key=lambda child: child.visits)
             return best_child.move
         else:
             # Fallback: Wähle einen zufälligen Zug, wenn keine Erweiterung erfolgt ist.
+            possible_moves = self.root_state.get_possible_moves()
+            return random.choice(possible_moves) if possible_moves else None
+
+    def parallel_move(self, game):
+        """
+        Root-parallele Suche: jeder Worker erhält nur die Wurzelstellung und liefert ein
+        (2, cells)-Array mit Besuchen und Siegen der Wurzelkinder zurück.
+        """
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        budget = self.move_budget(game)
+        futures = [
+            self.pool.submit(root_search, self.worker_config, budget, game.matrix, game.current_player,
+                             game.num_emptyTiles, game.NUM_ROWS, game.NUM_COLS, random.getrandbits(32))
+            for _ in range(self.workers)
+        ]
+        self.root_stats = sum(future.result() for future in futures)
+        root_state = HexState(game.matrix, game.current_player, game.num_emptyTiles, game.NUM_ROWS, game.NUM_COLS)
+        visits = self.root_stats[0]
+        if not visits.any():
             possible_moves = root_state.get_possible_moves()
             return random.choice(possible_moves) if possible_moves else None
+        return root_state.topology.coords[int(visits.argmax())]
+
+    def close(self):
+        # Worker-Prozesse der root-parallelen Suche beenden
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def root_statistics(self):
+        """
+        Besuche (Zeile 0) und Siege (Zeile 1) der Wurzelkinder der letzten Suche,
+        indiziert über den Feldindex y * cols + x; nicht expandierte Züge bleiben 0.
+        """
+        topology = self.root_state.topology
+        stats = np.zeros((2, topology.cells))
+        if self.tree is not None:
+            if self.tree.is_expanded(0):
+                children = self.tree.children(0)
+                moves = self.tree.move[children.start:children.stop]
+                stats[0, moves] = self.tree.visits[children.start:children.stop]
+                stats[1, moves] = self.tree.wins[children.start:children.stop]
+        elif self.root is not None:
+            for child in self.root.children:
+                index = topology.index[child.move]
+                stats[0, index] = child.visits
+                stats[1, index] = child.wins
+        return stats
+
+    def reusable_root(self, root_state, moves):
+        """
+        Folgt 'moves' (siehe moves_between) von der letzten Wurzel aus und liefert
+        den passenden Knoten als neue Wurzel, oder None. Der Rest des alten Baums wird freigegeben.
+        """
+        node = self.root
+        if node is None or moves is None:
+            return None
+        for move in moves:
+            node = next((child for child in node.children if child.move == move), None)
+            if node is None:
+                return None
+        if node.state.hash != root_state.hash:
+            return None
+        node.parent = None
+        return node
+
+    def reuse_array_tree(self, root_state, moves):
+        """
+        Wie reusable_root für den ArrayTree: der gefundene Teilbaum wird per reroot an den
+        Pufferanfang verschoben. Liefert False, wenn nichts wiederverwendet werden kann.
+        """
+        if moves is None or self.tree.size <= 1:
+            return False
+        tree = self.tree
+        index = root_state.topology.index
+        node = 0
+        for move in moves:
+            if not tree.is_expanded(node):
+                return False
+            node = tree.find_child(node, index[move])
+            if node is None:
+                return False
+        tree.reroot(node)
+        return True
+
+    def filter_array_root(self, root_state):
+        """
+        vc_filter für die wiederverwendete Wurzel des ArrayTree: unbesuchte Kinder außerhalb des
+        Filters werden entfernt, bereits besuchte behalten ihre Statistik.
+        """
+        tree = self.tree
+        if not tree.is_expanded(0):
+            return  # die Expansion der Wurzel filtert selbst
+        children = np.asarray(tree.children(0))
+        coords = root_state.topology.coords
+        moves = [coords[tree.move[child]] for child in children]
+        allowed = set(self.root_filter(root_state, moves))
+        keep = (tree.visits[children] > 0) | np.array([move in allowed for move in moves])
+        tree.retain_children(0, keep)
+
+    def run(self, iteration, budget=None):
+        """
+        Führt Iterationen aus: mit 'budget' (Sekunden) bis zum Ablauf der Zeit, sonst 'simulations'
+        Iterationen. Mit adaptive wird alle CHECK_INTERVAL Iterationen geprüft, ob die Entscheidung
+        schon feststeht, und am Ende einmalig verlängert, wenn die besten zwei Züge knapp liegen.
+        """
+        self.iterations = 0
+        if budget is not None:
+            start = time.time()
+            end_time = start + budget
+            extended = False
+            while True:
+                now = time.time()
+                if now >= end_time:
+                    if self.adaptive and not extended and self.is_close():
+                        end_time += EXTENSION * budget
+                        extended = True
+                        continue
+                    break
+                iteration()
+                self.iterations += 1
+                if self.adaptive and self.iterations % CHECK_INTERVAL == 0:
+                    # verbleibende Iterationen aus der bisherigen Rate schätzen
+                    rate = self.iterations / max(time.time() - start, 1e-9)
+                    if self.is_decided(rate * (end_time - time.time())):
+                        break
+        else:
+            simulations = self.simulations
+            if self.count_reused:
+                simulations -= self.reused_visits // self.playouts_per_leaf
+            limit = max(0, simulations)
+            extended = False
+            while True:
+                if self.iterations >= limit:
+                    if self.adaptive and not extended and self.is_close():
+                        limit += int(EXTENSION * self.simulations)
+                        extended = True
+                        continue
+                    break
+                iteration()
+                self.iterations += 1
+                if self.adaptive and self.iterations % CHECK_INTERVAL == 0 \
+                        and self.is_decided(limit - self.iterations):
+                    break
+
+    def top_two_visits(self):
+        visits = self.root_statistics()[0]
+        if len(visits) < 2:
+            return (visits.max() if len(visits) else 0), 0
+        second, best = np.partition(visits, -2)[-2:]
+        return best, second
+
+    def is_decided(self, remaining_iterations):
+        """
+        True, wenn der zweitbeste Wurzelzug den besten auch mit allen restlichen Playouts nicht
+        mehr einholen kann.
+        """
+        best, second = self.top_two_visits()
+        return best - second > remaining_iterations * self.playouts_per_leaf
+
+    def is_close(self):
+        best, second = self.top_two_visits()
+        return best > 0 and second >= CLOSE_RATIO * best
+
+    def array_iteration(self, state, player):
+        """
+        Eine MCTS-Iteration auf dem ArrayTree. 'state' ist der Wurzelzustand: der Pfad wird darin
+        in place nachgespielt und vor dem Backpropagate wieder zurückgenommen.
+        """
+        tree = self.tree
+        coords = state.topology.coords
+        node = 0
+        path = [0]
+        # SELECTION
+        while tree.num_children[node] > 0:
+            node = tree.select_child(node, 1.0, self.bias_weight, self.rave_k)
+            state.make_move(coords[tree.move[node]])
+            path.append(node)
+        # EXPANSION: Blätter werden beim zweiten Besuch (die Wurzel sofort) vollständig expandiert
+        if not state.is_terminal() and (node == 0 or tree.visits[node] > 0):
+            if tree.expand(node, *self.expansion(state)):
+                node = tree.first_child[node]
+                state.make_move(coords[tree.move[node]])
+                path.append(node)
+        # SIMULATION
+        if self.rave_k is None:
+            result = self.rollout(state, player)
+            played = None
+        else:
+            result, red, blue = self.simulate(state, player)
+            topology = state.topology
+            played = (stone_array(red, topology).ravel(), stone_array(blue, topology).ravel())
+        for _ in range(len(path) - 1):
+            state.unmake_move()
+        if state.current_player != player:
+            # Beim Pondern zieht an der Wurzel der Gegner; der Baum zählt aus Sicht des Wurzelspielers
+            result = self.playouts_per_leaf - result
+        if played is not None and state.to_move == 1:
+            played = played[::-1]
+        # BACKPROPAGATION
+        tree.backpropagate(path, result, played, self.playouts_per_leaf)
+
+    def expansion(self, state):
+        """
+        Feldindizes der Kandidatenzüge in zufälliger Reihenfolge (bestimmt die Besuchsreihenfolge
+        der noch unbesuchten Kinder) und ihre Priors aus Sicht des Spielers am Zug (oder None).
+        """
+        if self.relevance_slack is None:
+            moves = list(state.get_possible_moves())
+        else:
+            moves = relevant_moves(state, self.relevance_slack)
+        if self.vc_filter and not state.history:
+            moves = self.root_filter(state, moves)  # nur an der Wurzel (Wurzelzustand ohne nachgespielte Züge)
+        random.shuffle(moves)
+        index = state.topology.index
+        indices = [index[move] for move in moves]
+        if not self.bias_weight:
+            return indices, None
+        mover = state.current_player
+        if self.batched:
+            scores = dict(zip(*evaluate_children(state, mover)))
+            priors = [scores[move] for move in moves]
+        else:
+            priors = [evaluate_move(state, move, mover, self.evaluation, self.eval_cache) for move in moves]
+        return indices, priors
+
+    def array_best_move(self, state):
+        tree = self.tree
+        if tree.is_expanded(0):
+            return state.topology.coords[tree.move[tree.most_visited_child(0)]]
+        possible_moves = state.get_possible_moves()
+        return random.choice(possible_moves) if possible_moves else None
 
     def mcts_iteration(self, root, player):
         # SELECTION: Gehe entlang des Baumes
         node = root
         while node.children and node.is_fully_expanded():
-            node = node.best_child(c_param=1.0, player=player)
+            node = node.best_child(c_param=1.0, bias_weight=self.bias_weight, rave_k=self.rave_k)
         # EXPANSION: Falls der Knoten nicht terminal ist, erweitern wir den Baum
         if not node.state.is_terminal():
-            child = node.expand()
+            child = node.expand(self.evaluation, self.eval_cache, with_prior=self.bias_weight != 0)
             if child is not None:
                 node = child
         # SIMULATION (Rollout) mit heuristikgestützter, epsilon-greedy Auswahl
-        result = self.rollout(node.state, player)
+        if self.rave_k is None:
+            result = self.rollout(node.state, player)
+            stones = None
+        else:
+            result, red, blue = self.simulate(node.state, player)
+            stones = (red, blue)
         # BACKPROPAGATION: Ergebnisse zurück propagieren
-        self.backpropagate(node, result, player)
+        self.backpropagate(node, result, player, stones, self.playouts_per_leaf)
 
     def rollout(self, state, player):
+        return self.simulate(state, player)[0]
+
+    def simulate(self, state, player):
+        """
+        Playout ab 'state'. Liefert (Ergebnis aus Sicht von 'player', rote Steine, blaue Steine)
+        mit den Bitmasken der Stellung am Ende des Playouts (für RAVE). Mit BATCHED_FILL ist das
+        Ergebnis die Zahl der Siege aus playouts_per_leaf Playouts, ohne Steine.
+        """
+        if self.playout == BATCHED_FILL:
+            red_wins, _ = batched_random_fill(state, self.playouts_per_leaf, self.rng)
+            wins = int(red_wins.sum())
+            return (wins if player == 'red' else self.playouts_per_leaf - wins), None, None
+        if self.playout == RANDOM_FILL:
+            winner, red = random_fill(state)
+            return (1 if winner == player else 0), red, state.topology.full & ~red
+        # Einmalige Kopie pro Rollout, danach wird nur noch in place gezogen.
         current_state = state.clone()
         rollout_depth = 20  # Maximale Tiefe für Rollouts
         depth = 0
@@ -102,35 +581,60 @@ class MCTSAgent:
                 break
             if random.random() < epsilon:
                 move = random.choice(possible_moves)
+            elif self.batched:
+                moves, scores = evaluate_children(current_state, player)
+                best = int(scores.argmax())
+                move = moves[best] if scores[best] > -float('inf') else random.choice(possible_moves)
             else:
                 best_eval = -float('inf')
                 best_move = None
                 for move_candidate in possible_moves:
-                    next_state = current_state.apply_move(move_candidate)
-                    eval_value = evaluate_state(next_state, player)
+                    eval_value = evaluate_move(current_state, move_candidate, player, self.evaluation, self.eval_cache)
                     if eval_value > best_eval:
                         best_eval = eval_value
                         best_move = move_candidate
                 move = best_move if best_move is not None else random.choice(possible_moves)
-            current_state = current_state.apply_move(move)
+            current_state.make_move(move)
             depth += 1
-            current_eval = evaluate_state(current_state, player)
+            current_eval = evaluate_state(current_state, player, self.evaluation, self.eval_cache)
             if current_eval == float('inf'):
-                return 1
+                return 1, current_state.red, current_state.blue
             elif current_eval == -float('inf'):
-                return 0
+                return 0, current_state.red, current_state.blue
         if current_state.is_terminal():
-            return 1 if current_state.check_win(player) else 0
-        return 1 if evaluate_state(current_state, player) > 0 else 0
+            result = 1 if current_state.check_win(player) else 0
+        else:
+            result = 1 if evaluate_state(current_state, player, self.evaluation, self.eval_cache) > 0 else 0
+        return result, current_state.red, current_state.blue
 
-    def backpropagate(self, node, result, player):
+    def backpropagate(self, node, result, player, stones=None, count=1):
+        """
+        Überträgt das Ergebnis auf den Pfad bis zur Wurzel: 'result' Siege für 'player' aus
+        'count' Playouts. Mit stones = (rote, blaue Steine am
+        Ende des Playouts) werden zusätzlich die AMAF-Zähler aller Kinder der Pfadknoten
+        aktualisiert: ein Feld, das im Knoten frei war und am Ende die Farbe des dort ziehenden
+        Spielers trägt, wurde von diesem Spieler später gespielt.
+        """
+        if stones is not None:
+            index = node.state.topology.index
+            ancestor = node
+            while ancestor is not None:
+                mover = ancestor.state.current_player
+                played = stones[0 if mover == 'red' else 1]
+                amaf_result = result if mover == player else 1 - result
+                for child in ancestor.children:
+                    if played >> index[child.move] & 1:
+                        child.amaf_visits += 1
+                        child.amaf_wins += amaf_result
+                ancestor = ancestor.parent
         while node is not None:
-            node.visits += 1
+            node.visits += count
             if node.parent is not None:
-                if node.parent.state.current_player != player:
+                # wins zählt aus Sicht des Spielers, der den Zug in den Knoten gespielt hat
+                if node.parent.state.current_player == player:
                     node.wins += result
                 else:
-                    node.wins += (1 - result)
+                    node.wins += (count - result)
             else:
                 node.wins += result
             node = node.parent
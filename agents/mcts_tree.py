@@ -0,0 +1,211 @@
+import math
+import numpy as np
+
+
+class ArrayTree:
+    """
+    MCTS-Baum als Struct-of-Arrays in vorab allozierten NumPy-Puffern statt einzelner Node-Objekte.
+
+    Knoten werden über ihren Index angesprochen, Knoten 0 ist die Wurzel. Die Kinder eines Knotens
+    liegen zusammenhängend in [first_child, first_child + num_children) und werden bei der
+    Expansion alle auf einmal angelegt. Zustände werden nicht gespeichert, sondern beim Abstieg
+    aus den Zügen ab der Wurzel nachgespielt. Ist max_nodes erreicht, wird nicht mehr expandiert;
+    die Suche läuft dann mit Rollouts an den vorhandenen Blättern weiter.
+
+    Attributes
+    ----------
+    visits, wins: np.ndarray (float64)
+        Besuche und Siege aus Sicht des Spielers, der den Zug in den Knoten gespielt hat
+    prior: np.ndarray (float64)
+        bei der Expansion berechnete statische Bewertung aus Sicht desselben Spielers
+    amaf_visits, amaf_wins: np.ndarray (float64)
+        RAVE/AMAF-Zähler: Simulationen durch den Elternknoten, in denen derselbe Spieler das Feld
+        später belegt hat, und deren Siege
+    parent, first_child, num_children: np.ndarray (int32)
+        Baumstruktur; first_child ist -1 für nicht expandierte Knoten
+    move: np.ndarray (int16)
+        Feldindex (y * cols + x) des Zugs, der zum Knoten geführt hat
+    size: int
+        Anzahl belegter Knoten
+    """
+    BYTES_PER_NODE = 8 + 8 + 8 + 8 + 8 + 4 + 4 + 4 + 2
+
+    def __init__(self, max_nodes=1 << 20):
+        self.max_nodes = max_nodes
+        self.visits = np.zeros(max_nodes, dtype=np.float64)
+        self.wins = np.zeros(max_nodes, dtype=np.float64)
+        self.prior = np.zeros(max_nodes, dtype=np.float64)
+        self.amaf_visits = np.zeros(max_nodes, dtype=np.float64)
+        self.amaf_wins = np.zeros(max_nodes, dtype=np.float64)
+        self.parent = np.zeros(max_nodes, dtype=np.int32)
+        self.first_child = np.zeros(max_nodes, dtype=np.int32)
+        self.num_children = np.zeros(max_nodes, dtype=np.int32)
+        self.move = np.zeros(max_nodes, dtype=np.int16)
+        self.size = 0
+        self.clear()
+
+    @classmethod
+    def from_budget(cls, megabytes):
+        """
+        Baum mit so vielen Knoten, wie in 'megabytes' MB Puffer passen.
+        """
+        return cls(max(1, int(megabytes * 2 ** 20) // cls.BYTES_PER_NODE))
+
+    @property
+    def nbytes(self):
+        return self.max_nodes * self.BYTES_PER_NODE
+
+    def clear(self):
+        # Nur die Wurzel neu anlegen; alle anderen Einträge werden bei der Expansion initialisiert.
+        self.size = 1
+        self.visits[0] = 0
+        self.wins[0] = 0
+        self.prior[0] = 0
+        self.parent[0] = -1
+        self.first_child[0] = -1
+        self.num_children[0] = 0
+        self.move[0] = -1
+
+    def find_child(self, node, move):
+        """
+        Index des Kindes von 'node' mit Feldindex 'move' oder None.
+        """
+        start = self.first_child[node]
+        hits = np.flatnonzero(self.move[start:start + self.num_children[node]] == move)
+        return start + int(hits[0]) if hits.size else None
+
+    def reroot(self, node):
+        """
+        Macht 'node' zur neuen Wurzel: sein Teilbaum wird an den Anfang der Puffer verschoben,
+        alle übrigen Knoten werden freigegeben. Die Kind-Blöcke bleiben zusammenhängend, da
+        der Teilbaum ebenenweise Block für Block kopiert wird.
+        """
+        if node == 0:
+            return
+        order = [np.array([node], dtype=np.intp)]
+        level = order[0]
+        while level.size:
+            parents = level[self.num_children[level] > 0]
+            if not parents.size:
+                break
+            counts = self.num_children[parents].astype(np.intp)
+            starts = self.first_child[parents].astype(np.intp)
+            # Alle Kind-Blöcke der Ebene aneinanderhängen: start + 0..count-1 je Elternknoten
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            level = np.repeat(starts, counts) + offsets
+            order.append(level)
+        order = np.concatenate(order)
+        size = order.size
+        new_index = np.full(self.size, -1, dtype=np.int32)
+        new_index[order] = np.arange(size, dtype=np.int32)
+        for values in (self.visits, self.wins, self.prior, self.amaf_visits, self.amaf_wins,
+                       self.num_children, self.move):
+            values[:size] = values[order]
+        first_child = self.first_child[order]
+        parent = self.parent[order]
+        self.first_child[:size] = np.where(first_child >= 0, new_index[np.maximum(first_child, 0)], -1)
+        self.parent[:size] = new_index[np.maximum(parent, 0)]
+        self.parent[0] = -1
+        self.size = size
+
+    def retain_children(self, node, keep):
+        """
+        Behält nur die Kinder von 'node', für die 'keep' (bool-Array über den Kind-Bereich) gilt.
+        Sie rücken an den Blockanfang; die frei werdenden Einträge bleiben bis zum nächsten
+        reroot oder clear ungenutzt.
+        """
+        start = self.first_child[node]
+        old = start + np.flatnonzero(keep)
+        new = np.arange(start, start + old.size)
+        for values in (self.visits, self.wins, self.prior, self.amaf_visits, self.amaf_wins,
+                       self.parent, self.first_child, self.num_children, self.move):
+            values[new] = values[old]
+        # Die Kinder verschobener Knoten zeigen auf deren neuen Index
+        for target in new[(old != new) & (self.num_children[new] > 0)]:
+            first = self.first_child[target]
+            self.parent[first:first + self.num_children[target]] = target
+        self.num_children[node] = old.size
+
+    def is_expanded(self, node):
+        return self.num_children[node] > 0
+
+    def expand(self, node, moves, priors=None):
+        """
+        Legt für alle Feldindizes in 'moves' Kinder von 'node' an (Reihenfolge wird übernommen),
+        optional mit ihren Priors. Liefert False, wenn das Knotenbudget dafür nicht mehr reicht.
+        """
+        count = len(moves)
+        start = self.size
+        end = start + count
+        if count == 0 or end > self.max_nodes:
+            return False
+        self.visits[start:end] = 0
+        self.wins[start:end] = 0
+        self.prior[start:end] = 0 if priors is None else priors
+        self.amaf_visits[start:end] = 0
+        self.amaf_wins[start:end] = 0
+        self.parent[start:end] = node
+        self.first_child[start:end] = -1
+        self.num_children[start:end] = 0
+        self.move[start:end] = moves
+        self.first_child[node] = start
+        self.num_children[node] = count
+        self.size = end
+        return True
+
+    def children(self, node):
+        start = self.first_child[node]
+        return range(start, start + self.num_children[node])
+
+    def select_child(self, node, c_param=1.0, bias_weight=0.0, rave_k=None):
+        """
+        UCB1 plus progressive bias bias_weight * prior / (visits + 1), vektorisiert über den
+        Kind-Bereich von 'node'; unbesuchte Kinder zuerst (bei Gleichstand das erste, daher
+        werden die Züge vor der Expansion gemischt). Mit rave_k wird die Gewinnrate wie in
+        Node.best_child mit der AMAF-Gewinnrate gemischt.
+        """
+        start = self.first_child[node]
+        end = start + self.num_children[node]
+        visits = self.visits[start:end]
+        unvisited = np.flatnonzero(visits == 0)
+        if unvisited.size:
+            return start + int(unvisited[0])
+        value = self.wins[start:end] / visits
+        if rave_k is not None:
+            amaf_visits = self.amaf_visits[start:end]
+            seen = amaf_visits > 0
+            beta = np.sqrt(rave_k / (3 * visits + rave_k)) * seen
+            value = (1 - beta) * value + beta * self.amaf_wins[start:end] / np.where(seen, amaf_visits, 1)
+        ucb = value + c_param * np.sqrt(math.log(self.visits[node]) / visits)
+        if bias_weight:
+            ucb += bias_weight * self.prior[start:end] / (visits + 1)
+        return start + int(ucb.argmax())
+
+    def most_visited_child(self, node):
+        start = self.first_child[node]
+        return start + int(self.visits[start:start + self.num_children[node]].argmax())
+
+    def backpropagate(self, path, result, played=None, count=1):
+        """
+        'path' ist die Knotenfolge ab der Wurzel, 'result' die Zahl der Siege des Spielers an
+        der Wurzel aus 'count' Playouts. Knoten in ungerader Tiefe wurden von diesem Spieler betreten, alle
+        anderen vom Gegner.
+
+        played: optional (Felder des Wurzelspielers, Felder des Gegners) am Ende des Playouts als
+        bool-Arrays über alle Feldindizes; damit werden die AMAF-Zähler der Kinder aller
+        Pfadknoten aktualisiert (ein im Knoten freies Feld in der Farbe des dort ziehenden
+        Spielers wurde von ihm später gespielt).
+        """
+        if played is not None:
+            for depth, node in enumerate(path):
+                num = self.num_children[node]
+                if num == 0:
+                    continue
+                start = self.first_child[node]
+                hits = start + np.flatnonzero(played[depth % 2][self.move[start:start + num]])
+                self.amaf_visits[hits] += 1
+                self.amaf_wins[hits] += result if depth % 2 == 0 else 1 - result
+        path = np.asarray(path, dtype=np.intp)
+        self.visits[path] += count
+        self.wins[path[1::2]] += result
+        self.wins[path[2::2]] += count - result
@@ -1,27 +1,104 @@
 import math
-from agents.hex_state import HexState, evaluate_state
+import time
+from agents.hex_state import HexState, evaluate_state, evaluate_move, shortest_path_cells, relevant_moves, SHORTEST_PATH, PLAYERS
+from agents.batch_eval import evaluate_children
+from agents.transposition import EXACT, LOWER, UPPER
+from agents.dfpn import DFPNSolver
+from agents.vc_engine import VCFilter
+
+def centre_first(state, moves):
+    """
+    Züge nach Abstand zur Brettmitte sortiert. Da sorted stabil ist (auch mit reverse), entscheidet
+    diese Vorsortierung bei gleicher Bewertung in order_by_evaluation.
+    """
+    rows, cols = state.NUM_ROWS, state.NUM_COLS
+    return sorted(moves, key=lambda move: abs(2 * move[0] - cols + 1) + abs(2 * move[1] - rows + 1))
+
+
+class SearchTimeout(Exception):
+    """Wird intern ausgelöst, wenn das Zeitbudget einer iterativen Vertiefung abgelaufen ist."""
+
 
 class MinimaxAgent:
-    def __init__(self, depth=2):
+    def __init__(self, depth=2, evaluation=SHORTEST_PATH, batched=False, eval_cache=None, transposition_table=None,
+                 time_limit=None, use_clock=False, cheap_ordering=True, relevance_slack=None, opening_book=None,
+                 solver_threshold=None, solver_nodes=100000, vc_filter=False):
         self.depth = depth
+        self.evaluation = evaluation  # SHORTEST_PATH, TWO_DISTANCE oder VIRTUAL_CONNECTION (siehe evaluate_state)
+        self.eval_cache = eval_cache  # optionaler, über Züge/Agenten teilbarer EvalCache
+        # Move-Ordering über evaluate_children (NumPy, alle Nachfolger auf einmal); nur für SHORTEST_PATH
+        self.batched = batched and evaluation == SHORTEST_PATH
+        # optionale TranspositionTable; kann über mehrere make_move-Aufrufe einer Partie geteilt werden
+        self.tt = transposition_table
+        self.nodes = 0  # Anzahl besuchter Knoten der letzten Suche
+        # Iterative Vertiefung: time_limit in Sekunden pro Zug; mit use_clock wird das Budget zusätzlich
+        # auf einen Anteil der Restzeit in game.timers begrenzt. Ohne beides wird fest mit 'depth' gesucht.
+        self.time_limit = time_limit
+        self.use_clock = use_clock
+        self.deadline = None
+        self.pondering = None     # threading.Event, solange ponder läuft; gesetzt = Suche abbrechen
+        self.completed_depth = 0  # Tiefe der letzten vollständig abgeschlossenen Iteration
+        self.pv = []              # Hauptvariante der letzten abgeschlossenen Iteration
+        self.best_moves = {}      # Zobrist-Hash -> bester Zug aus früheren Iterationen (PV-Ordering)
+        # Günstiges Move-Ordering in inneren Knoten (Killer-/History-Heuristik, Felder auf den kürzesten
+        # Pfaden zuerst); die vollständige Bewertung aller Nachfolger erfolgt dann nur noch an der Wurzel.
+        self.cheap_ordering = cheap_ordering
+        # Relevanzzone: mit einer Zahl k werden nur Felder auf höchstens k längeren Verbindungswegen
+        # beider Spieler bzw. die Must-Play-Region durchsucht (siehe relevant_moves); None = alle Felder
+        self.relevance_slack = relevance_slack
+        self.killers = []         # pro Ply bis zu zwei Züge, die zuletzt einen Cutoff ausgelöst haben
+        self.history = {}         # Zug -> Summe von depth² über alle Knoten, in denen er der beste Zug war
+        self.opening_book = opening_book  # optionales OpeningBook; ein Treffer ersetzt die Suche
+        # Endspiel: bei höchstens solver_threshold freien Feldern zuerst exakt per DFPN lösen (Budget
+        # solver_nodes Knoten, Tabelle bleibt über die Partie erhalten); None = kein Solver
+        self.solver_threshold = solver_threshold
+        self.solver = DFPNSolver(max_nodes=solver_nodes) if solver_threshold is not None else None
+        # VC-Zugfilter an der Wurzel: hat der Gegner eine (Semi-)Verbindung der Ränder, werden nur
+        # Züge in deren Trägern gesucht (siehe vc_engine.vc_filter)
+        self.vc_filter = vc_filter
+        self.root_filter = VCFilter()   # VCEngine des Gegners, von Zug zu Zug fortgeschrieben
+        self.root_moves = None    # gefilterte Wurzelzüge des aktuellen make_move (None = ungefiltert)
 
     def make_move(self, game):
         """
         Erzeugt aus dem aktuellen Spiel (game) einen simulierten Zustand.
+        Steht die Stellung im Eröffnungsbuch, wird dessen Zug ohne Suche gespielt; im Endspiel
+        wird ein vom Solver bewiesener Gewinnzug gespielt.
         Falls ein direkter Gewinnzug (für den Agenten) möglich ist, wird dieser direkt gewählt.
         Andernfalls wird mittels Minimax der beste Zug berechnet.
         Falls Minimax keinen Zug zurückgibt (z.B. weil alle Züge sehr schlecht sind),
         wird als Fallback der erste verfügbare Zug gewählt.
         """
         state = HexState(game.matrix, game.current_player, game.num_emptyTiles, game.NUM_ROWS, game.NUM_COLS)
+        self.nodes = 0
+        if self.opening_book is not None:
+            entry = self.opening_book.lookup(state)
+            if entry is not None:
+                return entry[0]
+        self.best_moves = {}
+        self.killers = []
+        self.history = {}
+        if self.tt is not None:
+            self.tt.new_search()
         
         # Prüfe, ob ein direkter Gewinnzug möglich ist
         for move in state.get_possible_moves():
-            new_state = state.apply_move(move)
-            if new_state.is_terminal():
+            state.make_move(move)
+            terminal = state.is_terminal()
+            state.unmake_move()
+            if terminal:
                 return move
 
-        best_move, _ = self.minimax(state, self.depth, -math.inf, math.inf, True, game.current_player)
+        move = self.solved_move(state)
+        if move is not None:
+            return move
+        self.root_moves = self.root_filter(state, list(state.get_possible_moves())) if self.vc_filter else None
+
+        budget = self.move_budget(game)
+        if budget is None:
+            best_move, _ = self.minimax(state, self.depth, -math.inf, math.inf, True, game.current_player)
+        else:
+            best_move = self.iterative_deepening(state, game.current_player, budget)
         if best_move is None:
             # Fallback: Wähle den ersten möglichen Zug
             possible_moves = state.get_possible_moves()
@@ -29,45 +106,267 @@ class MinimaxAgent:
                 best_move = possible_moves[0]
         return best_move
 
-    def minimax(self, state, depth, alpha, beta, maximizingPlayer, player):
+    def solved_move(self, state):
+        """
+        Gewinnzug aus dem Endspiel-Solver oder None (Solver aus, zu viele freie Felder, Budget zu
+        klein oder Stellung verloren; dann entscheidet die normale Suche).
+        """
+        if self.solver is None or state.num_empty > self.solver_threshold:
+            return None
+        result = self.solver.solve(state)
+        if result is None or result[0] != state.current_player:
+            return None
+        return result[1]
+
+    def move_budget(self, game):
+        """
+        Zeitbudget in Sekunden für diesen Zug oder None für eine Suche mit fester Tiefe.
+        """
+        budget = self.time_limit
+        if self.use_clock:
+            remaining = game.timers[game.current_player]
+            if remaining != float('inf'):
+                # Restzeit gleichmäßig auf die voraussichtlich noch eigenen Züge verteilen
+                own_moves_left = max(1, game.num_emptyTiles // 2)
+                clock_budget = remaining / own_moves_left
+                budget = clock_budget if budget is None else min(budget, clock_budget)
+        return budget
+
+    def iterative_deepening(self, state, player, budget):
+        """
+        Sucht mit Tiefe 1, 2, 3, ... bis das Budget verbraucht ist und liefert den besten Zug
+        der letzten vollständig abgeschlossenen Tiefe. Jede Iteration sortiert die Züge entlang
+        der Hauptvariante (und aller übrigen besten Züge) der vorherigen Iteration vor.
+        Reicht das Budget nicht einmal für Tiefe 1, gilt der beste Zug der statischen
+        Wurzelbewertung (siehe static_best_move), die ebenfalls innerhalb des Budgets bleibt.
+        """
+        self.deadline = time.perf_counter() + budget
+        self.completed_depth = 0
+        self.pv = []
+        best_move = self.static_best_move(state, player, self.deadline)
+        try:
+            for depth in range(1, state.num_empty + 1):
+                move, value = self.minimax(state, depth, -math.inf, math.inf, True, player)
+                best_move = move
+                self.completed_depth = depth
+                self.pv = self.principal_variation(state, depth)
+                # Entschiedene Stellung oder Budget erschöpft: keine weitere Iteration beginnen
+                if abs(value) == math.inf or time.perf_counter() >= self.deadline:
+                    break
+        except SearchTimeout:
+            # Abgebrochene Iteration verwerfen und den Zustand zurücksetzen
+            while state.history:
+                state.unmake_move()
+        finally:
+            self.deadline = None
+        return best_move
+
+    def static_best_move(self, state, player, deadline):
+        """
+        Bester Wurzelzug nach Bewertung der Nachfolger ohne Suche, in der Reihenfolge von der
+        Brettmitte nach außen; bei gleicher Bewertung (etwa auf dem leeren Brett) gewinnt der
+        zentralere Zug. Nach 'deadline' (perf_counter) wird die Bewertung abgebrochen und der
+        beste bis dahin bewertete Zug geliefert (mindestens der zentralste).
+        """
+        moves = centre_first(state, self.candidate_moves(state, 0))
+        if not moves:
+            return None
+        if self.batched:
+            return self.order_by_evaluation(state, moves, True, player)[0]
+        best_move, best_value = moves[0], -math.inf
+        for move in moves:
+            if time.perf_counter() > deadline:
+                break
+            value = evaluate_move(state, move, player, self.evaluation, self.eval_cache)
+            if value > best_value:
+                best_move, best_value = move, value
+        return best_move
+
+    def candidate_moves(self, state, ply):
+        # An der Wurzel die gefilterten Züge (vc_filter), sonst alle bzw. die Relevanzzone
+        if ply == 0 and self.root_moves is not None:
+            return list(self.root_moves)
+        if self.relevance_slack is None:
+            return state.get_possible_moves()
+        return relevant_moves(state, self.relevance_slack)
+
+    def ponder(self, game, stop):
+        """
+        Sucht während der Bedenkzeit des Gegners (game.current_player ist der Gegner) mit iterativer
+        Vertiefung, bis 'stop' (threading.Event) gesetzt wird. Die Ergebnisse bleiben in der
+        Transpositionstabelle und liefern dem nächsten make_move Werte und beste Züge für die
+        Stellungen nach jeder Antwort; ohne Tabelle gibt es nichts zu behalten.
+        """
+        if self.tt is None:
+            return
+        state = HexState(game.matrix, game.current_player, game.num_emptyTiles, game.NUM_ROWS, game.NUM_COLS)
+        player = 'blue' if game.current_player == 'red' else 'red'
+        self.root_moves = None
+        self.best_moves = {}
+        self.killers = []
+        self.history = {}
+        self.tt.new_search()
+        self.pondering = stop
+        self.deadline = math.inf
+        try:
+            for depth in range(1, state.num_empty + 1):
+                _, value = self.minimax(state, depth, -math.inf, math.inf, False, player)
+                if abs(value) == math.inf or stop.is_set():
+                    break
+        except SearchTimeout:
+            while state.history:
+                state.unmake_move()
+        finally:
+            self.deadline = None
+            self.pondering = None
+
+    def principal_variation(self, state, depth):
+        pv = []
+        while len(pv) < depth and not state.is_terminal():
+            move = self.best_moves.get(state.hash)
+            if move is None or move not in state.get_possible_moves():
+                break
+            pv.append(move)
+            state.make_move(move)
+        for _ in pv:
+            state.unmake_move()
+        return pv
+
+    def minimax(self, state, depth, alpha, beta, maximizingPlayer, player, ply=0):
+        # 'state' wird per make_move/unmake_move in place durchsucht und ist nach
+        # dem Aufruf wieder im Ausgangszustand. 'ply' ist der Abstand zur Wurzel.
+        self.nodes += 1
+        if self.deadline is not None and (time.perf_counter() > self.deadline
+                                          or self.pondering is not None and self.pondering.is_set()):
+            raise SearchTimeout()
         if depth == 0 or state.is_terminal():
-            return None, evaluate_state(state, player)
+            return None, evaluate_state(state, player, self.evaluation, self.eval_cache)
         
-        moves = state.get_possible_moves()
+        moves = self.candidate_moves(state, ply)
         # Falls keine Züge möglich sind, wird direkt der Heuristik-Wert zurückgegeben.
         if not moves:
-            return None, evaluate_state(state, player)
+            return None, evaluate_state(state, player, self.evaluation, self.eval_cache)
+
+        # Transpositionstabelle: ausreichend tief gesuchte Einträge direkt verwenden bzw.
+        # das Fenster einengen; der gespeicherte beste Zug wird in jedem Fall zuerst probiert.
+        tt_move = None
+        alpha_orig, beta_orig = alpha, beta
+        if self.tt is not None:
+            entry = self.tt.probe(state.hash, player)
+            if entry is not None:
+                tt_depth, tt_value, tt_flag, tt_move = entry
+                if tt_depth >= depth:
+                    if tt_flag == EXACT:
+                        return tt_move, tt_value
+                    if tt_flag == LOWER:
+                        alpha = max(alpha, tt_value)
+                    else:
+                        beta = min(beta, tt_value)
+                    if beta <= alpha:
+                        return tt_move, tt_value
         
-        # Move-Ordering: Sortiere die Züge anhand der heuristischen Bewertung.
-        moves = sorted(
-            moves, 
-            key=lambda move: evaluate_state(state.apply_move(move), player), 
-            reverse=maximizingPlayer
-        )
+        if ply == 0:
+            moves = self.order_by_evaluation(state, centre_first(state, moves), maximizingPlayer, player)
+        elif not self.cheap_ordering:
+            moves = self.order_by_evaluation(state, moves, maximizingPlayer, player)
+        else:
+            moves = self.order_cheaply(state, moves, ply)
+        pv_move = self.best_moves.get(state.hash) if self.deadline is not None else None
+        for first in (tt_move, pv_move):  # zuletzt eingefügt = zuerst probiert
+            if first is not None and first in moves:
+                moves.remove(first)
+                moves.insert(0, first)
         
         best_move = moves[0]  # Setze als initialen Fallback den ersten Zug aus der Liste.
         
         if maximizingPlayer:
             max_eval = -math.inf
             for move in moves:
-                new_state = state.apply_move(move)
-                _, eval = self.minimax(new_state, depth - 1, alpha, beta, False, player)
+                state.make_move(move)
+                _, eval = self.minimax(state, depth - 1, alpha, beta, False, player, ply + 1)
+                state.unmake_move()
                 if eval > max_eval:
                     max_eval = eval
                     best_move = move
                 alpha = max(alpha, eval)
                 if beta <= alpha:
+                    self.record_killer(move, ply)
                     break  # Beta cut-off
+            self.history[best_move] = self.history.get(best_move, 0) + depth * depth
+            self.store(state, depth, max_eval, alpha_orig, beta_orig, best_move, player)
+            self.best_moves[state.hash] = best_move
             return best_move, max_eval
         else:
             min_eval = math.inf
             for move in moves:
-                new_state = state.apply_move(move)
-                _, eval = self.minimax(new_state, depth - 1, alpha, beta, True, player)
+                state.make_move(move)
+                _, eval = self.minimax(state, depth - 1, alpha, beta, True, player, ply + 1)
+                state.unmake_move()
                 if eval < min_eval:
                     min_eval = eval
                     best_move = move
                 beta = min(beta, eval)
                 if beta <= alpha:
+                    self.record_killer(move, ply)
                     break  # Alpha cut-off
+            self.history[best_move] = self.history.get(best_move, 0) + depth * depth
+            self.store(state, depth, min_eval, alpha_orig, beta_orig, best_move, player)
+            self.best_moves[state.hash] = best_move
             return best_move, min_eval
+
+    def order_by_evaluation(self, state, moves, maximizingPlayer, player):
+        # Move-Ordering: Sortiere die Züge anhand der heuristischen Bewertung.
+        if self.batched:
+            scores = dict(zip(*evaluate_children(state, player)))
+            return sorted(moves, key=scores.__getitem__, reverse=maximizingPlayer)
+        def score(move):
+            # Auch die Bewertung aller Nachfolger bleibt im Zeitbudget der iterativen Vertiefung
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise SearchTimeout()
+            return evaluate_move(state, move, player, self.evaluation, self.eval_cache)
+
+        return sorted(moves, key=score, reverse=maximizingPlayer)
+
+    def order_cheaply(self, state, moves, ply):
+        """
+        Statische Reihenfolge ohne Bewertung der Nachfolger: Killer-Züge dieses Plys zuerst,
+        danach Felder, die auf einem kürzesten Pfad beider Spieler liegen (Schnittpunkte vor
+        einfachen Treffern), innerhalb gleicher Klassen nach History-Wert.
+        """
+        index = state.topology.index
+        paths = [shortest_path_cells(state, colour) for colour in PLAYERS]
+        history = self.history
+
+        def key(move):
+            bit = index[move]
+            on_paths = (paths[0] >> bit & 1) + (paths[1] >> bit & 1)
+            return on_paths, history.get(move, 0)
+
+        moves = sorted(moves, key=key, reverse=True)
+        if ply < len(self.killers):
+            for killer in reversed(self.killers[ply]):
+                if killer in moves:
+                    moves.remove(killer)
+                    moves.insert(0, killer)
+        return moves
+
+    def record_killer(self, move, ply):
+        # Killer-Züge: zwei Slots pro Ply, der neueste vorne
+        while len(self.killers) <= ply:
+            self.killers.append([])
+        killers = self.killers[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+
+    def store(self, state, depth, value, alpha, beta, move, player):
+        # Schrankentyp relativ zum ursprünglichen Suchfenster (alpha, beta) des Knotens
+        if self.tt is None:
+            return
+        if value <= alpha:
+            flag = UPPER
+        elif value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.tt.store(state.hash, player, depth, value, flag, move)
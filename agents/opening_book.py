@@ -0,0 +1,109 @@
+import mmap
+import struct
+
+# Dateiformat: Kopf (Kennung, Zeilen, Spalten, Anzahl Einträge), danach die Einträge
+# (kanonischer Hash, Feldindex des besten Zugs, Bewertung) aufsteigend nach Hash sortiert.
+MAGIC = b'HEXBOOK1'
+HEADER = struct.Struct('<8sHHI')
+RECORD = struct.Struct('<QHf')
+KEY = struct.Struct('<Q')
+
+
+def rotated_hash(state):
+    """
+    Zobrist-Hash der um 180° gedrehten Stellung (Feld i -> cells - 1 - i). Die Drehung vertauscht
+    oben/unten und links/rechts und erhält damit Farben und Ziele beider Spieler.
+    """
+    topology = state.topology
+    last = topology.cells - 1
+    value = state.hash
+    for colour, bits in enumerate((state.red, state.blue)):
+        keys = topology.zobrist[colour]
+        while bits:
+            low = bits & -bits
+            index = low.bit_length() - 1
+            value ^= keys[index] ^ keys[last - index]
+            bits ^= low
+    return value
+
+
+def canonical_hash(state):
+    """
+    Liefert (Schlüssel, gedreht): den kleineren der Hashes der Stellung und ihrer 180°-Drehung
+    und ob der Schlüssel zur gedrehten Stellung gehört (Züge sind dann ebenfalls zu drehen).
+    """
+    rotated = rotated_hash(state)
+    if rotated < state.hash:
+        return rotated, True
+    return state.hash, False
+
+
+def write_book(path, rows, cols, entries):
+    """
+    Schreibt ein Eröffnungsbuch. 'entries' enthält (Stellung, bester Zug (x, y), Bewertung aus
+    Sicht des Spielers am Zug); Stellungen, die sich nur durch die Drehung unterscheiden, werden
+    zusammengefasst (der letzte Eintrag gilt).
+    """
+    cells = rows * cols
+    records = {}
+    for state, move, score in entries:
+        key, rotated = canonical_hash(state)
+        index = state.topology.index[move]
+        records[key] = (cells - 1 - index if rotated else index, score)
+    with open(path, 'wb') as book:
+        book.write(HEADER.pack(MAGIC, rows, cols, len(records)))
+        for key in sorted(records):
+            index, score = records[key]
+            book.write(RECORD.pack(key, index, score))
+
+
+class OpeningBook:
+    """
+    Eröffnungsbuch als sortierte Datei fester Satzlänge, gelesen über mmap.
+
+    Es wird nichts vorab geladen; lookup sucht binär direkt im gemappten Speicher und kostet
+    damit nur einige Mikrosekunden. Eine Instanz kann von mehreren Agenten geteilt werden.
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as book:
+            self.data = mmap.mmap(book.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.rows, self.cols, self.count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            self.data.close()
+            raise ValueError(f'{path} is not an opening book')
+        self.hits = 0
+
+    def __len__(self):
+        return self.count
+
+    def lookup(self, state):
+        """
+        Liefert (bester Zug (x, y), Bewertung) für die Stellung oder None.
+        """
+        topology = state.topology
+        if topology.rows != self.rows or topology.cols != self.cols:
+            return None
+        key, rotated = canonical_hash(state)
+        data = self.data
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if KEY.unpack_from(data, HEADER.size + middle * RECORD.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.count:
+            return None
+        found, index, score = RECORD.unpack_from(data, HEADER.size + low * RECORD.size)
+        if found != key:
+            return None
+        if rotated:
+            index = topology.cells - 1 - index
+        move = topology.coords[index]
+        if (state.red | state.blue) >> index & 1:
+            return None  # Hash-Kollision: Zug ist in dieser Stellung nicht spielbar
+        self.hits += 1
+        return move, score
+
+    def close(self):
+        self.data.close()
@@ -0,0 +1,42 @@
+import threading
+from types import SimpleNamespace
+
+
+class Ponderer:
+    """
+    Lässt einen Agenten während der Bedenkzeit des Gegners in einem Hintergrund-Thread
+    weitersuchen (Pondering).
+
+    start(game) wird aufgerufen, sobald der Gegner am Zug ist, stop() vor dem nächsten
+    make_move des Agenten. Der Agent muss ponder(game, stop_event) anbieten und bis zum
+    Setzen des Events suchen; was er dabei aufbaut (Suchbaum, Transpositionstabelle),
+    verwendet sein nächstes make_move weiter. Agenten ohne ponder werden ignoriert.
+    """
+    def __init__(self, agent):
+        self.agent = agent
+        self.thread = None
+        self.stop_event = None
+
+    def start(self, game):
+        self.stop()
+        if not hasattr(self.agent, 'ponder'):
+            return
+        # Eigene Kopie der Stellung: das Spiel wird während des Ponderns weiter verändert
+        snapshot = SimpleNamespace(matrix=[row[:] for row in game.matrix], current_player=game.current_player,
+                                   num_emptyTiles=game.num_emptyTiles, NUM_ROWS=game.NUM_ROWS,
+                                   NUM_COLS=game.NUM_COLS)
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.agent.ponder, args=(snapshot, self.stop_event), daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        Beendet eine laufende Suche und wartet auf den Thread; danach darf der Agent wieder ziehen.
+        """
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        self.stop_event = None
+
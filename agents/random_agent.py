@@ -11,6 +11,11 @@ def make_random_move(game):
     Returns:
     - (x, y): Koordinaten des ausgewählten zufälligen Spielzugs.
     """
+    # Game führt die freien Felder als EmptyCells mit -> Auswahl in O(1)
+    empty_cells = getattr(game, 'emptyCells', None)
+    if empty_cells is not None:
+        return empty_cells.random_move()
+
     empty_tiles = [
         (x, y) for y in range(game.NUM_ROWS)
         for x in range(game.NUM_COLS)
@@ -0,0 +1,51 @@
+# Art des gespeicherten Werts
+EXACT = 0   # exakter Minimax-Wert
+LOWER = 1   # Wert ist eine untere Schranke (Beta-Cutoff)
+UPPER = 2   # Wert ist eine obere Schranke (Alpha-Cutoff)
+
+
+class TranspositionTable:
+    """
+    Transpositionstabelle fester Größe für die Minimax-Suche, adressiert über den Zobrist-Hash.
+
+    Jeder Slot hält (hash, Spieler, Tiefe, Wert, Schrankentyp, bester Zug, Generation).
+    Ersetzt wird tiefenbevorzugt: ein Eintrag aus der aktuellen Suche wird nur von einem
+    mindestens gleich tief gesuchten Eintrag verdrängt; Einträge aus früheren Suchen
+    (ältere Generation) dürfen immer überschrieben werden, bleiben bis dahin aber nutzbar.
+    Die Werte gelten aus Sicht von 'player', deshalb ist der Spieler Teil des Schlüssels.
+    """
+    def __init__(self, size=1 << 18):
+        self.size = size
+        self.slots = [None] * size
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def new_search(self):
+        # Zu Beginn jedes make_move aufrufen, damit alte Einträge ersetzbar werden.
+        self.generation += 1
+
+    def probe(self, key, player):
+        """
+        Liefert (Tiefe, Wert, Schrankentyp, bester Zug) oder None.
+        """
+        entry = self.slots[key % self.size]
+        if entry is None or entry[0] != key or entry[1] != player:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[2], entry[3], entry[4], entry[5]
+
+    def store(self, key, player, depth, value, flag, move):
+        index = key % self.size
+        entry = self.slots[index]
+        if entry is not None and entry[6] == self.generation and depth < entry[2] \
+                and not (entry[0] == key and entry[1] == player):
+            return
+        self.slots[index] = (key, player, depth, value, flag, move, self.generation)
+        self.stores += 1
+
+    def clear(self):
+        self.slots = [None] * self.size
+        self.generation = 0
@@ -0,0 +1,432 @@
+from collections import deque
+
+INF = 10**6
+
+# Begrenzungen der H-Search (sonst wächst die Zahl der Verbindungen auf großen Brettern unbeschränkt)
+MAX_CARRIER = 10   # Träger mit mehr Feldern werden verworfen
+SOFT_LIMIT = 6     # höchstens so viele minimale Träger pro Punktpaar und Verbindungsart
+OR_SIZE = 4        # höchstens so viele Semi-VCs pro Anwendung der ODER-Regel
+
+
+class VCEngine:
+    """
+    H-Search (Anshelevich) über die virtuellen Verbindungen eines Spielers.
+
+    Punkte sind die Gruppen des Spielers (zusammenhängende Steine, Gruppen am Rand gehören zum
+    Randpunkt START bzw. GOAL) und die freien Felder (Punkt = Feldindex). Eine virtuelle
+    Verbindung (VC) zwischen zwei Punkten ist ein Träger (Bitmaske freier Felder), in dem der
+    Spieler die Verbindung auch gegen jeden Gegenzug hält; eine Semi-Verbindung (Semi-VC) hält
+    nur, wenn der Spieler zuerst zieht, und zwar auf ihren Schlüssel.
+
+      - Basis: benachbarte Punkte sind mit leerem Träger verbunden.
+      - UND-Regel: VC(x, z) und VC(z, y) mit disjunkten Trägern ergeben über eine Gruppe z eine
+        VC(x, y), über ein freies Feld z eine Semi-VC(x, y) mit Schlüssel z. Die Ränder dienen
+        nicht als Mittelpunkt.
+      - ODER-Regel: bis zu OR_SIZE Semi-VCs mit leerem Schnitt der Träger ergeben eine VC mit deren
+        Vereinigung.
+
+    Randvorlagen wie Brücke zum Rand oder Ziggurat entstehen dabei aus den Regeln. Pro Paar
+    werden nur minimale Träger (keine Obermengen) bis SOFT_LIMIT und MAX_CARRIER gehalten.
+
+    play(move, player) aktualisiert die Verbindungen inkrementell und liefert (ohne die beiden
+    Begrenzungen) dieselben Verbindungen wie eine Neuberechnung: ein gegnerischer Stein löscht alle
+    Verbindungen, deren Träger oder Endpunkt er trifft; ein eigener Stein verschmilzt die
+    angrenzenden Punkte zu einer Gruppe und leitet von allen dadurch geänderten Verbindungen aus neu
+    ab. Verschmilzt er eine Gruppe mit einem Rand, wird neu berechnet.
+    """
+    def __init__(self, state, player):
+        self.topology = state.topology
+        self.player = player
+        topology = self.topology
+        self.START = topology.cells
+        self.GOAL = topology.cells + 1
+        if player == 'red':
+            self.edges = (topology.top_mask, topology.bottom_mask)
+        else:
+            self.edges = (topology.left_mask, topology.right_mask)
+        self.compute(state.stones(player), topology.full & ~(state.red | state.blue))
+
+    def compute(self, own, free):
+        """
+        Berechnet alle Verbindungen neu für die eigenen Steine 'own' und die freien Felder 'free'.
+        """
+        self.free = free
+        self.full = {}   # (a, b) mit a < b -> Liste von Trägern
+        self.semi = {}   # (a, b) mit a < b -> Liste von (Träger, Schlüssel)
+        self.links = {}  # Punkt -> Menge der Punkte, mit denen eine VC besteht
+        self.point_cells = {}
+        self.group_of = {}  # Feld eines eigenen Steins -> Punkt
+        self.won = False
+        topology = self.topology
+        neighbours = topology.neighbour_masks
+        remaining = own
+        while remaining:
+            # Gruppe per Flutfüllung über die Nachbarmasken
+            group = remaining & -remaining
+            frontier = group
+            while frontier:
+                grown = 0
+                bits = frontier
+                while bits:
+                    low = bits & -bits
+                    grown |= neighbours[low.bit_length() - 1]
+                    bits ^= low
+                frontier = grown & own & ~group
+                group |= frontier
+            remaining &= ~group
+            self.add_group(group)
+        for point in (self.START, self.GOAL):
+            self.point_cells.setdefault(point, 0)
+        queue = deque()
+        for point in list(self.point_cells):
+            self.add_adjacency(point, queue)
+        bits = free
+        while bits:
+            low = bits & -bits
+            self.add_adjacency(low.bit_length() - 1, queue)
+            bits ^= low
+        self.close(queue)
+
+    def add_group(self, group):
+        start, goal = self.edges
+        if group & start and group & goal:
+            self.won = True
+        if group & start:
+            point = self.START
+        elif group & goal:
+            point = self.GOAL
+        else:
+            point = (group & -group).bit_length() - 1
+        self.point_cells[point] = self.point_cells.get(point, 0) | group
+        bits = group
+        while bits:
+            low = bits & -bits
+            self.group_of[low.bit_length() - 1] = point
+            bits ^= low
+        return point
+
+    def neighbourhood(self, point):
+        """
+        Freie Felder, die an den Punkt grenzen (bei den Rändern auch die freien Randfelder).
+        """
+        topology = self.topology
+        if point < topology.cells and self.free >> point & 1:
+            return topology.neighbour_masks[point] & self.free
+        cells = self.point_cells[point]
+        mask = 0
+        while cells:
+            low = cells & -cells
+            mask |= topology.neighbour_masks[low.bit_length() - 1]
+            cells ^= low
+        if point == self.START:
+            mask |= self.edges[0]
+        elif point == self.GOAL:
+            mask |= self.edges[1]
+        return mask & self.free
+
+    def add_adjacency(self, point, queue):
+        bits = self.neighbourhood(point)
+        while bits:
+            low = bits & -bits
+            self.add_full(point, low.bit_length() - 1, 0, queue)
+            bits ^= low
+
+    def is_free_point(self, point):
+        return point < self.topology.cells and self.free >> point & 1
+
+    def add_full(self, a, b, carrier, queue):
+        if a == b or carrier.bit_count() > MAX_CARRIER:
+            return
+        key = (a, b) if a < b else (b, a)
+        carriers = self.full.get(key)
+        if carriers is None:
+            carriers = self.full[key] = []
+            self.links.setdefault(a, set()).add(b)
+            self.links.setdefault(b, set()).add(a)
+        for existing in carriers:
+            if existing & ~carrier == 0:
+                return
+        carriers[:] = [existing for existing in carriers if carrier & ~existing]
+        if len(carriers) >= SOFT_LIMIT:
+            return
+        carriers.append(carrier)
+        queue.append((a, b, carrier))
+
+    def add_semi(self, a, b, carrier, key_cell, queue):
+        if a == b or carrier.bit_count() > MAX_CARRIER:
+            return
+        key = (a, b) if a < b else (b, a)
+        for existing in self.full.get(key, ()):
+            if existing & ~carrier == 0:
+                return  # schon als VC mit kleinerem Träger bekannt
+        semis = self.semi.setdefault(key, [])
+        for existing, _ in semis:
+            if existing & ~carrier == 0:
+                return
+        semis[:] = [entry for entry in semis if carrier & ~entry[0]]
+        if len(semis) >= SOFT_LIMIT:
+            return
+        semis.append((carrier, key_cell))
+        # ODER-Regel über jede Teilmenge aus der neuen und bis zu OR_SIZE - 1 vorhandenen Semi-VCs mit
+        # leerem Schnitt der Träger (nur minimale Teilmengen). Da jede solche Teilmenge spätestens beim
+        # Einfügen ihres letzten Elements gefunden wird, hängt das Ergebnis nicht von der Reihenfolge ab.
+        others = [existing for existing, _ in semis[:-1]]
+
+        def combine(start, common, union, size):
+            for position in range(start, len(others)):
+                other = others[position]
+                if (union | other).bit_count() > MAX_CARRIER:
+                    continue  # größere Teilmengen würden den Träger nur weiter vergrößern
+                if common & other == 0:
+                    self.add_full(a, b, union | other, queue)
+                elif size + 1 < OR_SIZE:
+                    combine(position + 1, common & other, union | other, size + 1)
+
+        combine(0, carrier, carrier, 1)
+
+    def close(self, queue):
+        """
+        UND-Regel bis zum Fixpunkt: jede neue VC wird an beiden Enden mit den dort anliegenden
+        VCs kombiniert.
+        """
+        full = self.full
+        links = self.links
+        free = self.free
+        cells = self.topology.cells  # Punkte ab cells sind die Ränder
+        while queue:
+            a, b, carrier = queue.popleft()
+            size = carrier.bit_count()
+            for centre, end in ((a, b), (b, a)):
+                if centre >= cells:
+                    continue
+                centre_bit = 1 << centre if free >> centre & 1 else 0
+                end_bit = 1 << end if end < cells and free >> end & 1 else 0
+                for other in list(links.get(centre, ())):
+                    if other == end:
+                        continue
+                    if other < cells and carrier >> other & 1:
+                        continue
+                    for second in list(full.get((centre, other) if centre < other else (other, centre), ())):
+                        if second & carrier or second & end_bit:
+                            continue
+                        # Größe des neuen Trägers vorab prüfen, die meisten Kombinationen scheitern hier
+                        if size + second.bit_count() + (centre_bit != 0) > MAX_CARRIER:
+                            continue
+                        if centre_bit:
+                            self.add_semi(end, other, carrier | second | centre_bit, centre, queue)
+                        else:
+                            self.add_full(end, other, carrier | second, queue)
+
+    def point(self, cell):
+        """
+        Punkt eines Felds: die Gruppe bei eigenen Steinen, sonst das Feld selbst.
+        """
+        return self.group_of.get(cell, cell)
+
+    def connections(self, a, b):
+        key = (a, b) if a < b else (b, a)
+        return self.full.get(key, [])
+
+    def semi_connections(self, a, b):
+        key = (a, b) if a < b else (b, a)
+        return self.semi.get(key, [])
+
+    def connected(self):
+        """
+        True, wenn der Spieler die Ränder bereits (virtuell) verbunden hat.
+        """
+        return self.won or bool(self.connections(self.START, self.GOAL))
+
+    def play(self, move, player):
+        """
+        Inkrementelle Aktualisierung nach einem Stein von 'player' auf 'move' (x, y).
+        """
+        index = self.topology.index[move]
+        bit = 1 << index
+        self.free &= ~bit
+        if player != self.player:
+            self.remove_cell(index)
+            return
+        # Eigener Stein: angrenzende Gruppen und Ränder verschmelzen mit dem Feld
+        merged = {index}
+        for neighbour in self.topology.neighbours[index]:
+            if neighbour in self.group_of:
+                merged.add(self.group_of[neighbour])
+        start, goal = self.edges
+        if bit & start:
+            merged.add(self.START)
+        if bit & goal:
+            merged.add(self.GOAL)
+        if merged & {self.START, self.GOAL}:
+            # Verschmilzt die Gruppe mit einem Rand, wären frühere Ableitungen über sie als
+            # Mittelpunkt nun Ableitungen über den Rand, die die H-Search ausschließt: neu berechnen
+            own = bit
+            for cells in self.point_cells.values():
+                own |= cells
+            self.compute(own, self.free)
+            return
+        group = bit
+        for point in merged:
+            group |= self.point_cells.pop(point, 0)
+        new_point = self.add_group(group)
+        # Verbindungen umbenennen: Semi-VCs mit Schlüssel auf dem Feld werden zu VCs, alle anderen
+        # Träger verlieren das Feld (ein eigener Stein im Träger schadet keiner Verbindung). Nur
+        # geänderte Verbindungen (umbenannter Endpunkt, kleinerer Träger) können neue UND-Kombinationen
+        # ergeben und kommen in die Warteschlange; die übrigen wurden schon früher kombiniert.
+        old_full, old_semi = self.full, self.semi
+        self.full, self.semi, self.links = {}, {}, {}
+        queue = deque()
+        unchanged = deque()
+        rename = {point: new_point for point in merged}
+        for (a, b), carriers in old_full.items():
+            renamed = a in rename or b in rename
+            a, b = rename.get(a, a), rename.get(b, b)
+            for carrier in carriers:
+                changed = renamed or carrier & bit
+                self.add_full(a, b, carrier & ~bit, queue if changed else unchanged)
+        for (a, b), semis in old_semi.items():
+            renamed = a in rename or b in rename
+            a, b = rename.get(a, a), rename.get(b, b)
+            for carrier, key_cell in semis:
+                changed = renamed or carrier & bit
+                if key_cell == index:
+                    self.add_full(a, b, carrier & ~bit, queue)
+                else:
+                    self.add_semi(a, b, carrier & ~bit, key_cell, queue if changed else unchanged)
+        # Neue Nachbarschaften der Gruppe, dann UND-Regel ab den geänderten Verbindungen
+        self.add_adjacency(new_point, queue)
+        self.close(queue)
+
+    def remove_cell(self, index):
+        """
+        Gegnerischer Stein auf 'index': alle Verbindungen mit dem Feld als Endpunkt oder im Träger
+        fallen weg. Neue Verbindungen entstehen dabei nicht; die ODER-Regel hat jede Teilmenge der
+        verbleibenden Semi-VCs schon beim Einfügen geprüft.
+        """
+        bit = 1 << index
+        for key in [key for key in self.full if index in key]:
+            del self.full[key]
+        for key in [key for key in self.semi if index in key]:
+            del self.semi[key]
+        for key, carriers in list(self.full.items()):
+            kept = [carrier for carrier in carriers if not carrier & bit]
+            if kept:
+                self.full[key] = kept
+            else:
+                del self.full[key]
+        for key, semis in list(self.semi.items()):
+            kept = [entry for entry in semis if not entry[0] & bit]
+            if kept:
+                self.semi[key] = kept
+            else:
+                del self.semi[key]
+        self.links = {}
+        for a, b in self.full:
+            self.links.setdefault(a, set()).add(b)
+            self.links.setdefault(b, set()).add(a)
+
+    def distance(self):
+        """
+        Kürzester Weg von START nach GOAL über VCs, wobei jedes betretene freie Feld 1 kostet und
+        Gruppen 0: zwei per Brücke verbundene Gruppen haben damit Abstand 0. INF ohne Weg.
+        """
+        if self.connected():
+            return 0
+        dist = {self.START: 0}
+        queue = deque([self.START])
+        while queue:
+            point = queue.popleft()
+            if point == self.GOAL:
+                return dist[point]
+            base = dist[point]
+            for other in self.links.get(point, ()):
+                cost = 1 if self.is_free_point(other) else 0
+                if base + cost < dist.get(other, INF):
+                    dist[other] = base + cost
+                    if cost:
+                        queue.append(other)
+                    else:
+                        queue.appendleft(other)
+        return INF
+
+    def must_play(self):
+        """
+        Bitmaske der Felder, in denen der Gegner ziehen muss, um diese Verbindung der Ränder zu
+        verhindern: Schnitt aller Träger der VCs und Semi-VCs zwischen START und GOAL (bei
+        Semi-VCs einschließlich Schlüssel). 0, wenn es keine solche Verbindung gibt.
+        """
+        carriers = list(self.connections(self.START, self.GOAL))
+        carriers += [carrier for carrier, _ in self.semi_connections(self.START, self.GOAL)]
+        if not carriers:
+            return 0
+        mask = self.topology.full
+        for carrier in carriers:
+            mask &= carrier
+        return mask
+
+
+def vc_evaluation(state, player):
+    """
+    Bewertung aus Sicht von 'player' über die VC-Abstände beider Spieler (Abstand des Gegners
+    minus eigener Abstand, wie bei shortest_path_distance).
+    """
+    opponent = 'blue' if player == 'red' else 'red'
+    return VCEngine(state, opponent).distance() - VCEngine(state, player).distance()
+
+
+def vc_filter(state, moves):
+    """
+    Zugfilter: hat der Gegner des Spielers am Zug eine (Semi-)Verbindung der Ränder, bleiben nur
+    Züge im Schnitt ihrer Träger. Ist der Schnitt leer (verloren) oder gibt es keine solche
+    Verbindung, werden alle Züge zurückgegeben.
+    """
+    opponent = 'blue' if state.current_player == 'red' else 'red'
+    return must_play_moves(state, moves, VCEngine(state, opponent).must_play())
+
+
+def must_play_moves(state, moves, mask):
+    # Züge in 'mask' (siehe VCEngine.must_play), bei leerer Maske alle
+    if not mask:
+        return moves
+    index = state.topology.index
+    return [move for move in moves if mask >> index[move] & 1]
+
+
+class VCFilter:
+    """
+    vc_filter über eine Partie hinweg: hält pro Spieler die VCEngine der zuletzt gefilterten
+    Stellung und schreibt sie mit VCEngine.play um die seitdem gesetzten Steine fort. Neu berechnet
+    wird bei einer fremden Stellung (Steine entfernt, andere Brettgröße) und bei mehr als
+    MAX_PLAYED neuen Steinen, ab denen die Neuberechnung billiger ist.
+    """
+    MAX_PLAYED = 2
+
+    def __init__(self):
+        self.engines = {}   # Spieler -> (red, blue, VCEngine) der zuletzt gesehenen Stellung
+
+    def __call__(self, state, moves):
+        opponent = 'blue' if state.current_player == 'red' else 'red'
+        return must_play_moves(state, moves, self.engine(state, opponent).must_play())
+
+    def engine(self, state, player):
+        """
+        VCEngine von 'player' für 'state', wenn möglich inkrementell aus der letzten fortgeschrieben.
+        """
+        entry = self.engines.get(player)
+        if entry is not None:
+            red, blue, engine = entry
+            added = (state.red & ~red, state.blue & ~blue)
+            reusable = (engine.topology is state.topology and not (red & ~state.red or blue & ~state.blue)
+                        and sum(bits.bit_count() for bits in added) <= self.MAX_PLAYED)
+            if reusable:
+                coords = state.topology.coords
+                for colour, bits in zip(('red', 'blue'), added):
+                    while bits:
+                        low = bits & -bits
+                        engine.play(coords[low.bit_length() - 1], colour)
+                        bits ^= low
+                self.engines[player] = (state.red, state.blue, engine)
+                return engine
+        engine = VCEngine(state, player)
+        self.engines[player] = (state.red, state.blue, engine)
+        return engine
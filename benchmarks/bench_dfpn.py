@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_dfpn
+import random
+import time
+from agents.dfpn import DFPNSolver
+from agents.hex_state import HexState, winning_cells
+
+POSITIONS = 4                 # Endspielstellungen pro Brettgröße und Anzahl freier Felder
+CASES = ((7, 16), (7, 20), (7, 24), (11, 30), (11, 40))   # (Brettgröße, freie Felder)
+MAX_NODES = 2000000
+
+
+def endgame_positions(size, empty, count, seed=1):
+    """
+    Feste, noch unentschiedene Endspielstellungen: zufällige Züge, wobei nie ein sofort
+    gewinnender Zug gespielt wird, bis nur noch 'empty' Felder frei sind. Stellungen, in denen
+    ein Spieler schon ein Gewinnfeld hat, werden verworfen (sie sind ohne Suche entschieden).
+    """
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        state = HexState([['.'] * size for _ in range(size)], 'red', size * size, size, size)
+        while state.num_empty > empty:
+            winning = winning_cells(state, state.current_player)
+            moves = [move for move in state.get_possible_moves()
+                     if not winning >> state.topology.index[move] & 1]
+            if not moves:
+                break
+            state.make_move(rng.choice(moves))
+        if state.num_empty == empty and not winning_cells(state, 'red') and not winning_cells(state, 'blue'):
+            positions.append(HexState(state.matrix, state.current_player, empty, size, size))
+    return positions
+
+
+def main():
+    for size, empty in CASES:
+        nodes = 0
+        elapsed = 0.0
+        worst = 0.0
+        solved = 0
+        for state in endgame_positions(size, empty, POSITIONS):
+            solver = DFPNSolver(max_nodes=MAX_NODES)
+            start = time.perf_counter()
+            result = solver.solve(state)
+            duration = time.perf_counter() - start
+            nodes += solver.nodes
+            elapsed += duration
+            worst = max(worst, duration)
+            solved += result is not None
+        print(f"{size}x{size}, {empty:2d} frei: {solved}/{POSITIONS} gelöst, {elapsed / POSITIONS:7.3f}s im Mittel, "
+              f"{worst:7.3f}s max, {nodes / elapsed:8.0f} Knoten/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_evaluation
+import heapq
+import time
+from agents import hex_state
+from agents.hex_state import evaluate_state, SHORTEST_PATH, TWO_DISTANCE
+from agents.mcts_agent import MCTSAgent
+from benchmarks.helpers import random_positions
+from run_tournament import play_match
+
+POSITIONS = 200      # Anzahl zufälliger Mittelspielstellungen für Bewertungen/s
+GAMES = 2            # Partien pro Paarung (Farben werden getauscht)
+MOVE_TIME = 0.2      # Sekunden pro Zug für beide Agenten
+
+
+def dijkstra_distance(state, player):
+    """
+    Bisherige Implementierung (Dijkstra mit Heap, Minimum erst nach vollständigem Durchlauf)
+    als Vergleichsbasis.
+    """
+    topology = state.topology
+    own = state.stones(player)
+    opp = state.stones("blue" if player == "red" else "red")
+    dist = [hex_state.INF] * topology.cells
+    pq = []
+    if player == "red":
+        starts, goals = topology.top, topology.bottom
+    else:
+        starts, goals = topology.left, topology.right
+    for index in starts:
+        if not opp >> index & 1:
+            cost = 0 if own >> index & 1 else 1
+            dist[index] = cost
+            heapq.heappush(pq, (cost, index))
+    while pq:
+        current_cost, index = heapq.heappop(pq)
+        if current_cost > dist[index]:
+            continue
+        for neighbour in topology.neighbours[index]:
+            if opp >> neighbour & 1:
+                continue
+            cost = current_cost + (0 if own >> neighbour & 1 else 1)
+            if dist[neighbour] > cost:
+                dist[neighbour] = cost
+                heapq.heappush(pq, (cost, neighbour))
+    return min(dist[index] for index in goals)
+
+
+def with_distance(distance, function, *args):
+    # Tauscht die Distanzfunktion nur für die Dauer eines Aufrufs aus.
+    original = hex_state.shortest_path_distance
+    hex_state.shortest_path_distance = distance
+    try:
+        return function(*args)
+    finally:
+        hex_state.shortest_path_distance = original
+
+
+def evaluations_per_second(positions, mode, distance):
+    start = time.perf_counter()
+    for state in positions:
+        with_distance(distance, evaluate_state, state, 'red', mode)
+    return len(positions) / (time.perf_counter() - start)
+
+
+def agent(mode, distance):
+    search = MCTSAgent(time_limit=MOVE_TIME, evaluation=mode)
+    return lambda game: with_distance(distance, search.make_move, game)
+
+
+def win_rate(name_a, config_a, name_b, config_b):
+    wins = 0
+    for game_number in range(GAMES):
+        if game_number % 2 == 0:
+            winner, _ = play_match(agent(*config_a), agent(*config_b))
+            wins += winner == 'red'
+        else:
+            winner, _ = play_match(agent(*config_b), agent(*config_a))
+            wins += winner == 'blue'
+    print(f"{name_a} vs {name_b}: {wins}/{GAMES} Siege bei {MOVE_TIME}s pro Zug")
+
+
+def main():
+    positions = random_positions(POSITIONS)
+    configs = {
+        'Dijkstra (bisher)': (SHORTEST_PATH, dijkstra_distance),
+        '0-1-BFS': (SHORTEST_PATH, hex_state.shortest_path_distance),
+        'Zwei-Distanz': (TWO_DISTANCE, hex_state.shortest_path_distance),
+    }
+    for name, (mode, distance) in configs.items():
+        print(f"{name:18}: {evaluations_per_second(positions, mode, distance):8.0f} Bewertungen/s")
+    win_rate('0-1-BFS', configs['0-1-BFS'], 'Dijkstra (bisher)', configs['Dijkstra (bisher)'])
+    win_rate('Zwei-Distanz', configs['Zwei-Distanz'], '0-1-BFS', configs['0-1-BFS'])
+
+
+if __name__ == '__main__':
+    main()
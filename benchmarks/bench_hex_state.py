@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_hex_state
+import random
+import time
+from agents.hex_state import HexState
+from benchmarks import legacy_hex_state
+
+NUM_ROWS = 11
+NUM_COLS = 11
+
+
+def empty_state(state_class):
+    matrix = [['.' for _ in range(NUM_COLS)] for _ in range(NUM_ROWS)]
+    return state_class(matrix, 'red', NUM_ROWS * NUM_COLS, NUM_ROWS, NUM_COLS)
+
+
+def states_per_second(state_class, duration=2.0, seed=0):
+    """
+    Spielt zufällige Partien auf einem leeren 11x11-Brett (apply_move + is_terminal pro Zug)
+    und zählt die erzeugten Zustände pro Sekunde.
+    """
+    rng = random.Random(seed)
+    states = 0
+    end_time = time.perf_counter() + duration
+    start = time.perf_counter()
+    while time.perf_counter() < end_time:
+        state = empty_state(state_class)
+        while not state.is_terminal():
+            state = state.apply_move(rng.choice(state.get_possible_moves()))
+            states += 1
+    return states / (time.perf_counter() - start)
+
+
+def main():
+    legacy = states_per_second(legacy_hex_state.HexState)
+    bitboard = states_per_second(HexState)
+    print(f"Liste    : {legacy:10.0f} Zustände/s")
+    print(f"Bitboard : {bitboard:10.0f} Zustände/s")
+    print(f"Speedup  : {bitboard / legacy:10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_mcts_expansion
+import random
+import time
+from agents.eval_cache import EvalCache
+from agents.hex_state import HexState, evaluate_state, SHORTEST_PATH
+from agents.mcts_agent import MCTSAgent, Node
+
+NUM_ROWS = 11
+NUM_COLS = 11
+SECONDS = 5.0        # Messdauer pro Variante
+
+
+class LegacyNode(Node):
+    # Bisherige Buchführung als Vergleichsbasis: freie Felder bei jedem Aufruf neu abfragen
+    # und bereits probierte Züge per Listensuche herausfiltern.
+    def __init__(self, state, move=None, parent=None, relevance_slack=None, prior=0.0):
+        self.state = state
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.visits = 0
+        self.wins = 0
+        self.prior = prior
+
+    def is_fully_expanded(self):
+        return len(self.children) == len(self.state.get_possible_moves())
+
+    def expand(self, evaluation=SHORTEST_PATH, eval_cache=None, with_prior=False):
+        possible_moves = self.state.get_possible_moves()
+        tried_moves = [child.move for child in self.children]
+        untried_moves = [move for move in possible_moves if move not in tried_moves]
+        if not untried_moves:
+            return None
+        move = random.choice(untried_moves)
+        new_state = self.state.apply_move(move)
+        prior = evaluate_state(new_state, self.state.current_player, evaluation, eval_cache) if with_prior else 0.0
+        child_node = LegacyNode(new_state, move, self, prior=prior)
+        self.children.append(child_node)
+        return child_node
+
+
+def iterations_per_second(node_class, agent):
+    root = node_class(HexState([['.'] * NUM_COLS for _ in range(NUM_ROWS)], 'red', NUM_ROWS * NUM_COLS, NUM_ROWS, NUM_COLS))
+    iterations = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < SECONDS:
+        agent.mcts_iteration(root, 'red')
+        iterations += 1
+    return iterations / (time.perf_counter() - start)
+
+
+def tree_only_agent():
+    # Rollout durch ein zufälliges Ergebnis ersetzt und Bewertungen für den progressive bias
+    # gecacht, damit Selektion/Expansion sichtbar werden
+    agent = MCTSAgent(eval_cache=EvalCache())
+    agent.rollout = lambda state, player: random.randint(0, 1)
+    return agent
+
+
+def main():
+    for name, make_agent in (('mit Rollout', MCTSAgent), ('nur Baum', tree_only_agent)):
+        before = iterations_per_second(LegacyNode, make_agent())
+        after = iterations_per_second(Node, make_agent())
+        print(f"{name:12}: bisher {before:8.0f} Iterationen/s, jetzt {after:8.0f} Iterationen/s ({after / before:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_mcts_tree
+import random
+import time
+import tracemalloc
+from agents.hex_state import HexState
+from agents.mcts_agent import MCTSAgent, Node
+from agents.mcts_tree import ArrayTree
+
+NUM_ROWS = 11
+NUM_COLS = 11
+SECONDS = 10.0       # Messdauer pro Variante
+BUDGET_MB = 64       # Speicherbudget des ArrayTree
+
+
+def empty_state():
+    return HexState([['.'] * NUM_COLS for _ in range(NUM_ROWS)], 'red', NUM_ROWS * NUM_COLS, NUM_ROWS, NUM_COLS)
+
+
+def random_result(state, player):
+    # Rollout durch ein zufälliges Ergebnis ersetzt, damit nur die Baumverwaltung gemessen wird
+    return random.randint(0, 1)
+
+
+def count_nodes(node):
+    return 1 + sum(count_nodes(child) for child in node.children)
+
+
+def object_tree(seconds=SECONDS):
+    agent = MCTSAgent()
+    agent.rollout = random_result
+    root = Node(empty_state())
+    iterations = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        agent.mcts_iteration(root, 'red')
+        iterations += 1
+    return iterations / (time.perf_counter() - start), root
+
+
+def object_tree_memory():
+    # Speicher getrennt messen, da tracemalloc die Laufzeit stark verfälscht
+    tracemalloc.start()
+    _, root = object_tree(SECONDS / 4)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory / count_nodes(root)
+
+
+def array_tree():
+    agent = MCTSAgent(batched=True)   # Priors aller Kinder einer Expansion in einem NumPy-Durchlauf
+    agent.tree = ArrayTree.from_budget(BUDGET_MB)
+    agent.rollout = random_result
+    state = empty_state()
+    iterations = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < SECONDS:
+        agent.array_iteration(state, 'red')
+        iterations += 1
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed, agent.tree.size, agent.tree.nbytes
+
+
+def main():
+    rate, root = object_tree()
+    nodes = count_nodes(root)
+    print(f"Node-Objekte: {rate:8.0f} Iterationen/s, {nodes:9d} Knoten, {object_tree_memory():6.0f} B/Knoten")
+    rate, nodes, memory = array_tree()
+    print(f"ArrayTree   : {rate:8.0f} Iterationen/s, {nodes:9d} Knoten, {ArrayTree.BYTES_PER_NODE:6d} B/Knoten "
+          f"({memory / 2 ** 20:.0f} MB Budget, {ArrayTree.from_budget(BUDGET_MB).max_nodes} Knoten)")
+
+
+if __name__ == '__main__':
+    main()
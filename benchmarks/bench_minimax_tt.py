@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_minimax_tt
+import time
+from agents.minimax_agent import MinimaxAgent
+from agents.transposition import TranspositionTable
+from benchmarks.helpers import random_games
+
+POSITIONS = 3       # zufällige Mittelspielstellungen
+STONES = 50         # bereits gesetzte Steine pro Stellung
+DEPTHS = (2, 3)
+
+
+def search(agent, games):
+    nodes = 0
+    start = time.perf_counter()
+    for game in games:
+        agent.make_move(game)
+        nodes += agent.nodes
+    return nodes, time.perf_counter() - start
+
+
+def main():
+    games = random_games(POSITIONS, stones=STONES)
+    for depth in DEPTHS:
+        plain = MinimaxAgent(depth=depth, batched=True)
+        nodes, elapsed = search(plain, games)
+        print(f"Tiefe {depth} ohne TT          : {nodes:8d} Knoten, {elapsed:7.2f}s")
+        table = TranspositionTable()
+        with_tt = MinimaxAgent(depth=depth, batched=True, transposition_table=table)
+        nodes, elapsed = search(with_tt, games)
+        print(f"Tiefe {depth} mit TT           : {nodes:8d} Knoten, {elapsed:7.2f}s")
+        # Gleiche Stellungen erneut: entspricht aufeinanderfolgenden make_move-Aufrufen mit geteilter Tabelle
+        nodes, elapsed = search(with_tt, games)
+        print(f"Tiefe {depth} mit TT (2. Suche): {nodes:8d} Knoten, {elapsed:7.2f}s")
+    # Tiefe 3 nach einer Tiefe-2-Suche derselben Stellungen: die gespeicherten besten Züge
+    # sortieren die tiefere Suche vor (Transpositionen mit gleichen Farben gibt es erst ab Tiefe 4).
+    table = TranspositionTable()
+    search(MinimaxAgent(depth=2, batched=True, transposition_table=table), games)
+    nodes, elapsed = search(MinimaxAgent(depth=3, batched=True, transposition_table=table), games)
+    print(f"Tiefe 3 nach Tiefe 2 mit TT  : {nodes:8d} Knoten, {elapsed:7.2f}s")
+
+
+if __name__ == '__main__':
+    main()
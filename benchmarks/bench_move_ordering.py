@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_move_ordering
+import time
+from agents.minimax_agent import MinimaxAgent
+from benchmarks.helpers import random_games
+
+POSITIONS = 3
+DEPTHS = (2, 3)
+
+
+def search(agent, games):
+    nodes = 0
+    moves = []
+    start = time.perf_counter()
+    for game in games:
+        moves.append(agent.make_move(game))
+        nodes += agent.nodes
+    return nodes, time.perf_counter() - start, moves
+
+
+def main():
+    games = random_games(POSITIONS)
+    for depth in DEPTHS:
+        for batched in (False, True):
+            label = "NumPy" if batched else "Python"
+            full = MinimaxAgent(depth=depth, batched=batched, cheap_ordering=False)
+            nodes, elapsed, full_moves = search(full, games)
+            print(f"Tiefe {depth} ({label}) Bewertung überall : {nodes:8d} Knoten, {elapsed:7.2f}s")
+            cheap = MinimaxAgent(depth=depth, batched=batched)
+            nodes, elapsed, cheap_moves = search(cheap, games)
+            same = sum(a == b for a, b in zip(full_moves, cheap_moves))
+            print(f"Tiefe {depth} ({label}) Killer/History    : {nodes:8d} Knoten, {elapsed:7.2f}s"
+                  f"  (gleicher Zug in {same}/{len(games)})")
+
+
+if __name__ == '__main__':
+    main()
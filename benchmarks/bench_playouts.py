@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_playouts
+import time
+from agents.hex_state import HexState
+from agents.mcts_agent import MCTSAgent, HEURISTIC_PLAYOUT, RANDOM_FILL, BATCHED_FILL
+from benchmarks.helpers import random_positions
+from run_tournament import play_match
+
+NUM_ROWS = 11
+NUM_COLS = 11
+SECONDS = 3.0        # Messdauer pro Playout-Modus und Stellung
+GAMES = 2            # Partien pro Paarung (Farben werden getauscht)
+MOVE_TIME = 0.5      # Sekunden pro Zug
+BATCH_SIZES = (64, 256)
+
+
+def playouts_per_second(agent, state):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < SECONDS:
+        agent.rollout(state, 'red')
+        count += agent.playouts_per_leaf
+    return count / (time.perf_counter() - start)
+
+
+def win_rate(name_a, make_a, name_b, make_b):
+    wins = 0
+    for game_number in range(GAMES):
+        a, b = make_a(), make_b()
+        if game_number % 2 == 0:
+            winner, _ = play_match(a.make_move, b.make_move)
+            wins += winner == 'red'
+        else:
+            winner, _ = play_match(b.make_move, a.make_move)
+            wins += winner == 'blue'
+    print(f"{name_a} vs {name_b}: {wins}/{GAMES} Siege bei {MOVE_TIME}s pro Zug")
+
+
+def main():
+    positions = {
+        'leeres Brett': HexState([['.'] * NUM_COLS for _ in range(NUM_ROWS)], 'red', NUM_ROWS * NUM_COLS, NUM_ROWS, NUM_COLS),
+        'Mittelspiel': random_positions(1)[0],
+    }
+    agents = {
+        HEURISTIC_PLAYOUT: MCTSAgent(playout=HEURISTIC_PLAYOUT),
+        RANDOM_FILL: MCTSAgent(playout=RANDOM_FILL),
+    }
+    for batch_size in BATCH_SIZES:
+        agents[f"{BATCHED_FILL} K={batch_size}"] = MCTSAgent(playout=BATCHED_FILL, batch_size=batch_size)
+    for mode, agent in agents.items():
+        for name, state in positions.items():
+            print(f"{mode:18} {name:13}: {playouts_per_second(agent, state):9.0f} Playouts/s")
+    win_rate('Auffüllen', lambda: MCTSAgent(time_limit=MOVE_TIME, playout=RANDOM_FILL),
+             'Heuristik', lambda: MCTSAgent(time_limit=MOVE_TIME))
+    win_rate('Auffüllen im Stapel', lambda: MCTSAgent(time_limit=MOVE_TIME, playout=BATCHED_FILL),
+             'Auffüllen', lambda: MCTSAgent(time_limit=MOVE_TIME, playout=RANDOM_FILL))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_rave
+from agents.mcts_agent import MCTSAgent, RANDOM_FILL
+from run_tournament import play_match
+
+GAMES = 4            # Partien pro Paarung (Farben werden getauscht)
+SIMULATIONS = 500    # Simulationen pro Zug für den RAVE-Agenten
+RAVE_K = 300
+
+
+def win_rate(rave_simulations, plain_simulations):
+    wins = 0
+    for game_number in range(GAMES):
+        rave = MCTSAgent(simulations=rave_simulations, playout=RANDOM_FILL, rave_k=RAVE_K)
+        plain = MCTSAgent(simulations=plain_simulations, playout=RANDOM_FILL)
+        if game_number % 2 == 0:
+            winner, _ = play_match(rave.make_move, plain.make_move)
+            wins += winner == 'red'
+        else:
+            winner, _ = play_match(plain.make_move, rave.make_move)
+            wins += winner == 'blue'
+    print(f"RAVE {rave_simulations} Simulationen vs ohne RAVE {plain_simulations}: {wins}/{GAMES} Siege")
+
+
+def main():
+    for factor in (1, 4):
+        win_rate(SIMULATIONS, factor * SIMULATIONS)
+
+
+if __name__ == '__main__':
+    main()
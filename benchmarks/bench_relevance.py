@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_relevance
+from agents.hex_state import relevant_moves
+from agents.mcts_agent import MCTSAgent
+from agents.minimax_agent import MinimaxAgent
+from benchmarks.helpers import random_positions
+from run_tournament import play_match
+
+POSITIONS = 200      # zufällige Stellungen mit 10 bis 60 Steinen
+SLACKS = (0, 1, 2)
+GAMES = 2            # Partien pro Paarung (Farben werden getauscht)
+MOVE_TIME = 0.5      # Sekunden pro Zug für MCTS
+DEPTH = 2            # Suchtiefe für Minimax
+
+
+def branching_factor(positions):
+    full = sum(state.num_empty for state in positions) / len(positions)
+    print(f"alle freien Felder : {full:6.1f} Züge im Mittel")
+    for slack in SLACKS:
+        pruned = sum(len(relevant_moves(state, slack)) for state in positions) / len(positions)
+        print(f"Relevanzzone k={slack}   : {pruned:6.1f} Züge im Mittel ({pruned / full:.0%})")
+
+
+def win_rate(name, make_pruned, make_plain):
+    wins = 0
+    for game_number in range(GAMES):
+        # Neue Agenten pro Partie, damit keine Zustände zwischen den Partien geteilt werden
+        pruned, plain = make_pruned(), make_plain()
+        if game_number % 2 == 0:
+            winner, _ = play_match(pruned.make_move, plain.make_move)
+            wins += winner == 'red'
+        else:
+            winner, _ = play_match(plain.make_move, pruned.make_move)
+            wins += winner == 'blue'
+    print(f"{name} mit Relevanzzone vs ohne: {wins}/{GAMES} Siege")
+
+
+def main():
+    branching_factor(random_positions(POSITIONS))
+    win_rate(f"Minimax Tiefe {DEPTH}",
+             lambda: MinimaxAgent(depth=DEPTH, batched=True, relevance_slack=1),
+             lambda: MinimaxAgent(depth=DEPTH, batched=True))
+    win_rate(f"MCTS {MOVE_TIME}s",
+             lambda: MCTSAgent(time_limit=MOVE_TIME, relevance_slack=1),
+             lambda: MCTSAgent(time_limit=MOVE_TIME))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_root_parallel
+import os
+import time
+from agents.hex_state import HexState
+from agents.mcts_agent import MCTSAgent, RANDOM_FILL
+from tests.helpers import PositionGame
+
+NUM_ROWS = 11
+NUM_COLS = 11
+MOVE_TIME = 2.0      # Sekunden pro Zug
+MOVES = 3            # gemessene Züge pro Workerzahl (der erste startet zusätzlich den Pool)
+
+
+def simulations_per_move(workers):
+    game = PositionGame(HexState([['.'] * NUM_COLS for _ in range(NUM_ROWS)], 'red', NUM_ROWS * NUM_COLS, NUM_ROWS, NUM_COLS))
+    agent = MCTSAgent(time_limit=MOVE_TIME, playout=RANDOM_FILL, bias_weight=0, reuse_tree=False, workers=workers)
+    total = 0
+    elapsed = 0.0
+    try:
+        agent.make_move(game)   # Aufwärmen: Prozessstart nicht mitmessen
+        for _ in range(MOVES):
+            start = time.perf_counter()
+            agent.make_move(game)
+            elapsed += time.perf_counter() - start
+            stats = agent.root_stats if workers > 1 else agent.root_statistics()
+            total += stats[0].sum()
+    finally:
+        agent.close()
+    return total / MOVES, elapsed / MOVES
+
+
+def main():
+    cores = os.cpu_count()
+    print(f"{cores} Kerne verfügbar")
+    baseline = None
+    for workers in sorted({1, 2, 4, cores}):
+        simulations, seconds = simulations_per_move(workers)
+        baseline = baseline or simulations
+        print(f"{workers:3d} Worker: {simulations:9.0f} Simulationen pro Zug in {seconds:.2f}s "
+              f"({simulations / baseline:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
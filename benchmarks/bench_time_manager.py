@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_time_manager
+import time
+from Game import Game
+from agents.mcts_agent import MCTSAgent, RANDOM_FILL
+from benchmarks.helpers import random_games
+
+POSITIONS = 6       # zufällige Mittelspielstellungen (11x11, 50 Steine)
+BUDGET = 0.5        # Sekunden pro Zug
+CLOCK = 30          # Bedenkzeit pro Spieler und Partie in Sekunden
+GAMES = 2           # Partien mit echter Uhr (Farben werden getauscht)
+
+
+def per_move(adaptive, games):
+    elapsed = 0.0
+    iterations = 0
+    for game in games:
+        agent = MCTSAgent(time_limit=BUDGET, playout=RANDOM_FILL, adaptive=adaptive)
+        start = time.perf_counter()
+        agent.make_move(game)
+        elapsed += time.perf_counter() - start
+        iterations += agent.iterations
+    label = 'adaptiv' if adaptive else 'fest   '
+    print(f"{label}: {elapsed / len(games):5.2f}s pro Zug, {iterations // len(games):6d} Iterationen pro Zug")
+
+
+def clock_match(agent_red, agent_blue):
+    # Wie run_tournament.play_match, aber mit der tatsächlich verbrauchten Rechenzeit auf der Uhr
+    game = Game()
+    game.current_player = 'red'
+    game.timers = {'red': CLOCK, 'blue': CLOCK}
+    for _ in range(game.NUM_ROWS * game.NUM_COLS):
+        agent = agent_red if game.current_player == 'red' else agent_blue
+        start = time.perf_counter()
+        x, y = agent(game)
+        game.timers[game.current_player] -= time.perf_counter() - start
+        if game.timers[game.current_player] <= 0:
+            return 'red' if game.current_player == 'blue' else 'blue'
+        game.placeStone(x, y)
+        if game.findSolutionPath() is not None:
+            return game.current_player
+        game.changePlayer()
+    return 'draw'
+
+
+def main():
+    games = random_games(POSITIONS)
+    per_move(False, games)
+    per_move(True, games)
+
+    # Uhr-basiert + adaptiv gegen ein festes Budget, das die Uhr gleichmäßig auf 60 Züge verteilt
+    wins = 0
+    for game_number in range(GAMES):
+        managed = MCTSAgent(playout=RANDOM_FILL, use_clock=True, adaptive=True)
+        fixed_agent = MCTSAgent(time_limit=CLOCK / 60, playout=RANDOM_FILL)
+        if game_number % 2 == 0:
+            wins += clock_match(managed.make_move, fixed_agent.make_move) == 'red'
+        else:
+            wins += clock_match(fixed_agent.make_move, managed.make_move) == 'blue'
+    print(f"Uhr + adaptiv vs festes Budget: {wins}/{GAMES} Siege bei {CLOCK}s Bedenkzeit")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_tree_reuse
+from agents.mcts_agent import MCTSAgent, RANDOM_FILL
+from run_tournament import play_match
+
+GAMES = 2            # Partien pro Paarung (Farben werden getauscht)
+MOVE_TIME = 0.5      # Sekunden pro Zug
+
+
+class CountingAgent:
+    # Zählt, wie viele Besuche der Wurzel pro Zug aus der vorherigen Suche stammen.
+    def __init__(self, agent):
+        self.agent = agent
+        self.reused = []
+
+    def make_move(self, game):
+        move = self.agent.make_move(game)
+        self.reused.append(self.agent.reused_visits)
+        return move
+
+
+def main():
+    for array_tree in (False, True):
+        name = "ArrayTree" if array_tree else "Node-Baum"
+        wins = 0
+        reused = []
+        for game_number in range(GAMES):
+            reuse = CountingAgent(MCTSAgent(time_limit=MOVE_TIME, playout=RANDOM_FILL, bias_weight=0,
+                                            array_tree=array_tree))
+            fresh = MCTSAgent(time_limit=MOVE_TIME, playout=RANDOM_FILL, bias_weight=0, array_tree=array_tree,
+                              reuse_tree=False)
+            if game_number % 2 == 0:
+                winner, _ = play_match(reuse.make_move, fresh.make_move)
+                wins += winner == 'red'
+            else:
+                winner, _ = play_match(fresh.make_move, reuse.make_move)
+                wins += winner == 'blue'
+            reused.extend(reuse.reused[1:])
+        found = sum(visits > 0 for visits in reused)
+        print(f"{name}: Teilbaum in {found}/{len(reused)} Zügen gefunden, "
+              f"im Mittel {sum(reused) / len(reused):.0f} übernommene Wurzelbesuche pro Zug, "
+              f"mit Wiederverwendung {wins}/{GAMES} Siege gegen ohne")
+
+
+if __name__ == '__main__':
+    main()
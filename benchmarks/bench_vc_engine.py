@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# Aufruf aus dem Projektverzeichnis: python -m benchmarks.bench_vc_engine
+import random
+import time
+from agents.hex_state import HexState, evaluate_state, SHORTEST_PATH, VIRTUAL_CONNECTION
+from agents.vc_engine import VCEngine, vc_filter
+from benchmarks.helpers import random_positions, NUM_ROWS, NUM_COLS
+
+POSITIONS = 50     # zufällige 11x11-Stellungen mit 10 bis 60 Steinen
+GAMES = 5          # zufällige Partien für die inkrementelle Aktualisierung
+
+
+def rate(label, function, items):
+    start = time.perf_counter()
+    for item in items:
+        function(item)
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s}: {len(items) / elapsed:8.1f}/s ({elapsed / len(items) * 1000:6.2f} ms)")
+
+
+def incremental_updates():
+    # Beide Engines folgen zufälligen Partien Zug für Zug; verglichen mit je einer Neuberechnung
+    rng = random.Random(5)
+    updates = 0
+    incremental = 0.0
+    scratch = 0.0
+    for _ in range(GAMES):
+        state = HexState([['.'] * NUM_COLS for _ in range(NUM_ROWS)], 'red', NUM_ROWS * NUM_COLS, NUM_ROWS, NUM_COLS)
+        engines = [VCEngine(state, 'red'), VCEngine(state, 'blue')]
+        while not state.is_terminal():
+            move = state.random_move(rng)
+            player = state.current_player
+            state.make_move(move)
+            start = time.perf_counter()
+            for engine in engines:
+                engine.play(move, player)
+            incremental += time.perf_counter() - start
+            start = time.perf_counter()
+            VCEngine(state, 'red')
+            VCEngine(state, 'blue')
+            scratch += time.perf_counter() - start
+            updates += 1
+    print(f"{'inkrementell (beide Spieler)':34s}: {updates / incremental:8.1f}/s ({incremental / updates * 1000:6.2f} ms)")
+    print(f"{'neu berechnet (beide Spieler)':34s}: {updates / scratch:8.1f}/s ({scratch / updates * 1000:6.2f} ms)")
+
+
+def main():
+    positions = random_positions(POSITIONS)
+    engines = [VCEngine(state, 'red') for state in positions]
+    print(f"{sum(len(e.full) for e in engines) / POSITIONS:.0f} Punktpaare mit VC, "
+          f"{sum(len(e.semi) for e in engines) / POSITIONS:.0f} mit Semi-VC pro Stellung (red)")
+    rate('H-Search (ein Spieler)', lambda state: VCEngine(state, 'red'), positions)
+    rate('Bewertung VIRTUAL_CONNECTION', lambda state: evaluate_state(state, 'red', VIRTUAL_CONNECTION), positions)
+    rate('Bewertung SHORTEST_PATH', lambda state: evaluate_state(state, 'red', SHORTEST_PATH), positions)
+    rate('vc_filter', lambda state: vc_filter(state, list(state.get_possible_moves())), positions)
+    incremental_updates()
+
+
+if __name__ == '__main__':
+    main()
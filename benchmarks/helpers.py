@@ -0,0 +1,30 @@
+# Gemeinsame Hilfsfunktionen der Benchmarks (Spielobjekt wie in den Tests)
+import random
+from agents.hex_state import HexState
+from tests.helpers import PositionGame
+
+NUM_ROWS = 11
+NUM_COLS = 11
+
+
+def random_positions(count, seed=0, stones=None):
+    """
+    'count' zufällige, noch nicht entschiedene Stellungen auf dem 11x11-Brett mit 'stones'
+    Steinen (None: zufällig 10 bis 59); Folgen, die vorher gewinnen, werden verworfen.
+    """
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        state = HexState([['.'] * NUM_COLS for _ in range(NUM_ROWS)], 'red', NUM_ROWS * NUM_COLS, NUM_ROWS, NUM_COLS)
+        for _ in range(rng.randrange(10, 60) if stones is None else stones):
+            state.make_move(state.random_move(rng))
+            if state.is_terminal():
+                break
+        if not state.is_terminal():
+            positions.append(state.clone())
+    return positions
+
+
+def random_games(count, seed=1, stones=50):
+    # Wie random_positions, als Spielobjekte für make_move der Agenten
+    return [PositionGame(state) for state in random_positions(count, seed, stones)]
@@ -0,0 +1,59 @@
+# Erzeugt offline das Eröffnungsbuch für MinimaxAgent/MCTSAgent (Parameter opening_book).
+# Aufruf: python build_opening_book.py  (dauert etwa SEARCH_TIME * (1 + WIDTH + WIDTH² + ...) Sekunden)
+import time
+from types import SimpleNamespace
+import numpy as np
+from agents.hex_state import HexState
+from agents.mcts_agent import MCTSAgent, RANDOM_FILL
+from agents.opening_book import OpeningBook, write_book, canonical_hash
+
+BOOK_PATH = 'opening_book.bin'
+NUM_ROWS = 11
+NUM_COLS = 11
+PLIES = 2           # Buchtiefe in Halbzügen ab dem leeren Brett
+WIDTH = 6           # pro Stellung werden die WIDTH meistbesuchten Züge weiterverfolgt
+SEARCH_TIME = 20    # Sekunden MCTS pro Buchstellung
+
+
+def search(state):
+    """
+    Lange MCTS-Suche; liefert (bester Zug, Siegrate des besten Zugs, Kandidaten nach Besuchen).
+    """
+    game = SimpleNamespace(matrix=state.matrix, current_player=state.current_player,
+                           num_emptyTiles=state.num_empty, NUM_ROWS=NUM_ROWS, NUM_COLS=NUM_COLS)
+    agent = MCTSAgent(time_limit=SEARCH_TIME, playout=RANDOM_FILL, reuse_tree=False)
+    move = agent.make_move(game)
+    visits, wins = agent.root_statistics()
+    index = state.topology.index[move]
+    score = wins[index] / visits[index] if visits[index] else 0.5
+    ranked = [state.topology.coords[i] for i in np.argsort(-visits)[:WIDTH] if visits[i] > 0]
+    return move, score, ranked
+
+
+def main():
+    empty = HexState([['.'] * NUM_COLS for _ in range(NUM_ROWS)], 'red', NUM_ROWS * NUM_COLS, NUM_ROWS, NUM_COLS)
+    frontier = [empty]
+    seen = set()
+    entries = []
+    start = time.time()
+    for ply in range(PLIES):
+        next_frontier = []
+        for state in frontier:
+            key, _ = canonical_hash(state)
+            if key in seen or state.is_terminal():
+                continue
+            seen.add(key)
+            move, score, ranked = search(state)
+            entries.append((state, move, score))
+            print(f"Halbzug {ply}: {len(entries):4d} Stellungen, Zug {move}, Siegrate {score:.2f}, "
+                  f"{time.time() - start:7.0f}s")
+            next_frontier.extend(state.apply_move(candidate) for candidate in ranked)
+        frontier = next_frontier
+    write_book(BOOK_PATH, NUM_ROWS, NUM_COLS, entries)
+    book = OpeningBook(BOOK_PATH)
+    print(f"{len(book)} Einträge in {BOOK_PATH}")
+    book.close()
+
+
+if __name__ == '__main__':
+    main()
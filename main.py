@@ -7,6 +7,8 @@ from Game import Game
 from agents.minimax_agent import MinimaxAgent
 from agents.mcts_agent import MCTSAgent
 from agents.random_agent import random
+from agents.ponder import Ponderer
+from agents.transposition import TranspositionTable
 from Buttons import Button  # Für den Restart-Button und Toggle Elo
 
 def main():
@@ -57,6 +59,20 @@ def main():
             textColor=consts.WHITE
         )
         
+        # KI-Gegner einmal pro Partie anlegen, damit er seinen Suchbaum über die Züge behalten kann
+        agent = None
+        if gameMode == "human_ai":
+            if ai_opponent == "minimax":
+                agent = MinimaxAgent(transposition_table=TranspositionTable())
+            elif ai_opponent == "mcts":
+                agent = MCTSAgent(count_reused=True)
+            elif ai_opponent == "random":
+                agent = random()
+            else:
+                agent = MinimaxAgent(transposition_table=TranspositionTable())  # Fallback
+        # Pondering: die KI sucht im Hintergrund weiter, solange der Mensch am Zug ist
+        ponderer = Ponderer(agent)
+
         while hexgame.running:
             dt = clock.tick(30) / 1000.0  # dt in Sekunden
             # Aktualisiere den Timer nur, wenn kein "No Limit" eingestellt wurde.
@@ -70,12 +86,14 @@ def main():
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    ponderer.stop()
                     pygame.quit()
                     sys.exit()
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     mouse_pos = pygame.mouse.get_pos()
                     # Prüfe zunächst den integrierten Quit-Button
                     if hexgame.quitButton.selectByCoord(mouse_pos):
+                        ponderer.stop()
                         pygame.quit()
                         sys.exit()
                     # Prüfe den Toggle-Elo-Button
@@ -91,14 +109,7 @@ def main():
             # KI-Zug im Human-vs-AI-Modus
             if gameMode == "human_ai" and hexgame.current_player == "blue":
                 pygame.time.delay(500)
-                if ai_opponent == "minimax":
-                    agent = MinimaxAgent()
-                elif ai_opponent == "mcts":
-                    agent = MCTSAgent()
-                elif ai_opponent == "random":
-                    agent = random()
-                else:
-                    agent = MinimaxAgent()  # Fallback
+                ponderer.stop()
                 move = agent.make_move(hexgame)
                 if move:
                     hexgame.human_move = move
@@ -106,11 +117,8 @@ def main():
             if hasattr(hexgame, 'human_move'):
                 x, y = hexgame.human_move
                 if hexgame.matrix[y][x] == hexgame.EMPTY and not hexgame.isGameOver():
-                    tile = hexgame.grid.tiles[(x, y)]
-                    tile.colour = hexgame.playerColours[hexgame.current_player]
-                    hexgame.matrix[y][x] = hexgame.current_player.upper()[0]
+                    tile = hexgame.placeStone(x, y)
                     hexgame.grid.visitedTiles[tile.gridPosition] = 1
-                    hexgame.num_emptyTiles -= 1
 
                     # Letzten Zug speichern (wird in drawBoard hervorgehoben)
                     hexgame.last_move = (x, y)
@@ -121,12 +129,15 @@ def main():
                     else:
                         hexgame.changePlayer()
                         hexgame.text = hexgame.current_player.capitalize() + "'s turn"
+                        if gameMode == "human_ai" and hexgame.current_player == "red":
+                            ponderer.start(hexgame)
                 del hexgame.human_move
 
             hexgame.drawBoard()
             # Zeichne den Toggle-Elo-Button zusätzlich
             toggleEloButton.draw(12, 12, 12, 12)
             pygame.display.update()
+        ponderer.stop()
         
         # Nach Spielende: Endbildschirm mit Restart-Button (Quit-Button bleibt integriert)
         restartButton = Button(
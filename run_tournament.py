@@ -2,7 +2,8 @@
 from Game import Game
 from agents.random_agent import make_random_move
 from agents.minimax_agent import MinimaxAgent
-from agents.mcts_agent import MCTSAgent
+from agents.mcts_agent import MCTSAgent, RANDOM_FILL
+from agents.eval_cache import EvalCache
 import datetime
 import time  # Neuer Import zur Zeitmessung
 
@@ -34,13 +35,8 @@ def play_match(agent_red, agent_blue, time_limit=300):
         
         if move:
             x, y = move
-            # Aktualisiere das Spielfeld: Matrix und Grid
-            game.matrix[y][x] = game.current_player.upper()[0]
-            game.num_emptyTiles -= 1
-            
-            # Setze auch das Tile im Grid, damit Gewinnabfrage funktioniert.
-            tile = game.grid.tiles[(x, y)]
-            tile.colour = game.playerColours[game.current_player]
+            # Aktualisiere das Spielfeld: Matrix, Grid (für die Gewinnabfrage) und freie Felder
+            game.placeStone(x, y)
             
             # Simuliere den Zeitverbrauch: 1 Sekunde pro Zug
             game.timers[game.current_player] -= 1  
@@ -103,26 +99,35 @@ def main():
     results = []
     game_counter = 1  # Zähler für die Rundennummer
     
-    # Agenten als Funktionen: Jeweils wird eine neue Instanz des jeweiligen Agenten erstellt.
+    # Gemeinsamer Bewertungs-Cache für alle Agenten und Züge (Schlüssel enthält den Bewertungsmodus)
+    eval_cache = EvalCache()
+
+    # Agenten-Fabriken: Pro Partie wird für jede Farbe eine neue Instanz erstellt, die alle Züge
+    # dieser Partie spielt (MCTS übernimmt so den passenden Teilbaum des vorigen Zugs).
     agent_dict = {
-        'Random': make_random_move,
-        'Minimax_depth2': lambda game: MinimaxAgent(depth=1).make_move(game),
-        'MCTS': lambda game: MCTSAgent(simulations=1).make_move(game)
+        'Random': lambda: make_random_move,
+        'Minimax_depth2': lambda: MinimaxAgent(depth=1, eval_cache=eval_cache).make_move,
+        'Minimax_ID': lambda: MinimaxAgent(time_limit=5, use_clock=True, eval_cache=eval_cache).make_move,
+        'MCTS': lambda: MCTSAgent(simulations=1, eval_cache=eval_cache).make_move,
+        # Zufällige Playouts bis zum vollen Brett; RAVE mit einem Viertel der Simulationen
+        'MCTS_fill': lambda: MCTSAgent(simulations=2000, playout=RANDOM_FILL).make_move,
+        'MCTS_RAVE': lambda: MCTSAgent(simulations=500, playout=RANDOM_FILL, rave_k=300).make_move,
     }
     
     pairings = [
         ('Minimax_depth2', 'MCTS'),
         ('Random', 'MCTS'),
         ('Random', 'Minimax_depth2'),
+        ('Minimax_ID', 'MCTS'),
+        ('MCTS_fill', 'MCTS_RAVE'),
     ]
     
     time_limit = 3000000000  # Sekunden pro Spieler
     
     for agent1, agent2 in pairings:
-        agent_red = agent_dict[agent1]
-        agent_blue = agent_dict[agent2]
-        
         for match_num in range(matches_per_pair):
+            agent_red = agent_dict[agent1]()
+            agent_blue = agent_dict[agent2]()
             winner, kpi = play_match(agent_red, agent_blue, time_limit=time_limit)
             result_str = (
                 f"{agent1} (red) vs {agent2} (blue) | Winner: {winner} | "
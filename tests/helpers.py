@@ -0,0 +1,24 @@
+# Gemeinsame Hilfsfunktionen der Tests
+from agents.hex_state import HexState
+import random
+
+class PositionGame:
+    # Minimales Spielobjekt mit den Attributen, die die Agenten aus env.Game lesen
+    def __init__(self, state):
+        self.matrix = state.matrix
+        self.current_player = state.current_player
+        self.num_emptyTiles = state.num_empty
+        self.NUM_ROWS = state.NUM_ROWS
+        self.NUM_COLS = state.NUM_COLS
+
+def random_state(seed, moves, size=7, keep_win=False):
+    # Höchstens 'moves' Zufallszüge; ein gewinnender Zug beendet die Folge und wird ohne keep_win zurückgenommen
+    rng = random.Random(seed)
+    state = HexState([['.'] * size for _ in range(size)], 'red', size * size, size, size)
+    for _ in range(moves):
+        state.make_move(state.random_move(rng))
+        if state.is_terminal():
+            if not keep_win:
+                state.unmake_move()
+            break
+    return HexState(state.matrix, state.current_player, state.num_empty, size, size)
@@ -0,0 +1,21 @@
+from agents.hex_state import HexState, evaluate_move
+from agents.batch_eval import evaluate_children
+from tests.helpers import random_state
+
+def test_evaluate_children_matches_evaluate_move():
+    for seed in range(20):
+        state = random_state(seed, moves=seed * 2)
+        for player in ('red', 'blue'):
+            moves, scores = evaluate_children(state, player)
+            assert moves == list(state.get_possible_moves())
+            assert list(scores) == [evaluate_move(state, move, player) for move in moves]
+
+def test_evaluate_children_detects_winning_move():
+    matrix = [['.'] * 3 for _ in range(3)]
+    matrix[0][1] = 'R'
+    matrix[1][1] = 'R'
+    state = HexState(matrix, 'red', 7, 3, 3)
+    moves, scores = evaluate_children(state, 'blue')
+    assert scores[moves.index((1, 2))] == -float('inf')
+    assert scores[moves.index((0, 2))] == -float('inf')
+    assert scores[moves.index((2, 2))] != -float('inf')
@@ -0,0 +1,18 @@
+from agents.hex_state import connects
+from agents.batch_playout import batched_random_fill
+import numpy as np
+from tests.helpers import random_state
+
+def test_batched_random_fill_matches_flood_fill():
+    for seed in range(20):
+        state = random_state(seed, moves=seed)
+        topology = state.topology
+        red_wins, red = batched_random_fill(state, 16, np.random.default_rng(seed))
+        assert red.shape == (16, topology.cells)
+        for row, won in zip(red, red_wins):
+            bits = int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little')
+            assert bits & state.red == state.red and not bits & state.blue
+            # Spieler am Zug erhält die aufgerundete Hälfte der freien Felder
+            own = (bits & ~state.red).bit_count()
+            assert own == ((state.num_empty + 1) // 2 if state.to_move == 0 else state.num_empty // 2)
+            assert won == connects(bits, topology.top_mask, topology.bottom_mask, topology)
@@ -0,0 +1,57 @@
+from agents.dfpn import DFPNSolver
+from agents.minimax_agent import MinimaxAgent
+from agents.mcts_agent import MCTSAgent
+from agents.hex_state import HexState, PLAYERS
+from tests.helpers import PositionGame, random_state
+
+def exhaustive_winner(state, memo):
+    # Vollständige Negamax-Suche als Referenz (Hex kennt kein Remis)
+    if state.winner is not None:
+        return state.winner
+    if state.hash not in memo:
+        result = 1 - state.to_move
+        for move in list(state.get_possible_moves()):
+            state.make_move(move)
+            winner = exhaustive_winner(state, memo)
+            state.unmake_move()
+            if winner == state.to_move:
+                result = winner
+                break
+        memo[state.hash] = result
+    return memo[state.hash]
+
+def test_DFPNSolver_agrees_with_exhaustive_search():
+    memo = {}
+    solver = DFPNSolver()
+    for seed, (size, stones) in enumerate(((3, 0), (3, 2), (4, 3), (4, 5), (4, 6), (4, 8))):
+        state = random_state(seed, stones, size)
+        winner, move = solver.solve(state)
+        expected = exhaustive_winner(state, memo)
+        assert winner == PLAYERS[expected]
+        assert state.history == []
+        if expected == state.to_move:
+            state.make_move(move)
+            assert exhaustive_winner(state, memo) == expected
+            state.unmake_move()
+        else:
+            assert move is None
+
+def test_DFPNSolver_gives_up_when_budget_is_exhausted():
+    state = HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5)
+    solver = DFPNSolver(max_nodes=50)
+    assert solver.solve(state) is None
+    assert state.history == [] and state.num_empty == 25
+
+def test_agents_play_proven_winning_move_in_endgame():
+    state = HexState([['.'] * 4 for _ in range(4)], 'red', 16, 4, 4)
+    for move in ((1, 0), (0, 1), (1, 1), (3, 2), (2, 2), (0, 3)):
+        state.make_move(move)
+    state = HexState(state.matrix, state.current_player, state.num_empty, 4, 4)
+    winner, winning_move = DFPNSolver().solve(state)
+    assert winner == 'red'
+    minimax = MinimaxAgent(solver_threshold=10)
+    move = minimax.make_move(PositionGame(state))
+    assert minimax.nodes == 0
+    mcts = MCTSAgent(simulations=10, solver_threshold=10)
+    assert mcts.make_move(PositionGame(state)) == move == winning_move
+    assert mcts.root is None
@@ -0,0 +1,30 @@
+from agents.eval_cache import EvalCache
+from agents.hex_state import HexState, evaluate_state, SHORTEST_PATH, TWO_DISTANCE
+
+def test_EvalCache_counts_and_evicts_least_recently_used():
+    cache = EvalCache(max_size=2)
+    assert cache.get('a') is None
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert (cache.hits, cache.misses, cache.evictions) == (3, 2, 1)
+    assert len(cache) == 2
+
+def test_evaluate_state_uses_cache():
+    cache = EvalCache()
+    state = HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5).apply_move((2, 2))
+    value = evaluate_state(state, 'red', cache=cache)
+    assert evaluate_state(state, 'red', cache=cache) == value == evaluate_state(state, 'red')
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+def test_EvalCache_keeps_evaluation_modes_apart():
+    cache = EvalCache()
+    state = HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5).apply_move((2, 2)).apply_move((0, 4))
+    shortest = evaluate_state(state, 'red', SHORTEST_PATH, cache)
+    two_distance = evaluate_state(state, 'red', TWO_DISTANCE, cache)
+    assert two_distance == evaluate_state(state, 'red', TWO_DISTANCE)
+    assert shortest == evaluate_state(state, 'red', SHORTEST_PATH)
+    assert len(cache) == 2 and cache.hits == 0
@@ -0,0 +1,168 @@
+from agents.hex_state import HexState, evaluate_state
+from tests.helpers import random_state
+import random
+
+def empty_matrix(rows=11, cols=11):
+    return [['.' for _ in range(cols)] for _ in range(rows)]
+
+def test_HexState_matrix_roundtrip():
+    matrix = empty_matrix()
+    matrix[0][3] = 'R'
+    matrix[5][10] = 'B'
+    state = HexState(matrix, 'blue', 119, 11, 11)
+    assert state.matrix == matrix
+    assert state.current_player == 'blue'
+    assert len(state.get_possible_moves()) == 119
+    assert (3, 0) not in state.get_possible_moves()
+
+def test_HexState_apply_move_does_not_mutate():
+    state = HexState(empty_matrix(), 'red', 121, 11, 11)
+    child = state.apply_move((4, 2))
+    assert state.matrix[2][4] == '.'
+    assert child.matrix[2][4] == 'R'
+    assert child.current_player == 'blue'
+    assert child.num_empty == 120
+
+def test_HexState_check_win_red_column():
+    matrix = empty_matrix()
+    for y in range(11):
+        matrix[y][5] = 'R'
+    state = HexState(matrix, 'blue', 110, 11, 11)
+    assert state.check_win('red')
+    assert not state.check_win('blue')
+    assert state.is_terminal()
+    assert evaluate_state(state, 'red') == float('inf')
+
+def test_HexState_check_win_blue_uses_diagonal_neighbours():
+    # (x, y) -> (x + 1, y - 1) ist ein Nachbar, (x + 1, y + 1) nicht.
+    matrix = empty_matrix(3, 3)
+    matrix[2][0] = 'B'
+    matrix[1][1] = 'B'
+    matrix[0][2] = 'B'
+    assert HexState(matrix, 'red', 6, 3, 3).check_win('blue')
+    matrix = empty_matrix(3, 3)
+    matrix[0][0] = 'B'
+    matrix[1][1] = 'B'
+    matrix[2][2] = 'B'
+    assert not HexState(matrix, 'red', 6, 3, 3).check_win('blue')
+
+def test_HexState_random_games_have_exactly_one_winner():
+    for seed in range(5):
+        state = random_state(seed, moves=121, size=11, keep_win=True)
+        assert state.is_terminal()
+        assert state.check_win('red') != state.check_win('blue')
+
+def test_HexState_winner_is_cached_after_apply_move():
+    state = HexState(empty_matrix(3, 3), 'blue', 9, 3, 3)
+    for move in [(0, 1), (0, 0), (1, 1), (0, 2)]:
+        state = state.apply_move(move)
+    assert state.winner is None
+    state = state.apply_move((2, 1))
+    assert state.winner == 1
+    assert state.check_win('blue') and state.is_terminal()
+
+def test_HexState_make_unmake_restores_state():
+    rng = random.Random(7)
+    state = random_state(3, moves=20, size=11)
+    snapshot = (state.red, state.blue, state.to_move, state.num_empty, state.winner, state.parent[:], state.size[:])
+    played = []
+    while not state.is_terminal():
+        move = rng.choice(state.get_possible_moves())
+        state.make_move(move)
+        played.append(move)
+    assert state.winner is not None
+    while played:
+        assert state.unmake_move() == played.pop()
+    assert (state.red, state.blue, state.to_move, state.num_empty, state.winner, state.parent, state.size) == snapshot
+
+def test_HexState_make_move_matches_apply_move():
+    state = random_state(11, moves=30, size=11)
+    for move in state.get_possible_moves()[:10]:
+        copy = state.apply_move(move)
+        state.make_move(move)
+        assert (state.red, state.blue, state.winner, state.num_empty) == (copy.red, copy.blue, copy.winner, copy.num_empty)
+        state.unmake_move()
+
+def test_shortest_path_distance_counts_empty_cells():
+    from agents.hex_state import shortest_path_distance
+    matrix = empty_matrix(5, 5)
+    for y in range(3):
+        matrix[y][2] = 'R'
+    matrix[3][1] = 'B'
+    state = HexState(matrix, 'blue', 21, 5, 5)
+    assert shortest_path_distance(state, 'red') == 2
+    assert shortest_path_distance(state, 'blue') == 4
+
+def test_shortest_path_cells_marks_every_minimal_path():
+    from agents.hex_state import shortest_path_cells
+    matrix = empty_matrix(5, 5)
+    for y in range(3):
+        matrix[y][2] = 'R'
+    matrix[3][1] = 'B'
+    state = HexState(matrix, 'blue', 21, 5, 5)
+    cells = shortest_path_cells(state, 'red')
+    assert {state.topology.coords[i] for i in range(25) if cells >> i & 1} == {(2, 3), (1, 4), (2, 4)}
+
+def test_relevant_moves_restricts_to_must_play_region():
+    from agents.hex_state import relevant_moves
+    matrix = empty_matrix(5, 5)
+    for y in range(4):
+        matrix[y][2] = 'R'
+    matrix[0][0] = 'B'
+    state = HexState(matrix, 'blue', 20, 5, 5)
+    assert sorted(relevant_moves(state)) == [(1, 4), (2, 4)]
+    state.make_move((2, 4))
+    state.make_move((0, 1))
+    assert len(relevant_moves(state, slack=0)) < state.num_empty
+
+def test_two_distance_evaluation_is_symmetric_on_empty_board():
+    from agents.hex_state import two_distance_potential, TWO_DISTANCE
+    state = HexState(empty_matrix(), 'red', 121, 11, 11)
+    assert two_distance_potential(state, 'red') == two_distance_potential(state, 'blue')
+    assert evaluate_state(state, 'red', TWO_DISTANCE) == 0
+    state.make_move((5, 5))
+    assert evaluate_state(state, 'red', TWO_DISTANCE) > 0
+
+def test_HexState_zobrist_hash_is_incremental_and_order_independent():
+    state = HexState(empty_matrix(), 'red', 121, 11, 11)
+    empty_hash = state.hash
+    a = state.apply_move((1, 1)).apply_move((2, 2)).apply_move((3, 3))
+    b = state.apply_move((3, 3)).apply_move((2, 2)).apply_move((1, 1))
+    assert a.hash == b.hash
+    assert a.hash == HexState(a.matrix, a.current_player, a.num_empty, 11, 11).hash
+    state.make_move((1, 1))
+    assert state.hash != empty_hash
+    state.unmake_move()
+    assert state.hash == empty_hash
+
+def test_random_fill_matches_playing_the_shuffled_cells():
+    from agents.hex_state import random_fill
+    for seed in range(20):
+        state = random_state(seed, moves=20, size=11)
+        rng = random.Random(seed)
+        winner, red = random_fill(state, rng)
+        cells = list(state.empty.cells)
+        random.Random(seed).shuffle(cells)
+        for index in cells:
+            state.make_move(state.topology.coords[index])
+        assert winner == ('red', 'blue')[state.winner]
+        assert red == state.red
+
+def test_winning_cells_are_exactly_the_immediately_winning_moves():
+    from agents.hex_state import winning_cells
+    checked = 0
+    for seed in range(30):
+        position = random_state(seed, moves=8 + seed % 8, size=5)
+        if position.is_terminal():
+            continue
+        for player in ('red', 'blue'):
+            state = HexState(position.matrix, player, position.num_empty, 5, 5)
+            expected = 0
+            for x, y in list(state.get_possible_moves()):
+                state.make_move((x, y))
+                if state.winner is not None:
+                    expected |= 1 << (y * 5 + x)
+                state.unmake_move()
+            assert winning_cells(state, player) == expected
+            checked += expected != 0
+    assert checked > 0
@@ -0,0 +1,189 @@
+from agents.mcts_agent import MCTSAgent, Node
+from agents.mcts_tree import ArrayTree
+from agents.hex_state import HexState
+from tests.helpers import PositionGame
+
+def test_Node_expands_every_move_exactly_once():
+    node = Node(HexState([['.'] * 3 for _ in range(3)], 'red', 9, 3, 3))
+    while not node.is_fully_expanded():
+        node.expand()
+    assert sorted(child.move for child in node.children) == sorted(node.state.get_possible_moves())
+    assert node.expand() is None
+
+def test_ArrayTree_backpropagates_from_mover_perspective():
+    tree = ArrayTree(max_nodes=8)
+    assert tree.expand(0, [4, 7])
+    first = tree.first_child[0]
+    assert tree.expand(first, [1, 2, 3])
+    assert not tree.expand(first + 1, [5, 6, 8])   # Budget erschöpft
+    grandchild = tree.first_child[first]
+    tree.backpropagate([0, first, grandchild], 1)
+    assert tree.visits[0] == tree.visits[first] == tree.visits[grandchild] == 1
+    assert tree.wins[first] == 1 and tree.wins[grandchild] == 0
+    assert tree.select_child(0) == first + 1       # unbesuchte Kinder zuerst
+    assert tree.most_visited_child(0) == first
+
+def test_MCTSAgent_array_tree_returns_legal_move():
+    state = HexState([['.'] * 4 for _ in range(4)], 'red', 16, 4, 4)
+    agent = MCTSAgent(simulations=50, array_tree=True, max_nodes=1000)
+    move = agent.make_move(PositionGame(state))
+    assert move in state.get_possible_moves()
+    assert agent.tree.size > 1
+
+def test_progressive_bias_uses_stored_priors_and_decays():
+    tree = ArrayTree(max_nodes=4)
+    tree.expand(0, [0, 1], priors=[0.0, 3.0])
+    tree.backpropagate([0, 1], 1)
+    tree.backpropagate([0, 2], 0)
+    assert tree.select_child(0) == 1
+    assert tree.select_child(0, bias_weight=1.0) == 2      # Bias 3 / 2 überwiegt den Sieg
+    for _ in range(10):
+        tree.backpropagate([0, 2], 0)
+    assert tree.select_child(0, bias_weight=1.0) == 1
+
+def test_Node_expand_computes_prior_from_mover_perspective():
+    node = Node(HexState([['.'] * 3 for _ in range(3)], 'red', 9, 3, 3))
+    child = node.expand(with_prior=True)
+    assert child.prior > 0
+    assert node.expand().prior == 0.0
+
+def test_backpropagate_updates_amaf_for_cells_played_later():
+    state = HexState([['.'] * 3 for _ in range(3)], 'red', 9, 3, 3)
+    root = Node(state)
+    first = root.expand()
+    second = root.expand()
+    red = 1 << state.topology.index[second.move]     # red belegt das Feld von 'second' erst später
+    MCTSAgent().backpropagate(first, 1, 'red', (red, state.topology.full & ~red))
+    assert (second.amaf_visits, second.amaf_wins) == (1, 1)
+    assert first.amaf_visits == 0
+    assert (first.visits, first.wins) == (1, 1)
+
+def test_ArrayTree_amaf_matches_mover_colour():
+    import numpy as np
+    tree = ArrayTree(max_nodes=8)
+    tree.expand(0, [0, 1])
+    tree.expand(1, [1, 2])
+    own = np.array([True, True, False])
+    tree.backpropagate([0, 1, 3], 0, (own, ~own))
+    assert list(tree.amaf_visits[1:3]) == [1, 1]
+    assert list(tree.amaf_wins[1:3]) == [0, 0]
+    assert list(tree.amaf_visits[3:5]) == [0, 1]     # Gegner belegt Feld 2
+    assert tree.amaf_wins[4] == 1
+
+def test_MCTSAgent_reuses_subtree_after_reply():
+    for array_tree in (False, True):
+        state = HexState([['.'] * 3 for _ in range(3)], 'red', 9, 3, 3)
+        agent = MCTSAgent(simulations=200, array_tree=array_tree, max_nodes=5000)
+        move = agent.make_move(PositionGame(state))
+        state.make_move(move)
+        state.make_move(next(iter(state.get_possible_moves())))
+        agent.make_move(PositionGame(state))
+        assert agent.reused_visits > 0
+        other = HexState([['.'] * 3 for _ in range(3)], 'red', 9, 3, 3)
+        agent.make_move(PositionGame(other))
+        assert agent.reused_visits == 0
+
+def test_ArrayTree_reroot_keeps_subtree():
+    tree = ArrayTree(max_nodes=16)
+    tree.expand(0, [0, 1, 2])
+    tree.expand(2, [3, 4])
+    tree.expand(4, [5])
+    tree.expand(3, [6, 7])
+    tree.backpropagate([0, 2, 4, 6], 1)
+    tree.reroot(2)
+    assert tree.size == 4
+    assert list(tree.move[tree.children(0)]) == [3, 4]
+    grandchild = tree.find_child(0, 3)
+    assert list(tree.move[tree.children(grandchild)]) == [5]
+    assert tree.parent[tree.first_child[grandchild]] == grandchild
+    assert tree.visits[0] == tree.wins[0] == tree.visits[grandchild] == 1
+    assert tree.wins[grandchild] == 0
+
+def test_MCTSAgent_root_parallel_sums_worker_statistics():
+    state = HexState([['.'] * 3 for _ in range(3)], 'red', 9, 3, 3)
+    agent = MCTSAgent(simulations=30, workers=2, bias_weight=0)
+    try:
+        move = agent.make_move(PositionGame(state))
+    finally:
+        agent.close()
+    assert move in state.get_possible_moves()
+    assert agent.root_stats.shape == (2, 9)
+    assert agent.root_stats[0].sum() == 2 * 30
+
+def test_MCTSAgent_root_parallel_workers_use_clock_budget():
+    import time
+    state = HexState([['.'] * 3 for _ in range(3)], 'red', 9, 3, 3)
+    game = PositionGame(state)
+    game.timers = {'red': 0.8, 'blue': 300}   # 4 eigene Züge übrig: 0.2 s pro Zug
+    agent = MCTSAgent(simulations=10 ** 9, workers=2, use_clock=True, bias_weight=0)
+    try:
+        start = time.perf_counter()
+        agent.make_move(game)
+        assert time.perf_counter() - start < 5
+    finally:
+        agent.close()
+    assert 0 < agent.root_stats[0].sum() < 10 ** 9
+
+def test_MCTSAgent_batched_playouts_count_every_playout():
+    from agents.mcts_agent import BATCHED_FILL
+    for array_tree in (False, True):
+        state = HexState([['.'] * 4 for _ in range(4)], 'red', 16, 4, 4)
+        agent = MCTSAgent(simulations=10, playout=BATCHED_FILL, batch_size=8, array_tree=array_tree, bias_weight=0)
+        agent.make_move(PositionGame(state))
+        assert agent.root_statistics()[0].sum() == 10 * 8
+
+def test_MCTSAgent_array_tree_rave_counts_every_simulation():
+    from agents.mcts_agent import RANDOM_FILL
+    state = HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5)
+    agent = MCTSAgent(simulations=300, array_tree=True, rave_k=100, playout=RANDOM_FILL, bias_weight=0)
+    agent.make_move(PositionGame(state))
+    visits, wins = agent.root_statistics()
+    assert agent.tree.visits[0] == 300
+    assert visits.sum() == 300
+    assert (wins >= 0).all() and (wins <= visits).all()
+
+def test_MCTSAgent_ponders_from_opponent_perspective_and_keeps_tree():
+    import time
+    from agents.ponder import Ponderer
+    for array_tree in (False, True):
+        state = HexState([['.'] * 3 for _ in range(3)], 'red', 9, 3, 3)
+        for move in ((1, 0), (0, 2), (1, 1), (0, 0)):
+            state.make_move(move)
+        # red (Gegner der KI) ist am Zug und gewinnt mit (1, 2)
+        agent = MCTSAgent(simulations=50, array_tree=array_tree, max_nodes=5000, count_reused=True)
+        ponderer = Ponderer(agent)
+        ponderer.start(PositionGame(state))
+        time.sleep(0.3)
+        ponderer.stop()
+        if array_tree:
+            visits = {agent.tree.move[child]: agent.tree.visits[child] for child in agent.tree.children(0)}
+            assert max(visits, key=visits.get) == state.topology.index[(1, 2)]
+        else:
+            assert max(agent.root.children, key=lambda child: child.visits).move == (1, 2)
+        state.make_move((2, 0))
+        agent.make_move(PositionGame(state))
+        assert agent.reused_visits > 0
+
+def test_MCTSAgent_adaptive_stops_once_best_move_is_final():
+    state = HexState([['.'] * 3 for _ in range(3)], 'red', 9, 3, 3)
+    for move in ((1, 0), (0, 2), (1, 1), (0, 0)):
+        state.make_move(move)
+    agent = MCTSAgent(simulations=3000, adaptive=True, bias_weight=0)
+    assert agent.make_move(PositionGame(state)) == (1, 2)
+    assert agent.iterations < 3000
+
+def test_MCTSAgent_adaptive_extends_close_decisions_once():
+    state = HexState([['.'] * 3 for _ in range(3)], 'red', 9, 3, 3)
+    agent = MCTSAgent(simulations=64, adaptive=True, bias_weight=0)
+    agent.is_decided = lambda remaining: False
+    agent.is_close = lambda: True
+    agent.make_move(PositionGame(state))
+    assert agent.iterations == 96
+
+def test_MCTSAgent_move_budget_uses_clock():
+    game = PositionGame(HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5))
+    game.timers = {'red': 24, 'blue': 300}
+    assert MCTSAgent(use_clock=True).move_budget(game) == 2
+    assert MCTSAgent(time_limit=1, use_clock=True).move_budget(game) == 1
+    assert MCTSAgent(time_limit=1).move_budget(game) == 1
+    assert MCTSAgent().move_budget(game) is None
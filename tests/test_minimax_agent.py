@@ -0,0 +1,82 @@
+from agents.minimax_agent import MinimaxAgent
+from agents.transposition import TranspositionTable
+from agents.hex_state import HexState
+from tests.helpers import PositionGame
+import random
+
+def test_MinimaxAgent_cheap_ordering_finds_same_value():
+    rng = random.Random(7)
+    state = HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5)
+    for _ in range(6):
+        state.make_move(state.random_move(rng))
+    full = MinimaxAgent(depth=3, cheap_ordering=False)
+    cheap = MinimaxAgent(depth=3)
+    _, full_value = full.minimax(state, 3, -float('inf'), float('inf'), True, 'red')
+    _, cheap_value = cheap.minimax(state, 3, -float('inf'), float('inf'), True, 'red')
+    assert full_value == cheap_value
+    assert cheap.history
+
+def test_MinimaxAgent_iterative_deepening_respects_time_limit():
+    import time
+    game = PositionGame(HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5))
+    game.timers = {'red': float('inf'), 'blue': float('inf')}
+    agent = MinimaxAgent(time_limit=0.3, use_clock=True, transposition_table=TranspositionTable())
+    start = time.perf_counter()
+    move = agent.make_move(game)
+    assert time.perf_counter() - start < 1.0
+    assert agent.completed_depth >= 1
+    assert move == agent.pv[0]
+    assert move in [(x, y) for y in range(5) for x in range(5)]
+
+def test_MinimaxAgent_move_budget_uses_clock():
+    game = PositionGame(HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5))
+    game.timers = {'red': 24, 'blue': 300}
+    assert MinimaxAgent(use_clock=True).move_budget(game) == 2
+    assert MinimaxAgent(time_limit=1, use_clock=True).move_budget(game) == 1
+    assert MinimaxAgent().move_budget(game) is None
+
+def test_MinimaxAgent_ponder_fills_table_until_stopped():
+    import time
+    from agents.ponder import Ponderer
+    state = HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5)
+    state.make_move((2, 2))
+    table = TranspositionTable()
+    agent = MinimaxAgent(depth=2, transposition_table=table)
+    ponderer = Ponderer(agent)
+    ponderer.start(PositionGame(state))
+    time.sleep(0.3)
+    ponderer.stop()
+    assert table.stores > 0
+    assert agent.deadline is None and agent.pondering is None
+    state.make_move((1, 1))
+    assert agent.make_move(PositionGame(state)) in state.get_possible_moves()
+
+def test_MinimaxAgent_without_completed_depth_plays_best_ordered_move():
+    import math
+    game = PositionGame(HexState([['.'] * 11 for _ in range(11)], 'blue', 121, 11, 11))
+    game.timers = {'red': 300, 'blue': 0.6}
+    agent = MinimaxAgent(time_limit=1e-9, use_clock=True)
+    assert agent.make_move(game) == (5, 5)   # leeres Brett: alle Züge gleich bewertet, Mitte gewinnt
+    assert agent.completed_depth == 0
+    state = HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5)
+    for move in ((2, 1), (1, 2), (2, 3)):
+        state.make_move(move)
+    expected = agent.order_by_evaluation(state, state.get_possible_moves(), True, 'blue')[0]
+    assert agent.static_best_move(state, 'blue', math.inf) == expected
+    assert agent.static_best_move(state, 'blue', 0) == (2, 2)   # Budget abgelaufen: zentralster Zug
+
+def test_MinimaxAgent_iterative_deepening_opens_in_the_centre():
+    game = PositionGame(HexState([['.'] * 11 for _ in range(11)], 'red', 121, 11, 11))
+    agent = MinimaxAgent(time_limit=0.5)
+    assert agent.make_move(game) == (5, 5)
+    assert agent.completed_depth >= 1
+
+def test_MinimaxAgent_root_evaluation_stays_within_budget():
+    import time
+    from agents.hex_state import VIRTUAL_CONNECTION
+    game = PositionGame(HexState([['.'] * 11 for _ in range(11)], 'red', 121, 11, 11))
+    agent = MinimaxAgent(evaluation=VIRTUAL_CONNECTION, time_limit=0.3)
+    start = time.perf_counter()
+    move = agent.make_move(game)
+    assert time.perf_counter() - start < 1.5
+    assert move in [(x, y) for y in range(11) for x in range(11)]
@@ -0,0 +1,49 @@
+from agents.opening_book import OpeningBook, write_book, canonical_hash, rotated_hash
+from agents.minimax_agent import MinimaxAgent
+from agents.mcts_agent import MCTSAgent
+from agents.hex_state import HexState
+from tests.helpers import PositionGame
+
+def empty_state(size=5):
+    return HexState([['.'] * size for _ in range(size)], 'red', size * size, size, size)
+
+def test_rotated_hash_matches_rotated_position():
+    state = empty_state()
+    rotated = empty_state()
+    for x, y in ((1, 0), (2, 3), (4, 1)):
+        state.make_move((x, y))
+        rotated.make_move((4 - x, 4 - y))
+    assert rotated_hash(state) == rotated.hash
+    assert canonical_hash(state)[0] == canonical_hash(rotated)[0]
+
+def test_OpeningBook_finds_positions_and_their_rotations(tmp_path):
+    path = tmp_path / 'book.bin'
+    first = empty_state()
+    second = first.apply_move((0, 1))
+    write_book(path, 5, 5, [(first, (2, 2), 0.5), (second, (1, 1), 0.25)])
+    book = OpeningBook(path)
+    try:
+        assert len(book) == 2
+        assert book.lookup(first) == ((2, 2), 0.5)
+        assert book.lookup(second) == ((1, 1), 0.25)
+        # gleiche Stellung um 180° gedreht: Zug wird mitgedreht
+        assert book.lookup(first.apply_move((4, 3))) == ((3, 3), 0.25)
+        assert book.lookup(first.apply_move((2, 2))) is None
+        assert book.lookup(empty_state(4)) is None
+    finally:
+        book.close()
+
+def test_agents_play_book_move_without_search(tmp_path):
+    path = tmp_path / 'book.bin'
+    state = empty_state()
+    write_book(path, 5, 5, [(state, (0, 4), 0.0)])
+    book = OpeningBook(path)
+    try:
+        minimax = MinimaxAgent(opening_book=book)
+        assert minimax.make_move(PositionGame(state)) == (0, 4)
+        assert minimax.nodes == 0
+        mcts = MCTSAgent(simulations=50, opening_book=book)
+        assert mcts.make_move(PositionGame(state)) == (0, 4)
+        assert mcts.root is None
+    finally:
+        book.close()
@@ -0,0 +1,55 @@
+from topology import get_topology, EmptyCells
+from HexBoard import Grid
+from env.HexBoard import Grid as EnvGrid
+import pytest
+
+def test_Topology_is_cached_per_size():
+    assert get_topology(11, 11) is get_topology(11, 11)
+    assert get_topology(11, 11) is not get_topology(9, 9)
+
+def test_Topology_neighbours_are_symmetric_up_to_19x19():
+    topology = get_topology(19, 19)
+    for index, neighbours in enumerate(topology.neighbours):
+        assert 2 <= len(neighbours) <= 6
+        for neighbour in neighbours:
+            assert index in topology.neighbours[neighbour]
+    assert topology.coords[topology.index[(7, 3)]] == (7, 3)
+
+def test_Topology_edges():
+    topology = get_topology(3, 4)
+    assert topology.top == {0, 1, 2, 3}
+    assert topology.bottom == {8, 9, 10, 11}
+    assert topology.left == {0, 4, 8}
+    assert topology.right == {3, 7, 11}
+    assert topology.left_mask == 0b000100010001
+
+def test_Topology_rejects_oversized_boards():
+    with pytest.raises(ValueError):
+        get_topology(20, 20)
+
+def test_Grid_neighbours_match_topology():
+    grid = Grid(5, 5, 10)
+    tile = grid.tiles[(2, 2)]
+    assert [t.gridPosition for t in tile.neighbours] == [(1, 3), (2, 3), (1, 2), (3, 2), (2, 1), (3, 1)]
+    assert [t.gridPosition for t in grid.rightColumn()] == [(4, y) for y in range(5)]
+
+def test_standalone_env_Grid_agrees_with_topology():
+    # env/ bleibt ohne topology lauffähig (Start aus env/), muss aber die gleichen Nachbarn liefern
+    topology = get_topology(4, 6)
+    grid = EnvGrid(4, 6, 10)
+    for position, tile in grid.tiles.items():
+        assert [t.gridPosition for t in tile.neighbours] == list(topology.neighbour_coords[topology.index[position]])
+
+def test_EmptyCells_remove_and_restore_keep_order():
+    topology = get_topology(4, 4)
+    cells = EmptyCells(topology, occupied=0b101)
+    assert len(cells) == 14
+    assert (0, 0) not in cells and (1, 0) in cells
+    before = list(cells)
+    slots = [(index, cells.remove(index)) for index in (5, 15, 1, 9)]
+    assert len(cells) == 10
+    assert (1, 1) not in cells
+    for index, slot in reversed(slots):
+        cells.restore(index, slot)
+    assert list(cells) == before
+    assert cells.random_move() in before
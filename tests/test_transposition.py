@@ -0,0 +1,35 @@
+from agents.transposition import TranspositionTable, EXACT, LOWER
+from agents.minimax_agent import MinimaxAgent
+from agents.hex_state import HexState
+from tests.helpers import PositionGame
+import random
+
+def test_TranspositionTable_prefers_deeper_entries_within_a_search():
+    table = TranspositionTable(size=4)
+    table.store(1, 'red', 3, 5, EXACT, (0, 0))
+    table.store(5, 'red', 1, 7, LOWER, (1, 1))   # gleicher Slot, geringere Tiefe -> verworfen
+    assert table.probe(1, 'red') == (3, 5, EXACT, (0, 0))
+    assert table.probe(5, 'red') is None
+    assert table.probe(1, 'blue') is None
+    table.new_search()
+    table.store(5, 'red', 1, 7, LOWER, (1, 1))   # alter Eintrag darf ersetzt werden
+    assert table.probe(5, 'red') == (1, 7, LOWER, (1, 1))
+
+def test_MinimaxAgent_with_table_finds_same_value():
+    rng = random.Random(4)
+    state = HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5)
+    for _ in range(6):
+        state.make_move(state.random_move(rng))
+    plain = MinimaxAgent(depth=3)
+    with_tt = MinimaxAgent(depth=3, transposition_table=TranspositionTable())
+    _, plain_value = plain.minimax(state, 3, -float('inf'), float('inf'), True, 'red')
+    _, tt_value = with_tt.minimax(state, 3, -float('inf'), float('inf'), True, 'red')
+    assert plain_value == tt_value
+
+def test_MinimaxAgent_reuses_table_across_make_move_calls():
+    game = PositionGame(HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5))
+    agent = MinimaxAgent(depth=2, transposition_table=TranspositionTable())
+    first = agent.make_move(game)
+    first_nodes = agent.nodes
+    assert agent.make_move(game) == first
+    assert agent.nodes < first_nodes
@@ -0,0 +1,140 @@
+from agents.vc_engine import VCEngine, vc_filter
+from agents.hex_state import HexState, evaluate_state, shortest_path_distance, VIRTUAL_CONNECTION
+from tests.helpers import PositionGame
+
+def position(moves, size=5, player='red'):
+    state = HexState([['.'] * size for _ in range(size)], 'red', size * size, size, size)
+    for move in moves:
+        state.make_move(move)
+    return HexState(state.matrix, player, state.num_empty, size, size)
+
+def cells(state, carrier):
+    return {state.topology.coords[i] for i in range(state.topology.cells) if carrier >> i & 1}
+
+def test_VCEngine_finds_bridges_and_edge_templates():
+    # red: (2, 1) per Brücke am oberen Rand, (1, 3) am unteren, beide untereinander per Brücke
+    state = position([(2, 1), (0, 0), (1, 3), (4, 4)])
+    engine = VCEngine(state, 'red')
+    upper = engine.point(state.topology.index[(2, 1)])
+    lower = engine.point(state.topology.index[(1, 3)])
+    assert [cells(state, c) for c in engine.connections(upper, lower)] == [{(1, 2), (2, 2)}]
+    assert engine.connected() and engine.distance() == 0
+    assert shortest_path_distance(state, 'red') == 3
+    assert evaluate_state(state, 'red', VIRTUAL_CONNECTION) > 0
+
+def test_VCEngine_derives_ziggurat():
+    state = position([(3, 2), (6, 6)], size=7)
+    engine = VCEngine(state, 'red')
+    stone = engine.point(state.topology.index[(3, 2)])
+    ziggurat = {(2, 2), (2, 1), (3, 1), (4, 1), (2, 0), (3, 0), (4, 0), (5, 0)}
+    assert ziggurat in [cells(state, c) for c in engine.connections(stone, engine.START)]
+
+def test_VCEngine_play_updates_connections_incrementally():
+    state = position([(2, 1), (0, 0), (1, 3), (4, 4)])
+    engine = VCEngine(state, 'red')
+    upper = engine.point(state.topology.index[(2, 1)])
+    lower = engine.point(state.topology.index[(1, 3)])
+    engine.play((2, 2), 'blue')          # Einbruch in die Brücke: nur noch die Semi-VC über (1, 2)
+    assert engine.connections(upper, lower) == []
+    assert [cells(state, c) for c, _ in engine.semi_connections(upper, lower)] == [{(1, 2)}]
+    engine.play((1, 2), 'red')           # Antwort schließt die Brücke: eine Gruppe
+    assert engine.point(state.topology.index[(2, 1)]) == engine.point(state.topology.index[(1, 3)])
+    state = position([(2, 1), (0, 0), (1, 3), (4, 4), (2, 2), (1, 2)])
+    fresh = VCEngine(state, 'red')
+    assert engine.connected() == fresh.connected() and engine.distance() == fresh.distance() == 0
+
+def test_VCEngine_play_matches_fresh_h_search(monkeypatch):
+    # Ohne die Begrenzungen muss die inkrementelle Aktualisierung genau die Verbindungen einer
+    # Neuberechnung liefern
+    import random
+    import agents.vc_engine as vc_engine
+    monkeypatch.setattr(vc_engine, 'MAX_CARRIER', 25)
+    monkeypatch.setattr(vc_engine, 'SOFT_LIMIT', 10 ** 6)
+    rng = random.Random(0)
+    sequences = [[(1, 3), (3, 0)]]
+    for _ in range(20):
+        sequences.append([None] * rng.randint(2, 10))
+    for moves in sequences:
+        state = HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5)
+        engines = [VCEngine(state, 'red'), VCEngine(state, 'blue')]
+        for move in moves:
+            if state.is_terminal():
+                break
+            move = move or state.random_move(rng)
+            player = state.current_player
+            state.make_move(move)
+            for engine in engines:
+                engine.play(move, player)
+        for engine in engines:
+            fresh = VCEngine(state, engine.player)
+            assert engine.distance() == fresh.distance()
+            assert {key: sorted(carriers) for key, carriers in engine.full.items() if carriers} == \
+                {key: sorted(carriers) for key, carriers in fresh.full.items() if carriers}
+            assert engine.must_play() == fresh.must_play()
+
+def test_VCFilter_updates_engine_between_calls(monkeypatch):
+    import random
+    import agents.vc_engine as vc_engine
+    from agents.vc_engine import VCFilter
+    monkeypatch.setattr(vc_engine, 'MAX_CARRIER', 25)
+    monkeypatch.setattr(vc_engine, 'SOFT_LIMIT', 10 ** 6)
+    rng = random.Random(1)
+    root_filter = VCFilter()
+    state = HexState([['.'] * 5 for _ in range(5)], 'red', 25, 5, 5)
+    engine = None
+    while not state.is_terminal():
+        moves = list(state.get_possible_moves())
+        assert root_filter(state, moves) == vc_filter(state, moves)
+        if state.current_player == 'red':
+            # Zugpaar seit dem letzten Aufruf für red: dieselbe Engine wird fortgeschrieben
+            assert engine is None or root_filter.engines['blue'][2] is engine
+            engine = root_filter.engines['blue'][2]
+        state.make_move(state.random_move(rng))
+    other = position([(0, 0)], player='red')
+    root_filter(other, list(other.get_possible_moves()))
+    assert root_filter.engines['blue'][2] is not engine   # fremde Stellung: neu berechnet
+
+def test_vc_filter_restricts_to_must_play_cells():
+    # red droht mit (2, 2) die Ränder zu verbinden, die Umwege sind blockiert; blue muss dort ziehen
+    state = position([(2, 0), (1, 2), (2, 1), (3, 1), (2, 3), (0, 0), (2, 4)], player='blue')
+    assert vc_filter(state, list(state.get_possible_moves())) == [(2, 2)]
+    quiet = position([(2, 0), (0, 0)], player='red')
+    assert len(vc_filter(quiet, list(quiet.get_possible_moves()))) == quiet.num_empty
+
+def test_agents_search_only_must_play_cells_with_vc_filter():
+    from agents.minimax_agent import MinimaxAgent
+    from agents.mcts_agent import MCTSAgent
+    state = position([(2, 0), (1, 2), (2, 1), (3, 1), (2, 3), (0, 0), (2, 4)], player='blue')
+    assert MinimaxAgent(depth=1, vc_filter=True).make_move(PositionGame(state)) == (2, 2)
+    for array_tree in (False, True):
+        agent = MCTSAgent(simulations=20, array_tree=array_tree, max_nodes=1000, vc_filter=True)
+        assert agent.make_move(PositionGame(state)) == (2, 2)
+        assert agent.root_statistics()[0].sum() == agent.root_statistics()[0][state.topology.index[(2, 2)]]
+    agent = MCTSAgent(simulations=20, workers=2, vc_filter=True)
+    try:
+        assert agent.make_move(PositionGame(state)) == (2, 2)
+    finally:
+        agent.close()
+    assert agent.root_stats[0].sum() == agent.root_stats[0][state.topology.index[(2, 2)]] == 2 * 20
+
+def test_MCTSAgent_filters_reused_root():
+    from agents.mcts_agent import MCTSAgent
+    before = position([(2, 0), (1, 2), (2, 1), (3, 1), (2, 3), (0, 0)])
+    state = position([(2, 0), (1, 2), (2, 1), (3, 1), (2, 3), (0, 0), (2, 4)], player='blue')
+    for array_tree in (False, True):
+        # Der alte Baum entsteht ungefiltert, damit der Zug (2, 4) sicher expandiert ist
+        agent = MCTSAgent(simulations=20, array_tree=array_tree, max_nodes=20000)
+        iteration = agent.prepare_search(PositionGame(before), 'red')
+        for _ in range(200):
+            iteration()
+        agent.vc_filter = True
+        agent.prepare_search(PositionGame(state), 'blue')
+        assert agent.reused_visits > 1
+        if array_tree:
+            tree = agent.tree
+            unvisited = [tree.move[child] for child in tree.children(0) if tree.visits[child] == 0]
+            assert tree.is_expanded(0) and set(unvisited) <= {state.topology.index[(2, 2)]}
+            assert all(tree.parent[grandchild] == child for child in tree.children(0)
+                       for grandchild in tree.children(child))
+        else:
+            assert agent.root.children and agent.root.untried_moves in ([], [(2, 2)])
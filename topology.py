@@ -0,0 +1,171 @@
+import random
+from functools import lru_cache
+
+# Maximale Brettgröße, für die die Tabellen vorgesehen sind
+MAX_SIZE = 19
+
+
+class Topology:
+    """
+    Vorberechnete, unveränderliche Nachbarschaftstabellen für ein Hex-Brett der Größe rows x cols.
+    Felder werden flach indiziert: index = y * cols + x.
+
+    Attributes
+    ----------
+    neighbours: tuple
+        index -> Tupel der Nachbarindizes (Reihenfolge wie in der ursprünglichen Grid-Logik)
+    neighbour_coords: tuple
+        index -> Tupel der Nachbarkoordinaten (x, y)
+    neighbour_masks: tuple
+        index -> Bitmaske der Nachbarfelder
+    coords: tuple
+        index -> (x, y)
+    index: dict
+        (x, y) -> index
+    top, bottom, left, right: frozenset
+        Indizes der Randfelder (red verbindet top/bottom, blue left/right)
+    full, not_left, not_right, top_mask, bottom_mask, left_mask, right_mask: int
+        die gleichen Mengen als Bitmasken (Bit index entspricht Feld index)
+    zobrist: tuple
+        (Schlüssel für red, Schlüssel für blue), je ein 64-Bit-Wert pro Feld
+    zobrist_side: int
+        Schlüssel, der eingerechnet wird, wenn blue am Zug ist
+    """
+    __slots__ = ('rows', 'cols', 'cells', 'neighbours', 'neighbour_coords', 'neighbour_masks', 'coords', 'index',
+                 'top', 'bottom', 'left', 'right',
+                 'full', 'not_left', 'not_right', 'top_mask', 'bottom_mask', 'left_mask', 'right_mask',
+                 'zobrist', 'zobrist_side')
+
+    def __init__(self, rows: int, cols: int) -> None:
+        if not (1 <= rows <= MAX_SIZE and 1 <= cols <= MAX_SIZE):
+            raise ValueError(f'board size {rows}x{cols} not supported (max {MAX_SIZE}x{MAX_SIZE})')
+        self.rows = rows
+        self.cols = cols
+        self.cells = rows * cols
+        self.coords = tuple((i % cols, i // cols) for i in range(self.cells))
+        self.index = {coord: i for i, coord in enumerate(self.coords)}
+
+        neighbours = []
+        for x, y in self.coords:
+            cells = []
+            for nx, ny in ((x - 1, y + 1), (x, y + 1), (x - 1, y), (x + 1, y), (x, y - 1), (x + 1, y - 1)):
+                if 0 <= nx < cols and 0 <= ny < rows:
+                    cells.append(ny * cols + nx)
+            neighbours.append(tuple(cells))
+        self.neighbours = tuple(neighbours)
+        self.neighbour_coords = tuple(tuple(self.coords[n] for n in cells) for cells in self.neighbours)
+        self.neighbour_masks = tuple(self.mask(cells) for cells in self.neighbours)
+
+        self.top = frozenset(range(cols))
+        self.bottom = frozenset(range((rows - 1) * cols, self.cells))
+        self.left = frozenset(range(0, self.cells, cols))
+        self.right = frozenset(range(cols - 1, self.cells, cols))
+
+        self.full = (1 << self.cells) - 1
+        self.top_mask = self.mask(self.top)
+        self.bottom_mask = self.mask(self.bottom)
+        self.left_mask = self.mask(self.left)
+        self.right_mask = self.mask(self.right)
+        self.not_left = self.full & ~self.left_mask
+        self.not_right = self.full & ~self.right_mask
+
+        # Fester Seed pro Brettgröße, damit Hashes über Prozesse und Läufe hinweg gleich sind
+        rng = random.Random(rows * 1000 + cols)
+        self.zobrist = tuple(tuple(rng.getrandbits(64) for _ in range(self.cells)) for _ in range(2))
+        self.zobrist_side = rng.getrandbits(64)
+
+    @staticmethod
+    def mask(indices) -> int:
+        bits = 0
+        for i in indices:
+            bits |= 1 << i
+        return bits
+
+
+@lru_cache(maxsize=None)
+def get_topology(rows: int, cols: int) -> Topology:
+    """
+    Liefert die (pro Brettgröße nur einmal erzeugte) Topologie für ein rows x cols Brett.
+    """
+    return Topology(rows, cols)
+
+
+class EmptyCells:
+    """
+    Indexierbare Menge der freien Felder eines Bretts mit O(1)-Entfernen (Swap-Remove)
+    und O(1)-Wiederherstellen in umgekehrter Reihenfolge.
+
+    Verhält sich nach außen wie eine Sequenz von Koordinaten (x, y), sodass sie direkt als
+    Zugliste verwendet werden kann (len, Indexzugriff, Iteration, random.choice), ohne
+    dafür eine neue Liste anzulegen. Die Sicht ist live: sie ändert sich mit dem Brett.
+    """
+    __slots__ = ('cells', 'position', 'coords', 'index')
+
+    def __init__(self, topology: Topology, occupied: int = 0) -> None:
+        self.coords = topology.coords
+        self.index = topology.index
+        self.cells = [i for i in range(topology.cells) if not occupied >> i & 1]
+        self.position = [-1] * topology.cells
+        for slot, index in enumerate(self.cells):
+            self.position[index] = slot
+
+    def copy(self):
+        new_set = EmptyCells.__new__(EmptyCells)
+        new_set.coords = self.coords
+        new_set.index = self.index
+        new_set.cells = self.cells[:]
+        new_set.position = self.position[:]
+        return new_set
+
+    def remove(self, index: int) -> int:
+        """
+        Entfernt das Feld 'index' und liefert den Platz, an dem es stand (für restore).
+        """
+        cells = self.cells
+        position = self.position
+        slot = position[index]
+        last = cells.pop()
+        if last != index:
+            cells[slot] = last
+            position[last] = slot
+        position[index] = -1
+        return slot
+
+    def restore(self, index: int, slot: int) -> None:
+        """
+        Macht das letzte remove(index) rückgängig, die Reihenfolge ist danach wieder identisch.
+        """
+        cells = self.cells
+        position = self.position
+        if slot == len(cells):
+            cells.append(index)
+        else:
+            last = cells[slot]
+            position[last] = len(cells)
+            cells.append(last)
+            cells[slot] = index
+        position[index] = slot
+
+    def random_move(self, rng=random):
+        """
+        Zieht in O(1) ein zufälliges freies Feld als (x, y); None, wenn das Brett voll ist.
+        """
+        cells = self.cells
+        return self.coords[cells[rng.randrange(len(cells))]] if cells else None
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __getitem__(self, slot):
+        if isinstance(slot, slice):
+            return [self.coords[index] for index in self.cells[slot]]
+        return self.coords[self.cells[slot]]
+
+    def __iter__(self):
+        coords = self.coords
+        for index in self.cells:
+            yield coords[index]
+
+    def __contains__(self, move):
+        index = self.index.get(move)
+        return index is not None and self.position[index] >= 0
@@ -2,7 +2,8 @@
 from Game import Game
 from agents.random_agent import make_random_move
 from agents.minimax_agent import MinimaxAgent
-from agents.mcts_agent import MCTSAgent
+from agents.mcts_agent import MCTSAgent, RANDOM_FILL
+from agents.eval_cache import EvalCache
 import datetime
 import time
 import concurrent.futures
@@ -36,13 +37,8 @@ def play_match(agent_red, agent_blue, time_limit=300):
         
         if move:
             x, y = move
-            # Aktualisiere das Spielfeld: Matrix und Grid
-            game.matrix[y][x] = game.current_player.upper()[0]
-            game.num_emptyTiles -= 1
-            
-            # Setze auch das Tile im Grid, damit Gewinnabfrage funktioniert.
-            tile = game.grid.tiles[(x, y)]
-            tile.colour = game.playerColours[game.current_player]
+            # Aktualisiere das Spielfeld: Matrix, Grid (für die Gewinnabfrage) und freie Felder
+            game.placeStone(x, y)
             
             # Simuliere den Zeitverbrauch: 1 Sekunde pro Zug
             game.timers[game.current_player] -= 1  
@@ -100,16 +96,32 @@ def write_bayesian_result(agent1_name, agent2_name, winner, round_number=None, k
     with open("bayesian_results.pgn", "a") as f:
         f.write(record)
 
-# Agenten als top-level Funktionen, damit sie in Worker-Prozessen funktionieren
-def agent_random(game):
-    return make_random_move(game)
+# Bewertungs-Cache pro Worker-Prozess, geteilt von allen Agenten und Zügen in diesem Prozess
+EVAL_CACHE = EvalCache()
+
+# Agenten-Fabriken als top-level Funktionen, damit sie in Worker-Prozessen funktionieren.
+# Jede liefert eine Zugfunktion für eine ganze Partie (eine Instanz pro Partie und Farbe).
+def agent_random():
+    return make_random_move
 
-def agent_minimax_depth2(game):
+def agent_minimax_depth2():
     # Beachte: wie im Originalcode wird hier depth=1 verwendet.
-    return MinimaxAgent(depth=2).make_move(game)
+    return MinimaxAgent(depth=2, eval_cache=EVAL_CACHE).make_move
+
+def agent_minimax_id():
+    # Iterative Vertiefung mit 5 s pro Zug, begrenzt durch die Restzeit in game.timers
+    return MinimaxAgent(time_limit=5, use_clock=True, eval_cache=EVAL_CACHE).make_move
+
+def agent_mcts():
+    return MCTSAgent(simulations=10, eval_cache=EVAL_CACHE).make_move
+
+def agent_mcts_fill():
+    # Zufällige Playouts bis zum vollen Brett
+    return MCTSAgent(simulations=2000, playout=RANDOM_FILL).make_move
 
-def agent_mcts(game):
-    return MCTSAgent(simulations=10).make_move(game)
+def agent_mcts_rave():
+    # Wie agent_mcts_fill, aber mit RAVE und einem Viertel der Simulationen
+    return MCTSAgent(simulations=500, playout=RANDOM_FILL, rave_k=300).make_move
 
 # Diese Funktion wird in den Worker-Prozessen aufgerufen.
 def run_match(task):
@@ -118,10 +130,13 @@ def run_match(task):
     agent_dict = {
         'Random': agent_random,
         'Minimax_depth2': agent_minimax_depth2,
-        'MCTS': agent_mcts
+        'Minimax_ID': agent_minimax_id,
+        'MCTS': agent_mcts,
+        'MCTS_fill': agent_mcts_fill,
+        'MCTS_RAVE': agent_mcts_rave,
     }
-    agent_red = agent_dict[agent1]
-    agent_blue = agent_dict[agent2]
+    agent_red = agent_dict[agent1]()
+    agent_blue = agent_dict[agent2]()
     winner, kpi = play_match(agent_red, agent_blue, time_limit=time_limit)
     return (agent1, agent2, winner, kpi)
 
@@ -134,6 +149,8 @@ def main():
         ('Minimax_depth2', 'MCTS'),
         ('Random', 'MCTS'),
         ('Random', 'Minimax_depth2'),
+        ('Minimax_ID', 'MCTS'),
+        ('MCTS_fill', 'MCTS_RAVE'),
     ]
     
     time_limit = 3000000000  # Sekunden pro Spieler